@@ -1,9 +1,10 @@
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routes import forecast, ai, research, presets
+from routes import forecast, ai, research, presets, data, listening, calibration
 from models.schemas import StatusResponse, VersionResponse
 from database import init_db, engine
+from services import admission, executors, singleflight
 
 # Centralized app version
 APP_VERSION = os.getenv("APP_VERSION", "1.0.1")
@@ -46,6 +47,9 @@ app.include_router(forecast.router)
 app.include_router(ai.router)
 app.include_router(research.router)
 app.include_router(presets.router)
+app.include_router(data.router)
+app.include_router(listening.router)
+app.include_router(calibration.router)
 
 # Initialize database tables on startup
 @app.on_event("startup")
@@ -54,6 +58,11 @@ async def startup_event():
         init_db()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    executors.shutdown(wait=False)
+
+
 @app.get("/", response_model=StatusResponse)
 async def root():
     """Health check endpoint"""
@@ -66,6 +75,24 @@ async def health():
     return StatusResponse(status="ok", version=APP_VERSION)
 
 
+@app.get("/metrics/executors")
+async def executor_metrics():
+    """Queue depth and utilization of the bulkhead executor pools"""
+    return executors.pool_stats()
+
+
+@app.get("/metrics/admission")
+async def admission_metrics():
+    """Concurrency, queueing and shed/rate-limit counters per endpoint class"""
+    return admission.admission_stats()
+
+
+@app.get("/metrics/coalescing")
+async def coalescing_metrics():
+    """Executions and coalesced duplicates per single-flight group"""
+    return singleflight.coalescing_stats()
+
+
 @app.get("/version", response_model=VersionResponse)
 async def version():
     """Return version info and commit SHA for deploy verification"""
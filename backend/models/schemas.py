@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
+from datetime import date
 
 
 class ForecastRequest(BaseModel):
@@ -69,6 +70,27 @@ class ForecastRequest(BaseModel):
         default=None,
         description="Optional override path to the Excel workbook (defaults to public/Care Bears Audience Growth KPis .xlsx)."
     )
+    calibration_id: Optional[str] = Field(
+        default=None,
+        description="Id of a compiled calibration artifact (python -m services.calibration_artifacts compile). Takes precedence over use_sheet_calibration."
+    )
+    calibration_profile: Optional[str] = Field(
+        default=None,
+        description="Name of a registered calibration profile (GET /api/calibration/profiles). Used when calibration_id is not set."
+    )
+    # Engagement baseline selection (defaults to the mean of the last 8 weeks of data)
+    baseline_window: Optional[int] = Field(
+        default=None, ge=1, le=104,
+        description="Weeks of engagement index used for the baseline (window for mean, span for EWMA). Defaults to 8."
+    )
+    baseline_as_of: Optional[date] = Field(
+        default=None,
+        description="Compute the engagement baseline from data up to and including this date (backtests/what-ifs)."
+    )
+    baseline_method: Optional[Literal['mean', 'ewma']] = Field(
+        default=None,
+        description="Engagement baseline method: 'mean' (rolling window mean, default) or 'ewma'."
+    )
     # AI context fields (passed from frontend for better recommendations)
     projected_total: Optional[float] = Field(
         default=None,
@@ -101,6 +123,35 @@ class ForecastResponse(BaseModel):
     added_breakdown: Optional[List[dict]] = None
 
 
+class ForecastBatchRequest(BaseModel):
+    """Several forecast scenarios (possibly with different calibration profiles) run in one vectorized pass"""
+    scenarios: List[ForecastRequest] = Field(min_length=1, max_length=500)
+
+
+class ForecastBatchResponse(BaseModel):
+    """Forecast results in scenario order"""
+    results: List[ForecastResponse]
+
+
+class CalibrationProfileRequest(BaseModel):
+    """Definition of a named calibration profile"""
+    calibration_id: Optional[str] = Field(default=None, description="Compiled calibration artifact id")
+    sheet_path: Optional[str] = Field(default=None, description="Workbook path on the server")
+    description: Optional[str] = None
+
+
+class FollowerReading(BaseModel):
+    """A single follower count observation"""
+    platform: str = Field(min_length=1, description="Platform name, e.g. Instagram")
+    timestamp: str = Field(description="ISO date or datetime of the reading")
+    value: float = Field(ge=0, description="Follower count")
+
+
+class FollowerReadingsRequest(BaseModel):
+    """New follower readings to append to the history store"""
+    readings: List[FollowerReading] = Field(min_length=1, max_length=10000)
+
+
 # Insight API models
 class InsightRequest(BaseModel):
     goal: float
@@ -2,95 +2,199 @@
 AI Insights API Routes
 """
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from models.schemas import (
     ForecastRequest, AIInsightsResponse, AIScenario, InsightRequest, InsightResponse,
     ParamTuneRequest, ParamTuneResponse, CritiqueRequest, CritiqueResponse
 )
 from services.ai_service import analyze_strategy, generate_gap_insight, tune_parameters, critique_strategy
 from services.forecast_service import load_historical_data, forecast_growth, get_engagement_index_cached, PRESETS
+from services.admission import admit
+from services.calibration import DEFAULT_WORKBOOK
+from services.executors import run_data, run_engine, run_llm
+from services.follower_store import get_follower_store
+from services.singleflight import request_key, single_flight
 from pathlib import Path
 
 router = APIRouter(prefix="/api", tags=["AI Insights"])
 
-@router.post("/ai-insights", response_model=AIInsightsResponse)
+_flights = {name: single_flight(name) for name in ("ai-insights", "ai-insight", "ai-tune", "ai-critique")}
+
+
+def _follower_growth(data_dir: Path):
+    """Observed per-platform growth stats for prompt context (None if history is unavailable)."""
+    try:
+        return get_follower_store(data_dir, DEFAULT_WORKBOOK).growth_stats()["platforms"] or None
+    except Exception:
+        return None
+
+async def _ai_insights(request: ForecastRequest) -> AIInsightsResponse:
+    """Strategy analysis and scenario alternatives for one request."""
+    # Get historical data for context
+    data_dir = Path(__file__).parent.parent / "data"
+    historical_data = await run_data(load_historical_data, data_dir)
+    follower_growth = await run_data(_follower_growth, data_dir)
+
+    # Build budget info from request
+    paid_weekly = (request.paid_budget_per_week_total or 0) + (request.creator_budget_per_week_total or 0)
+    growth_weekly = request.acquisition_budget_per_week_total or 0
+    cpf = request.cpf_paid or {"min": 0.10, "mid": 0.15, "max": 0.20}
+
+    budget_info = {
+        "total_annual_budget": (paid_weekly + growth_weekly) * 52,
+        "paid_media_weekly": request.paid_budget_per_week_total or 0,
+        "growth_strategy_weekly": (request.creator_budget_per_week_total or 0) + (request.acquisition_budget_per_week_total or 0),
+        "cpf_range": cpf,
+        "projected_total": request.projected_total,
+        "goal_followers": request.goal_followers,
+    }
+
+    # Get AI analysis (blocking OpenAI call)
+    ai_result = await run_llm(
+        analyze_strategy,
+        current_followers=request.current_followers,
+        posts_per_week=request.posts_per_week_total,
+        platform_allocation=request.platform_allocation,
+        months=request.months,
+        preset=request.preset,
+        historical_data=historical_data,
+        budget_info=budget_info,
+        follower_growth=follower_growth
+    )
+
+    # Convert to response schema
+    scenarios = [
+        AIScenario(
+            name=s["name"],
+            posts_per_week=s["posts_per_week"],
+            platform_allocation=s["platform_allocation"],
+            reasoning=s["reasoning"],
+            risk_level=s["risk_level"],
+            expected_outcome=s["expected_outcome"]
+        )
+        for s in ai_result["scenarios"]
+    ]
+
+    return AIInsightsResponse(
+        analysis=ai_result["analysis"],
+        scenarios=scenarios,
+        key_insights=ai_result["key_insights"]
+    )
+
+
+@router.post("/ai-insights", response_model=AIInsightsResponse, dependencies=[Depends(admit("ai"))])
 async def get_ai_insights(request: ForecastRequest):
     """
     Get AI-powered strategy recommendations
     Returns 3 scenario alternatives: Optimized, Aggressive, Conservative
     """
     try:
-        # Get historical data for context
-        data_dir = Path(__file__).parent.parent / "data"
-        historical_data = load_historical_data(data_dir)
-
-        # Build budget info from request
-        paid_weekly = (request.paid_budget_per_week_total or 0) + (request.creator_budget_per_week_total or 0)
-        growth_weekly = request.acquisition_budget_per_week_total or 0
-        cpf = request.cpf_paid or {"min": 0.10, "mid": 0.15, "max": 0.20}
-
-        budget_info = {
-            "total_annual_budget": (paid_weekly + growth_weekly) * 52,
-            "paid_media_weekly": request.paid_budget_per_week_total or 0,
-            "growth_strategy_weekly": (request.creator_budget_per_week_total or 0) + (request.acquisition_budget_per_week_total or 0),
-            "cpf_range": cpf,
-            "projected_total": request.projected_total,
-            "goal_followers": request.goal_followers,
-        }
-
-        # Get AI analysis
-        ai_result = analyze_strategy(
-            current_followers=request.current_followers,
-            posts_per_week=request.posts_per_week_total,
-            platform_allocation=request.platform_allocation,
-            months=request.months,
-            preset=request.preset,
-            historical_data=historical_data,
-            budget_info=budget_info
-        )
-
-        # Convert to response schema
-        scenarios = [
-            AIScenario(
-                name=s["name"],
-                posts_per_week=s["posts_per_week"],
-                platform_allocation=s["platform_allocation"],
-                reasoning=s["reasoning"],
-                risk_level=s["risk_level"],
-                expected_outcome=s["expected_outcome"]
-            )
-            for s in ai_result["scenarios"]
-        ]
-
-        return AIInsightsResponse(
-            analysis=ai_result["analysis"],
-            scenarios=scenarios,
-            key_insights=ai_result["key_insights"]
-        )
-
+        # Identical concurrent requests share one OpenAI call
+        return await _flights["ai-insights"].do(request_key(request.model_dump(mode="json")), lambda: _ai_insights(request))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI analysis failed: {str(e)}")
 
 
-@router.post("/ai/insight", response_model=InsightResponse)
+@router.post("/ai/insight", response_model=InsightResponse, dependencies=[Depends(admit("ai"))])
 async def ai_gap_insight(req: InsightRequest):
     try:
-        text = generate_gap_insight(req)
+        text = await _flights["ai-insight"].do(request_key(req.model_dump(mode="json")), lambda: run_llm(generate_gap_insight, req))
         return InsightResponse(insight=text)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Insight generation failed: {e}")
 
 
-@router.post("/ai/tune-parameters", response_model=ParamTuneResponse)
+@router.post("/ai/tune-parameters", response_model=ParamTuneResponse, dependencies=[Depends(admit("ai"))])
 async def ai_tune_parameters(req: ParamTuneRequest):
     try:
-        resp = tune_parameters(req)
+        resp = await _flights["ai-tune"].do(request_key(req.model_dump(mode="json")), lambda: run_llm(tune_parameters, req))
         return ParamTuneResponse(**resp)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Parameter tuning failed: {e}")
 
 
-@router.post("/ai/critique", response_model=CritiqueResponse)
+async def _critique(req: CritiqueRequest) -> dict:
+    """Critique result with the estimated impact of its recommended changes."""
+    # Get historical data for context
+    data_dir = Path(__file__).parent.parent / "data"
+    historical_data = await run_data(load_historical_data, data_dir)
+    follower_growth = await run_data(_follower_growth, data_dir)
+
+    # Build budget info
+    budget_info = {
+        "paid_media_weekly": req.paid_budget_week or 0,
+        "creator_weekly": req.creator_budget_week or 0,
+        "acquisition_weekly": req.acquisition_budget_week or 0,
+        "cpf_range": req.cpf_range or {"min": 0.10, "mid": 0.15, "max": 0.20}
+    }
+
+    # Get critique (blocking OpenAI call)
+    result = await run_llm(
+        critique_strategy,
+        current_followers=req.current_followers,
+        posts_per_week=req.posts_per_week,
+        platform_allocation=req.platform_allocation,
+        content_mix=req.content_mix,
+        months=req.months,
+        preset=req.preset,
+        audience_mix=req.audience_mix,
+        projected_total=req.projected_total,
+        goal=req.goal,
+        historical_data=historical_data,
+        budget_info=budget_info,
+        previous_suggestions=req.previous_suggestions,
+        follower_growth=follower_growth
+    )
+
+    # Post-process: estimate impact of recommended changes (if provided)
+    try:
+        if isinstance(result, dict) and result.get('recommended_changes'):
+            rec = result['recommended_changes'] or {}
+            # Build baseline and changed forecasts using the same engine as /forecast
+            data_dir = Path(__file__).parent.parent / "data"
+            eng_index = await run_data(get_engagement_index_cached, data_dir)
+            preset_cfg = PRESETS.get(req.preset, {"campaign_lift": 0.0, "sensitivity": 0.5, "acq_scalar": 1.0})
+
+            async def run_projection(posts_per_week: float, platform_allocation: dict, content_mix: dict) -> float:
+                df = await run_engine(
+                    forecast_growth,
+                    current_followers=req.current_followers,
+                    posts_per_week_total=posts_per_week,
+                    platform_allocation=platform_allocation,
+                    content_mix_by_platform=content_mix,
+                    engagement_index_series=eng_index,
+                    months=req.months,
+                    campaign_lift=preset_cfg["campaign_lift"],
+                    sensitivity=preset_cfg["sensitivity"],
+                    acq_scalar=preset_cfg["acq_scalar"],
+                    paid_impressions_per_week_total=0.0,
+                    paid_allocation=None,
+                    paid_funnel=None,
+                    paid_budget_per_week_total=(req.paid_budget_week or 0.0),
+                    creator_budget_per_week_total=(req.creator_budget_week or 0.0),
+                    acquisition_budget_per_week_total=(req.acquisition_budget_week or 0.0),
+                )
+                return float(df.iloc[-1]["Total"]) if len(df) else 0.0
+
+            baseline_total = await run_projection(req.posts_per_week, req.platform_allocation, req.content_mix)
+            changed_ppw = float(rec.get('posts_per_week') or req.posts_per_week)
+            changed_alloc = rec.get('platform_allocation') or req.platform_allocation
+            changed_mix = rec.get('content_mix_by_platform') or req.content_mix
+            changed_total = await run_projection(changed_ppw, changed_alloc, changed_mix)
+            est = 0.0
+            if baseline_total > 0:
+                est = (changed_total - baseline_total) / baseline_total * 100.0
+            result['estimated_impact'] = est
+            if abs(est) < 1.0:
+                result['convergence_note'] = "Further tweaks yield <1% improvement; strategy appears converged. Focus on execution and cadence."
+    except Exception:
+        # Non-critical; ignore impact calculation failures
+        pass
+
+    return result
+
+
+@router.post("/ai/critique", response_model=CritiqueResponse, dependencies=[Depends(admit("ai"))])
 async def ai_critique_strategy(req: CritiqueRequest):
     """
     Provide a balanced AI critique of the user's current strategy.
@@ -98,78 +202,8 @@ async def ai_critique_strategy(req: CritiqueRequest):
     and goal feasibility against GWI research and best practices.
     """
     try:
-        # Get historical data for context
-        data_dir = Path(__file__).parent.parent / "data"
-        historical_data = load_historical_data(data_dir)
-
-        # Build budget info
-        budget_info = {
-            "paid_media_weekly": req.paid_budget_week or 0,
-            "creator_weekly": req.creator_budget_week or 0,
-            "acquisition_weekly": req.acquisition_budget_week or 0,
-            "cpf_range": req.cpf_range or {"min": 0.10, "mid": 0.15, "max": 0.20}
-        }
-
-        # Get critique
-        result = critique_strategy(
-            current_followers=req.current_followers,
-            posts_per_week=req.posts_per_week,
-            platform_allocation=req.platform_allocation,
-            content_mix=req.content_mix,
-            months=req.months,
-            preset=req.preset,
-            audience_mix=req.audience_mix,
-            projected_total=req.projected_total,
-            goal=req.goal,
-            historical_data=historical_data,
-            budget_info=budget_info,
-            previous_suggestions=req.previous_suggestions
-        )
-
-        # Post-process: estimate impact of recommended changes (if provided)
-        try:
-            if isinstance(result, dict) and result.get('recommended_changes'):
-                rec = result['recommended_changes'] or {}
-                # Build baseline and changed forecasts using the same engine as /forecast
-                data_dir = Path(__file__).parent.parent / "data"
-                eng_index = get_engagement_index_cached(data_dir)
-                preset_cfg = PRESETS.get(req.preset, {"campaign_lift": 0.0, "sensitivity": 0.5, "acq_scalar": 1.0})
-
-                def run_projection(posts_per_week: float, platform_allocation: dict, content_mix: dict) -> float:
-                    df = forecast_growth(
-                        current_followers=req.current_followers,
-                        posts_per_week_total=posts_per_week,
-                        platform_allocation=platform_allocation,
-                        content_mix_by_platform=content_mix,
-                        engagement_index_series=eng_index,
-                        months=req.months,
-                        campaign_lift=preset_cfg["campaign_lift"],
-                        sensitivity=preset_cfg["sensitivity"],
-                        acq_scalar=preset_cfg["acq_scalar"],
-                        paid_impressions_per_week_total=0.0,
-                        paid_allocation=None,
-                        paid_funnel=None,
-                        paid_budget_per_week_total=(req.paid_budget_week or 0.0),
-                        creator_budget_per_week_total=(req.creator_budget_week or 0.0),
-                        acquisition_budget_per_week_total=(req.acquisition_budget_week or 0.0),
-                    )
-                    return float(df.iloc[-1]["Total"]) if len(df) else 0.0
-
-                baseline_total = run_projection(req.posts_per_week, req.platform_allocation, req.content_mix)
-                changed_ppw = float(rec.get('posts_per_week') or req.posts_per_week)
-                changed_alloc = rec.get('platform_allocation') or req.platform_allocation
-                changed_mix = rec.get('content_mix_by_platform') or req.content_mix
-                changed_total = run_projection(changed_ppw, changed_alloc, changed_mix)
-                est = 0.0
-                if baseline_total > 0:
-                    est = (changed_total - baseline_total) / baseline_total * 100.0
-                result['estimated_impact'] = est
-                if abs(est) < 1.0:
-                    result['convergence_note'] = "Further tweaks yield <1% improvement; strategy appears converged. Focus on execution and cadence."
-        except Exception:
-            # Non-critical; ignore impact calculation failures
-            pass
-
+        # Identical concurrent critiques share one OpenAI call and its impact projections
+        result = await _flights["ai-critique"].do(request_key(req.model_dump(mode="json")), lambda: _critique(req))
         return CritiqueResponse(**result)
 
     except Exception as e:
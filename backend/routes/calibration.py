@@ -0,0 +1,91 @@
+"""
+Calibration API routes (background workbook calibration jobs, named profiles)
+"""
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+
+from models.schemas import CalibrationProfileRequest
+from routes.data import require_upload_token
+from services.calibration import resolve_workbook_path
+from services.calibration_artifacts import artifact_exists, validate_id
+from services.calibration_jobs import get_job, list_jobs, submit_upload, submit_workbook
+from services.calibration_profiles import registry
+from services.executors import run_data
+
+router = APIRouter(prefix="/api/calibration", tags=["calibration"])
+
+
+def _spool_upload(src, suffix: str) -> Path:
+    with tempfile.NamedTemporaryFile(prefix="calibration-", suffix=suffix, delete=False) as out:
+        shutil.copyfileobj(src, out, 1 << 20)
+        return Path(out.name)
+
+
+@router.post("/jobs", status_code=202, dependencies=[Depends(require_upload_token)])
+async def create_calibration_job(
+    sheet_path: Optional[str] = Form(default=None, description="Workbook in the bundled workbook directory (defaults to the KPI workbook)"),
+    calibration_id: Optional[str] = Form(default=None, description="New artifact id to publish the result under"),
+    file: Optional[UploadFile] = File(default=None, description="Workbook upload (.xlsx)"),
+):
+    """Parse a calibration workbook on a background worker.
+    Returns a job id immediately; poll GET /api/calibration/jobs/{id} for status, timings and
+    the resulting calibration_id to pass to POST /api/forecast. Requires the upload token;
+    an existing calibration_id is never replaced (409).
+    """
+    try:
+        if calibration_id:
+            validate_id(calibration_id)
+            if artifact_exists(calibration_id):
+                raise HTTPException(status_code=409, detail=f"Calibration id '{calibration_id}' already exists")
+        if file is not None:
+            name = file.filename or "upload.xlsx"
+            if not name.lower().endswith((".xlsx", ".xlsm")):
+                raise ValueError("Calibration upload must be an .xlsx workbook")
+            tmp = await run_data(_spool_upload, file.file, Path(name).suffix)
+            return submit_upload(tmp, name, calibration_id)
+        return submit_workbook(resolve_workbook_path(sheet_path), calibration_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        if file is not None:
+            await file.close()
+
+
+@router.get("/jobs")
+async def get_calibration_jobs(limit: int = Query(default=20, ge=1, le=200)):
+    """Most recent calibration jobs, newest first."""
+    return {"jobs": list_jobs(limit)}
+
+
+@router.get("/jobs/{job_id}")
+async def get_calibration_job(job_id: str):
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Calibration job not found")
+    return job
+
+
+@router.get("/profiles")
+async def get_calibration_profiles():
+    """Registered calibration profiles and whether each is resident in memory."""
+    return {"profiles": await run_data(registry.list), "capacity": registry.capacity}
+
+
+@router.put("/profiles/{name}", dependencies=[Depends(require_upload_token)])
+async def put_calibration_profile(name: str, body: CalibrationProfileRequest):
+    """Create or replace a named profile pointing at a compiled artifact or a bundled workbook (requires the upload token)."""
+    try:
+        return await run_data(registry.define, name, body.calibration_id, body.sheet_path, body.description)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.delete("/profiles/{name}", dependencies=[Depends(require_upload_token)])
+async def delete_calibration_profile(name: str):
+    if not await run_data(registry.delete, name):
+        raise HTTPException(status_code=404, detail="Calibration profile not found")
+    return {"deleted": name}
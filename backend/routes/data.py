@@ -0,0 +1,48 @@
+"""
+Data management API routes (social-listening export uploads)
+"""
+import hmac
+import os
+from pathlib import Path
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, UploadFile
+
+from services.data_ingest import DATASETS, ingest_upload
+from services.executors import run_data
+
+router = APIRouter(prefix="/api/data", tags=["data"])
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def require_upload_token(authorization: Optional[str] = Header(default=None)) -> None:
+    """Uploads replace the live datasets, so they need `Authorization: Bearer <DATA_UPLOAD_TOKEN>`.
+    With no token configured, uploads are disabled.
+    """
+    token = os.getenv("DATA_UPLOAD_TOKEN", "").strip()
+    if not token:
+        raise HTTPException(status_code=403, detail="Uploads are disabled (DATA_UPLOAD_TOKEN is not set)")
+    scheme, _, supplied = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(supplied.strip().encode(), token.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing upload token", headers={"WWW-Authenticate": "Bearer"})
+
+
+@router.post("/upload", dependencies=[Depends(require_upload_token)])
+async def upload_export(
+    dataset: str = Query(description="Target dataset: mentions, sentiment or tags"),
+    file: UploadFile = File(description="YouScan CSV or XLSX export"),
+):
+    """Stream a YouScan export into a new versioned snapshot and publish it to the historical cache.
+    The multipart body is spooled to a temp file, so large exports are never held in memory.
+    """
+    if dataset not in DATASETS:
+        raise HTTPException(status_code=400, detail=f"Unknown dataset '{dataset}'. Expected one of {sorted(DATASETS)}")
+    try:
+        result = await run_data(ingest_upload, file.file, file.filename or "", dataset, DATA_DIR)
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Upload failed: {e}")
+    finally:
+        await file.close()
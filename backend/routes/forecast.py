@@ -1,19 +1,27 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+import json
+from datetime import date
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+import numpy as np
 import pandas as pd
 
 from models.schemas import (
     ForecastRequest,
     ForecastResponse,
-    MonthlyForecast,
+    ForecastBatchRequest,
+    ForecastBatchResponse,
+    FollowerReadingsRequest,
     HistoricalDataResponse
 )
 from services.forecast_service import (
     forecast_growth,
+    forecast_growth_batch,
     load_historical_data,
     compute_engagement_index,
     get_historical_data_cached,
     get_engagement_index_cached,
+    get_engagement_store_cached,
     PRESETS,
     PLATFORMS,
     CONTENT_MULT,
@@ -25,25 +33,69 @@ from services.forecast_service import (
     PAID_FUNNEL_DEFAULT,
     CPF_DEFAULT,
 )
-from services.calibration import load_calibration_from_xlsx, load_follower_history_from_xlsx
+from services.calibration import DEFAULT_WORKBOOK, resolve_workbook_path
+from services.admission import admit
+from services.executors import run_data, run_engine
+from services.fast_json import FastJSONResponse
+from services.singleflight import request_key, single_flight
+from services.calibration_artifacts import load_artifact
+from services.calibration_jobs import ensure_calibration
+from services.calibration_profiles import registry as profile_registry
+from services.follower_store import get_follower_store
+from services.followers_service import encode_json, get_followers_history
+from services.growth_stats import DEFAULT_WINDOW
+from services.cadence import get_cadence_analysis
+from services.platform_metrics import DEFAULT_ROLLING_WINDOW, METRICS_FILE, get_platform_metrics as load_platform_metrics
+from routes.data import require_upload_token
 
 router = APIRouter(prefix="/api", tags=["forecast"])
 
 # Load data once at startup
 DATA_DIR = Path(__file__).parent.parent / "data"
 
+_HISTORICAL = single_flight("historical")
+_FORECASTS = single_flight("forecast")
+
+
+def _follower_source(sheet_path: str | None) -> Path:
+    """Workbook behind the follower history; it keys the store, so it must be a bundled or data-dir file."""
+    return resolve_workbook_path(sheet_path, extra_dirs=(DATA_DIR,))
+
 
 @router.get("/historical", response_model=HistoricalDataResponse)
 async def get_historical_data():
     """Get historical mentions, sentiment, and tags data"""
     try:
-        # Use cached loader for throughput
-        data = get_historical_data_cached(DATA_DIR)
+        # Use cached loader for throughput; concurrent reloads share one load
+        data = await _HISTORICAL.do(request_key(str(DATA_DIR)), lambda: run_data(get_historical_data_cached, DATA_DIR))
         return HistoricalDataResponse(**data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/historical/engagement")
+async def get_engagement_stats(
+    window: int = Query(default=8, ge=1, le=520, description="Weeks per window (and EWMA span)"),
+    as_of: List[date] = Query(default=[], description="Cutoff dates (repeatable); defaults to all data"),
+):
+    """Engagement baseline statistics: window mean, trend delta vs the preceding window and EWMA.
+    With several `as_of` cutoffs (backtests) only the window means are returned, one per cutoff.
+    """
+    try:
+        store = await run_data(get_engagement_store_cached, DATA_DIR)
+        if len(as_of) > 1:
+            means = await run_data(store.window_means, window, as_of)
+            return {
+                "window": window,
+                "as_of": [d.isoformat() for d in as_of],
+                "mean": [None if np.isnan(v) else float(v) for v in means],
+            }
+        cutoff = as_of[0] if as_of else None
+        return {"as_of": cutoff.isoformat() if cutoff else None, **store.summary(window, cutoff)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/assumptions", response_model=HistoricalDataResponse, include_in_schema=False)
 async def assumptions_hidden():
     # kept to avoid breaking schema generation; real endpoint below
@@ -73,80 +125,88 @@ async def get_assumptions_plain():
 
 
 @router.get("/followers-history")
-async def followers_history(sheet_path: str | None = None):
+async def followers_history(sheet_path: str | None = None, if_none_match: str | None = Header(default=None)):
     """Return historical follower series parsed from the workbook or CSV.
-    Prioritizes the CSV file with 2025 data if available.
-    Extrapolates Oct-Dec 2025 if missing.
+    Prioritizes the CSV file with 2025 data if available and extrapolates the
+    remaining months of its final year. Served from a per-file-version cache with an ETag.
     """
     try:
-        # First try CSV file with 2025 historical data
-        csv_path = DATA_DIR / "followers_history_2025.csv"
-        if csv_path.exists():
-            df = pd.read_csv(csv_path)
-            data_rows = []
-            labels = []
-            platforms = ['Instagram', 'TikTok', 'Facebook', 'YouTube']
-
-            for _, row in df.iterrows():
-                month_str = row['Month']
-                # Parse month and format as "Jan 2025"
-                try:
-                    dt = pd.to_datetime(month_str)
-                    label = dt.strftime('%b %Y')
-                except:
-                    label = str(month_str)
-                labels.append(label)
-                data_rows.append({
-                    "label": label,
-                    "Instagram": float(row.get('Instagram', 0)),
-                    "TikTok": float(row.get('TikTok', 0)),
-                    "Facebook": float(row.get('Facebook', 0)),
-                    "YouTube": float(row.get('YouTube', 0)),
-                    "Total": float(row.get('Total', 0)),
-                })
-
-            # Extrapolate Oct-Dec 2025 if we only have through Sep
-            if len(data_rows) >= 2 and labels[-1] == 'Sep 2025':
-                # Calculate average monthly growth rate from last 3 months
-                recent_growth = {}
-                for p in platforms:
-                    if len(data_rows) >= 3:
-                        g1 = data_rows[-1][p] - data_rows[-2][p]
-                        g2 = data_rows[-2][p] - data_rows[-3][p]
-                        recent_growth[p] = (g1 + g2) / 2
-                    else:
-                        recent_growth[p] = data_rows[-1][p] - data_rows[-2][p]
-
-                # Project Oct, Nov, Dec 2025
-                last_row = data_rows[-1]
-                for i, month_label in enumerate(['Oct 2025', 'Nov 2025', 'Dec 2025'], 1):
-                    projected = {"label": month_label}
-                    total = 0.0
-                    for p in platforms:
-                        val = last_row[p] + (recent_growth[p] * i)
-                        projected[p] = float(val)
-                        projected[f'{p}_interpolated'] = True
-                        total += val
-                    projected['Total'] = float(total)
-                    projected['Total_interpolated'] = True
-                    labels.append(month_label)
-                    data_rows.append(projected)
-
-            return {"labels": labels, "data": data_rows}
-
-        # Fallback to Excel workbook
-        wb = Path(sheet_path) if sheet_path else (Path(__file__).resolve().parents[2] / 'public' / 'Care Bears Audience Growth KPis .xlsx')
-        if not wb.exists():
+        wb = _follower_source(sheet_path)
+        entry = await run_data(get_followers_history, DATA_DIR, wb)
+        if entry is None:
             return {"labels": [], "data": []}
-        payload = load_follower_history_from_xlsx(wb)
-        return payload
+        etag = f'"{entry["version"]}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry["body"], media_type="application/json", headers=headers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/followers-history/series")
+async def followers_history_series(
+    start: Optional[str] = Query(default=None, alias="from", description="Inclusive start date/time"),
+    end: Optional[str] = Query(default=None, alias="to", description="Inclusive end date/time (a bare date covers the day)"),
+    platforms: Optional[str] = Query(default=None, description="Comma-separated platforms (default: all)"),
+    resample: Optional[str] = Query(default=None, description="D, W, M, Q or Y: last reading per period"),
+    sheet_path: str | None = None,
+):
+    """Range query over the follower history store (base CSV/workbook plus appended readings)."""
+    try:
+        wb = _follower_source(sheet_path)
+        store = await run_data(get_follower_store, DATA_DIR, wb)
+        names = [p.strip() for p in platforms.split(",") if p.strip()] if platforms else None
+        payload = await run_data(store.query_payload, start, end, names, resample)
+        return Response(content=encode_json(payload), media_type="application/json")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/followers-history/stats")
+async def followers_history_stats(
+    start: Optional[str] = Query(default=None, alias="from", description="Inclusive start date"),
+    end: Optional[str] = Query(default=None, alias="to", description="Inclusive end date"),
+    platforms: Optional[str] = Query(default=None, description="Comma-separated platforms (default: all)"),
+    window: int = Query(default=DEFAULT_WINDOW, ge=2, le=36, description="Rolling window in months"),
+    sheet_path: str | None = None,
+):
+    """Per-platform MoM growth, CAGR, rolling volatility and trend over month-end readings."""
+    try:
+        wb = _follower_source(sheet_path)
+        store = await run_data(get_follower_store, DATA_DIR, wb)
+        names = [p.strip() for p in platforms.split(",") if p.strip()] if platforms else None
+        payload = await run_data(store.growth_stats, start, end, names, window)
+        return Response(content=encode_json(payload), media_type="application/json")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/followers-history/readings", status_code=201, dependencies=[Depends(require_upload_token)])
+async def append_follower_readings(request: FollowerReadingsRequest, sheet_path: str | None = None):
+    """Append new (daily or monthly) follower readings; each must follow the platform's latest reading.
+    Readings are kept per base source, so pass the same `sheet_path` as the series/stats queries.
+    Requires the upload token.
+    """
+    try:
+        wb = _follower_source(sheet_path)
+        store = await run_data(get_follower_store, DATA_DIR, wb)
+        appended = await run_data(store.append, [r.model_dump() for r in request.readings])
+        return {"appended": sum(appended.values()), "platforms": appended}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/assumptions-calibrated")
-async def get_assumptions_calibrated(use_sheet_calibration: bool = False, sheet_path: str | None = None):
-    """Return effective assumptions after optional sheet calibration, with sources."""
+async def get_assumptions_calibrated(
+    use_sheet_calibration: bool = False,
+    sheet_path: str | None = None,
+    calibration_id: str | None = None,
+    calibration_profile: str | None = None,
+):
+    """Return effective assumptions after optional sheet calibration (or a compiled artifact), with sources."""
     try:
         effective_bmr = BASE_MONTHLY_RATE.copy()
         effective_cap = PLATFORM_MONTHLY_CAP.copy()
@@ -156,23 +216,35 @@ async def get_assumptions_calibrated(use_sheet_calibration: bool = False, sheet_
         effective_cpf_creator = CPF_DEFAULT.copy()
         seasonality = 0.0
         wb_used = None
-
-        if use_sheet_calibration:
-            wb = Path(sheet_path) if sheet_path else (Path(__file__).resolve().parents[2] / 'public' / 'Care Bears Audience Growth KPis .xlsx')
+        calib = None
+
+        if calibration_id:
+            artifact = await run_data(load_artifact, calibration_id)
+            calib = artifact['overrides']
+            wb_used = artifact['source']['name']
+            use_sheet_calibration = True
+        elif calibration_profile:
+            calib = (await profile_registry.resolve(calibration_profile))['overrides']
+            wb_used = f"profile:{calibration_profile}"
+            use_sheet_calibration = True
+        elif use_sheet_calibration:
+            wb = Path(sheet_path) if sheet_path else DEFAULT_WORKBOOK
             if wb.exists():
                 wb_used = str(wb)
-                calib = load_calibration_from_xlsx(wb)
-                if calib.get('base_monthly_rate'):
-                    effective_bmr.update(calib['base_monthly_rate'])
-                if calib.get('platform_monthly_cap'):
-                    effective_cap.update(calib['platform_monthly_cap'])
-                if calib.get('per_post_gain_base'):
-                    effective_ppg.update(calib['per_post_gain_base'])
-                if calib.get('cpf_paid'):
-                    effective_cpf_paid = calib['cpf_paid']
-                if calib.get('cpf_creator'):
-                    effective_cpf_creator = calib['cpf_creator']
-                seasonality = float(calib.get('month_decay_per_month') or 0.0)
+                calib = (await ensure_calibration(wb))['overrides']
+
+        if calib:
+            if calib.get('base_monthly_rate'):
+                effective_bmr.update(calib['base_monthly_rate'])
+            if calib.get('platform_monthly_cap'):
+                effective_cap.update(calib['platform_monthly_cap'])
+            if calib.get('per_post_gain_base'):
+                effective_ppg.update(calib['per_post_gain_base'])
+            if calib.get('cpf_paid'):
+                effective_cpf_paid = calib['cpf_paid']
+            if calib.get('cpf_creator'):
+                effective_cpf_creator = calib['cpf_creator']
+            seasonality = float(calib.get('month_decay_per_month') or 0.0)
 
         assumptions = [
             {"label": "Baseline monthly rate (BMR)", "value": effective_bmr, "source": "sheet+default" if use_sheet_calibration else "default"},
@@ -193,101 +265,160 @@ async def get_assumptions_calibrated(use_sheet_calibration: bool = False, sheet_
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/forecast", response_model=ForecastResponse)
+async def _resolve_calibration(request: ForecastRequest) -> Dict[str, Any] | None:
+    """Calibration overrides for a request: artifact id, then named profile, then sheet calibration."""
+    if request.calibration_id:
+        # Precompiled artifact: no workbook parsing on the request path
+        return (await run_data(load_artifact, request.calibration_id))['overrides']
+    if request.calibration_profile:
+        return (await profile_registry.resolve(request.calibration_profile))['overrides']
+    if request.use_sheet_calibration:
+        wb_path = Path(request.sheet_path) if request.sheet_path else DEFAULT_WORKBOOK
+        if wb_path.exists():
+            # Parsed off the event loop; concurrent requests share one job
+            return (await ensure_calibration(wb_path))['overrides']
+    return None
+
+
+async def _forecast_kwargs(request: ForecastRequest, calib: Dict[str, Any] | None) -> Dict[str, Any]:
+    """forecast_growth keyword arguments for a request (without the engagement series)."""
+    # Get preset configuration
+    if request.preset not in PRESETS:
+        raise ValueError(f"Invalid preset: {request.preset}")
+
+    preset_cfg = PRESETS[request.preset]
+
+    # Optional: engagement baseline for a custom window / as-of date
+    baseline_engagement = None
+    if request.baseline_window or request.baseline_as_of or request.baseline_method:
+        store = await run_data(get_engagement_store_cached, DATA_DIR)
+        baseline_engagement = store.baseline(
+            window=request.baseline_window,
+            as_of=request.baseline_as_of,
+            method=request.baseline_method,
+        )
+
+    # Optional: sheet-driven calibration
+    base_monthly_rate = None
+    platform_monthly_cap = None
+    per_post_gain_base = None
+    paid_funnel = request.paid_funnel or None
+    cpf_paid = request.cpf_paid or None
+    cpf_creator = request.cpf_creator or None
+    cpf_acquisition = request.cpf_acquisition or None
+    month_decay_per_month = 0.0
+
+    if calib:
+        base_monthly_rate = calib.get('base_monthly_rate') or None
+        platform_monthly_cap = calib.get('platform_monthly_cap') or None
+        per_post_gain_base = calib.get('per_post_gain_base') or None
+        # Allow CPF overrides if not provided by request
+        cpf_paid = cpf_paid or calib.get('cpf_paid') or None
+        cpf_creator = cpf_creator or calib.get('cpf_creator') or None
+        # Seasonality taper
+        month_decay_per_month = float(calib.get('month_decay_per_month') or 0.0)
+
+    return dict(
+        current_followers=request.current_followers,
+        posts_per_week_total=request.posts_per_week_total,
+        platform_allocation=request.platform_allocation,
+        content_mix_by_platform=request.content_mix_by_platform,
+        months=request.months,
+        campaign_lift=preset_cfg["campaign_lift"],
+        sensitivity=preset_cfg["sensitivity"],
+        acq_scalar=preset_cfg["acq_scalar"],
+        paid_impressions_per_week_total=(request.paid_impressions_per_week_total or 0.0),
+        paid_allocation=(request.paid_allocation or None),
+        paid_funnel=(paid_funnel or None),
+        paid_budget_per_week_total=(request.paid_budget_per_week_total or 0.0),
+        creator_budget_per_week_total=(request.creator_budget_per_week_total or 0.0),
+        acquisition_budget_per_week_total=(request.acquisition_budget_per_week_total or 0.0),
+        cpf_paid=(cpf_paid or None),
+        cpf_creator=(cpf_creator or None),
+        cpf_acquisition=(cpf_acquisition or None),
+        base_monthly_rate=base_monthly_rate,
+        platform_monthly_cap=platform_monthly_cap,
+        per_post_gain_base=per_post_gain_base,
+        month_decay_per_month=month_decay_per_month,
+        baseline_engagement=baseline_engagement,
+    )
+
+
+def _forecast_payload(request: ForecastRequest, monthly_df: pd.DataFrame) -> Dict[str, Any]:
+    """ForecastResponse-shaped dict built straight from the engine's columns."""
+    n = len(monthly_df)
+
+    def col(name: str) -> List[float]:
+        if name not in monthly_df.columns:
+            return [0.0] * n
+        return monthly_df[name].to_numpy(dtype=float).tolist()
+
+    months = monthly_df["Month"].to_numpy(dtype=np.int64).tolist()
+    ig, tt, yt, fb = col("Instagram"), col("TikTok"), col("YouTube"), col("Facebook")
+    total, added = col("Total"), col("Added")
+    monthly_data = [
+        {"month": m, "Instagram": a, "TikTok": b, "YouTube": c, "Facebook": d, "total": t, "added": ad}
+        for m, a, b, c, d, t, ad in zip(months, ig, tt, yt, fb, total, added)
+    ]
+    added_breakdown = [
+        {"month": m, "organic_added": o, "paid_added": p, "total_added": ad}
+        for m, o, p, ad in zip(months, col("Added_Organic"), col("Added_Paid"), added)
+    ]
+
+    # Calculate goal metrics
+    total_current = sum(request.current_followers.values())
+    goal = total_current * 2
+    projected_total = total[-1]
+    progress_to_goal = (projected_total / goal * 100) if goal > 0 else 0
+
+    return {
+        "monthly_data": monthly_data,
+        "goal": float(goal),
+        "projected_total": projected_total,
+        "progress_to_goal": float(progress_to_goal),
+        "added_breakdown": added_breakdown,
+    }
+
+
+@router.post("/forecast", response_model=ForecastResponse, response_class=FastJSONResponse, dependencies=[Depends(admit("forecast"))])
 async def run_forecast(request: ForecastRequest):
     """Run growth forecast based on input parameters"""
     try:
-        # Get preset configuration
-        if request.preset not in PRESETS:
-            raise ValueError(f"Invalid preset: {request.preset}")
-
-        preset_cfg = PRESETS[request.preset]
-
         # Load engagement index from cached historical data
-        eng_index = get_engagement_index_cached(DATA_DIR)
-
-        # Optional: sheet-driven calibration
-        base_monthly_rate = None
-        platform_monthly_cap = None
-        per_post_gain_base = None
-        paid_funnel = request.paid_funnel or None
-        cpf_paid = request.cpf_paid or None
-        cpf_creator = request.cpf_creator or None
-        cpf_acquisition = request.cpf_acquisition or None
-        month_decay_per_month = 0.0
-
-        if request.use_sheet_calibration:
-            wb_path = Path(request.sheet_path) if request.sheet_path else (Path(__file__).resolve().parents[2] / 'public' / 'Care Bears Audience Growth KPis .xlsx')
-            if wb_path.exists():
-                calib = load_calibration_from_xlsx(wb_path)
-                base_monthly_rate = calib.get('base_monthly_rate') or None
-                platform_monthly_cap = calib.get('platform_monthly_cap') or None
-                per_post_gain_base = calib.get('per_post_gain_base') or None
-                # Allow CPF overrides if not provided by request
-                cpf_paid = cpf_paid or calib.get('cpf_paid') or None
-                cpf_creator = cpf_creator or calib.get('cpf_creator') or None
-                # Seasonality taper
-                month_decay_per_month = float(calib.get('month_decay_per_month') or 0.0)
-
-        # Run forecast
-        monthly_df = forecast_growth(
-            current_followers=request.current_followers,
-            posts_per_week_total=request.posts_per_week_total,
-            platform_allocation=request.platform_allocation,
-            content_mix_by_platform=request.content_mix_by_platform,
-            engagement_index_series=eng_index,
-            months=request.months,
-            campaign_lift=preset_cfg["campaign_lift"],
-            sensitivity=preset_cfg["sensitivity"],
-            acq_scalar=preset_cfg["acq_scalar"],
-            paid_impressions_per_week_total=(request.paid_impressions_per_week_total or 0.0),
-            paid_allocation=(request.paid_allocation or None),
-            paid_funnel=(paid_funnel or None),
-            paid_budget_per_week_total=(request.paid_budget_per_week_total or 0.0),
-            creator_budget_per_week_total=(request.creator_budget_per_week_total or 0.0),
-            acquisition_budget_per_week_total=(request.acquisition_budget_per_week_total or 0.0),
-            cpf_paid=(cpf_paid or None),
-            cpf_creator=(cpf_creator or None),
-            cpf_acquisition=(cpf_acquisition or None),
-            base_monthly_rate=base_monthly_rate,
-            platform_monthly_cap=platform_monthly_cap,
-            per_post_gain_base=per_post_gain_base,
-            month_decay_per_month=month_decay_per_month,
-        )
+        eng_index = await run_data(get_engagement_index_cached, DATA_DIR)
+        calib = await _resolve_calibration(request)
+
+        async def compute() -> Dict[str, Any]:
+            kwargs = await _forecast_kwargs(request, calib)
+            monthly_df = await run_engine(forecast_growth, engagement_index_series=eng_index, **kwargs)
+            return _forecast_payload(request, monthly_df)
+
+        # Identical concurrent requests (same inputs and calibration) share one engine run
+        key = request_key(request.model_dump(mode="json"), calib)
+        payload = await _FORECASTS.do(key, compute)
+        # Returned as a response so FastAPI does not re-validate it against ForecastResponse
+        return FastJSONResponse(payload)
+    except ValueError as e:
+        # Invalid preset or no engagement data for the requested baseline window
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Convert to response format
-        monthly_data = []
-        added_breakdown = []
-        for _, row in monthly_df.iterrows():
-            monthly_data.append(MonthlyForecast(
-                month=int(row["Month"]),
-                Instagram=float(row["Instagram"]),
-                TikTok=float(row["TikTok"]),
-                YouTube=float(row["YouTube"]),
-                Facebook=float(row["Facebook"]),
-                total=float(row["Total"]),
-                added=float(row["Added"])
-            ))
-            added_breakdown.append({
-                "month": int(row["Month"]),
-                "organic_added": float(row.get("Added_Organic", 0.0)),
-                "paid_added": float(row.get("Added_Paid", 0.0)),
-                "total_added": float(row.get("Added", 0.0)),
-            })
-
-        # Calculate goal metrics
-        total_current = sum(request.current_followers.values())
-        goal = total_current * 2
-        projected_total = float(monthly_df.iloc[-1]["Total"])
-        progress_to_goal = (projected_total / goal * 100) if goal > 0 else 0
-
-        return ForecastResponse(
-            monthly_data=monthly_data,
-            goal=goal,
-            projected_total=projected_total,
-            progress_to_goal=progress_to_goal,
-            added_breakdown=added_breakdown
-        )
+
+@router.post("/forecast/batch", response_model=ForecastBatchResponse, response_class=FastJSONResponse, dependencies=[Depends(admit("forecast"))])
+async def run_forecast_batch(request: ForecastBatchRequest):
+    """Run many forecast scenarios in one vectorized pass.
+    Scenarios may select different calibration profiles; their parameters are stacked per scenario.
+    """
+    try:
+        eng_index = await run_data(get_engagement_index_cached, DATA_DIR)
+        scenario_kwargs = [await _forecast_kwargs(sc, await _resolve_calibration(sc)) for sc in request.scenarios]
+        frames = await run_engine(forecast_growth_batch, scenario_kwargs, eng_index)
+        return FastJSONResponse({
+            "results": [_forecast_payload(sc, df) for sc, df in zip(request.scenarios, frames)]
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -295,15 +426,49 @@ async def run_forecast(request: ForecastRequest):
 @router.get("/platform-metrics")
 async def get_platform_metrics():
     """Get historical posts and engagement data by platform"""
-    import json
     try:
-        metrics_file = DATA_DIR / "platform_metrics.json"
-        if not metrics_file.exists():
-            raise HTTPException(status_code=404, detail="Platform metrics data not found")
-        with open(metrics_file, "r") as f:
-            data = json.load(f)
-        return data
+        return (await run_data(load_platform_metrics, DATA_DIR / METRICS_FILE)).raw
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Platform metrics data not found")
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail=f"Invalid JSON: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/platform-metrics/derived")
+async def get_platform_metrics_derived(
+    window: int = Query(default=DEFAULT_ROLLING_WINDOW, ge=1, le=12, description="Rolling-mean window in months"),
+    if_none_match: str | None = Header(default=None),
+):
+    """Views/engagements per post, rolling means and MoM deltas (nulls stay null), cached per file version."""
+    try:
+        metrics = await run_data(load_platform_metrics, DATA_DIR / METRICS_FILE)
+        etag = f'"{metrics.version}-{window}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        derived = await run_data(metrics.derived, window)
+        return Response(content=encode_json(derived), media_type="application/json", headers=headers)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Platform metrics data not found")
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=500, detail=f"Invalid JSON: {str(e)}")
+
+
+@router.get("/platform-metrics/cadence")
+async def get_platform_metrics_cadence(if_none_match: str | None = Header(default=None)):
+    """Historical weekly posting rates per platform classified against RECOMMENDED_FREQ bands,
+    with the engine's band factors and the reach they imply was lost."""
+    try:
+        metrics = await run_data(load_platform_metrics, DATA_DIR / METRICS_FILE)
+        etag = f'"{metrics.version}-cadence"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        analysis = await run_data(get_cadence_analysis, metrics)
+        return Response(content=encode_json(analysis), media_type="application/json", headers=headers)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Platform metrics data not found")
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=500, detail=f"Invalid JSON: {str(e)}")
@@ -0,0 +1,81 @@
+"""
+Social listening API routes (tag pillars, wordcloud and topic chart)
+"""
+import hashlib
+import json
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+
+from services.executors import run_data
+from services.tag_analytics import get_tag_index
+from services.topics_service import get_chart_index, get_wordcloud_index
+
+router = APIRouter(prefix="/api", tags=["social listening"])
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+@router.get("/tags/top")
+async def get_top_tags(
+    k: int = Query(default=5, ge=1, le=1000, description="Number of tags to return"),
+    start: Optional[date] = Query(default=None, description="Window start date (inclusive)"),
+    end: Optional[date] = Query(default=None, description="Window end date (inclusive)"),
+    points: Optional[int] = Query(default=None, ge=1, description="Use the last N data points when no dates are given (default 4 weeks)"),
+):
+    """Top-K tag pillars for a time window, with share of window volume and momentum vs the previous window."""
+    try:
+        index = await run_data(get_tag_index, DATA_DIR)
+        return await run_data(index.top, k=k, start=start, end=end, points=points)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _etag_response(payload: Dict[str, Any], version: str, params: Dict[str, Any], if_none_match: Optional[str]) -> Response:
+    """Respond with an ETag covering the file version and the normalized query parameters."""
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:12]
+    etag = f'"{version}-{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=payload, headers=headers)
+
+
+@router.get("/topics/wordcloud")
+async def get_wordcloud_topics(
+    limit: int = Query(default=50, ge=1, le=1000),
+    kind: Optional[str] = Query(default=None, description="Filter by term kind: word, hashtag or emoji"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """Top wordcloud terms (HTML-cleaned, deduplicated, ranked by count) with share of total volume."""
+    try:
+        index, version = await run_data(get_wordcloud_index, DATA_DIR)
+        payload = {"version": version, **await run_data(index.top, limit, kind)}
+        return _etag_response(payload, version, {"limit": limit, "kind": kind}, if_none_match)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Wordcloud data not found")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/topics/chart")
+async def get_chart_topics(
+    limit: int = Query(default=20, ge=1, le=1000),
+    category: Optional[str] = Query(default=None, description="objects, phrases, hashtags, emojis, actions or characteristics"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """Topic chart points per category, deduplicated and ranked by y."""
+    try:
+        index, version = await run_data(get_chart_index, DATA_DIR)
+        payload = {"version": version, **await run_data(index.top, limit, category)}
+        return _etag_response(payload, version, {"limit": limit, "category": category}, if_none_match)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Topic chart data not found")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
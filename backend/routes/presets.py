@@ -9,6 +9,7 @@ from datetime import datetime
 
 from database import get_db, engine, Base
 from models.db_models import UserPreset
+from services.executors import run_db
 
 router = APIRouter(prefix="/api/user-presets", tags=["User Presets"])
 
@@ -61,25 +62,15 @@ class PresetResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/", response_model=List[PresetResponse])
-async def list_presets(db: Session = Depends(get_db)):
-    """Get all saved presets"""
-    presets = db.query(UserPreset).order_by(UserPreset.updated_at.desc().nullsfirst(), UserPreset.created_at.desc()).all()
-    return presets
+def _list_presets(db: Session) -> List[UserPreset]:
+    return db.query(UserPreset).order_by(UserPreset.updated_at.desc().nullsfirst(), UserPreset.created_at.desc()).all()
 
 
-@router.get("/{preset_id}", response_model=PresetResponse)
-async def get_preset(preset_id: int, db: Session = Depends(get_db)):
-    """Get a specific preset by ID"""
-    preset = db.query(UserPreset).filter(UserPreset.id == preset_id).first()
-    if not preset:
-        raise HTTPException(status_code=404, detail="Preset not found")
-    return preset
+def _get_preset(db: Session, preset_id: int) -> Optional[UserPreset]:
+    return db.query(UserPreset).filter(UserPreset.id == preset_id).first()
 
 
-@router.post("/", response_model=PresetResponse)
-async def create_preset(preset_data: PresetCreate, db: Session = Depends(get_db)):
-    """Create a new preset"""
+def _create_preset(db: Session, preset_data: PresetCreate) -> UserPreset:
     preset = UserPreset(
         name=preset_data.name,
         description=preset_data.description,
@@ -91,12 +82,10 @@ async def create_preset(preset_data: PresetCreate, db: Session = Depends(get_db)
     return preset
 
 
-@router.put("/{preset_id}", response_model=PresetResponse)
-async def update_preset(preset_id: int, preset_data: PresetUpdate, db: Session = Depends(get_db)):
-    """Update an existing preset"""
-    preset = db.query(UserPreset).filter(UserPreset.id == preset_id).first()
+def _update_preset(db: Session, preset_id: int, preset_data: PresetUpdate) -> Optional[UserPreset]:
+    preset = _get_preset(db, preset_id)
     if not preset:
-        raise HTTPException(status_code=404, detail="Preset not found")
+        return None
 
     if preset_data.name is not None:
         preset.name = preset_data.name
@@ -110,26 +99,66 @@ async def update_preset(preset_id: int, preset_data: PresetUpdate, db: Session =
     return preset
 
 
+def _delete_preset(db: Session, preset_id: int) -> bool:
+    preset = _get_preset(db, preset_id)
+    if not preset:
+        return False
+    db.delete(preset)
+    db.commit()
+    return True
+
+
+# SQLAlchemy sessions are synchronous; every query runs on the database pool
+@router.get("/", response_model=List[PresetResponse])
+async def list_presets(db: Session = Depends(get_db)):
+    """Get all saved presets"""
+    return await run_db(_list_presets, db)
+
+
+@router.get("/{preset_id}", response_model=PresetResponse)
+async def get_preset(preset_id: int, db: Session = Depends(get_db)):
+    """Get a specific preset by ID"""
+    preset = await run_db(_get_preset, db, preset_id)
+    if not preset:
+        raise HTTPException(status_code=404, detail="Preset not found")
+    return preset
+
+
+@router.post("/", response_model=PresetResponse)
+async def create_preset(preset_data: PresetCreate, db: Session = Depends(get_db)):
+    """Create a new preset"""
+    return await run_db(_create_preset, db, preset_data)
+
+
+@router.put("/{preset_id}", response_model=PresetResponse)
+async def update_preset(preset_id: int, preset_data: PresetUpdate, db: Session = Depends(get_db)):
+    """Update an existing preset"""
+    preset = await run_db(_update_preset, db, preset_id, preset_data)
+    if not preset:
+        raise HTTPException(status_code=404, detail="Preset not found")
+    return preset
+
+
 @router.delete("/{preset_id}")
 async def delete_preset(preset_id: int, db: Session = Depends(get_db)):
     """Delete a preset"""
-    preset = db.query(UserPreset).filter(UserPreset.id == preset_id).first()
-    if not preset:
+    if not await run_db(_delete_preset, db, preset_id):
         raise HTTPException(status_code=404, detail="Preset not found")
-
-    db.delete(preset)
-    db.commit()
     return {"message": "Preset deleted successfully"}
 
 
-@router.get("/health/db")
-async def check_db_health():
-    """Check if database is configured and connected"""
-    if engine is None:
-        return {"status": "not_configured", "message": "DATABASE_URL not set"}
+def _check_db() -> dict:
     try:
         # Try to create tables
         Base.metadata.create_all(bind=engine)
         return {"status": "connected", "message": "Database is ready"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
+
+
+@router.get("/health/db")
+async def check_db_health():
+    """Check if database is configured and connected"""
+    if engine is None:
+        return {"status": "not_configured", "message": "DATABASE_URL not set"}
+    return await run_db(_check_db)
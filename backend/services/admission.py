@@ -0,0 +1,237 @@
+"""
+Admission control for expensive endpoints.
+
+Each endpoint class ("forecast", "ai") has a concurrency limit with a bounded
+FIFO wait queue, plus a per-client token bucket. Routes opt in with
+`dependencies=[Depends(admit("ai"))]`:
+
+- over the client's request rate: 429 with Retry-After until a token refills;
+- all slots busy and the queue full, or no slot within the queue timeout:
+  503 with Retry-After estimated from recent hold times.
+
+Limits come from <CLASS>_CONCURRENCY, <CLASS>_QUEUE, <CLASS>_QUEUE_TIMEOUT
+(seconds), <CLASS>_RATE (requests per second per client, 0 disables) and
+<CLASS>_BURST, e.g. AI_CONCURRENCY=4.
+
+Clients are identified by their peer address. X-Forwarded-For is honoured only
+when the peer is one of TRUSTED_PROXIES (comma-separated addresses or CIDR
+ranges, e.g. "127.0.0.1,10.0.0.0/8"); otherwise any client could pick its own
+rate-limit bucket by sending the header.
+"""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from fastapi import HTTPException, Request
+
+# Token buckets kept per class (least recently seen clients are dropped first)
+MAX_CLIENTS = 10000
+MAX_RETRY_AFTER = 60
+
+
+def _env(name: str, key: str, default: float) -> float:
+    return float(os.getenv(f"{name.upper()}_{key}", str(default)))
+
+
+def _networks(spec: str) -> List[Any]:
+    return [ipaddress.ip_network(part.strip(), strict=False) for part in spec.split(",") if part.strip()]
+
+
+TRUSTED_PROXIES = _networks(os.getenv("TRUSTED_PROXIES", ""))
+
+
+def _trusted(host: str) -> bool:
+    try:
+        addr = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(addr in net for net in TRUSTED_PROXIES)
+
+
+def client_key(request: Request) -> str:
+    """Peer address; behind a trusted proxy, the nearest untrusted X-Forwarded-For hop."""
+    peer = request.client.host if request.client else "anonymous"
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded or not _trusted(peer):
+        return peer
+    # Proxies append to the header, so only hops added by trusted proxies can be believed
+    for hop in reversed([h.strip() for h in forwarded.split(",") if h.strip()]):
+        if not _trusted(hop):
+            return hop
+    return peer
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take one token; returns 0 on success or the seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+class AdmissionLimiter:
+    """Concurrency slots with a bounded wait queue and per-client rate limits.
+
+    Only touched from the event loop, so plain counters are enough.
+    """
+
+    def __init__(self, name: str, concurrency: int, queue: int, queue_timeout: float, rate: float, burst: float):
+        self.name = name
+        self.concurrency = max(int(concurrency), 1)
+        self.queue = max(int(queue), 0)
+        self.queue_timeout = queue_timeout
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        # Exponentially weighted mean time a slot is held, for Retry-After
+        self._avg_hold_s = 1.0
+        self._peak_queued = 0
+        self._admitted = 0
+        self._queued_total = 0
+        self._shed = 0
+        self._timed_out = 0
+        self._rate_limited = 0
+
+    def _retry_after(self) -> int:
+        wait = self._avg_hold_s * (len(self._waiters) + 1) / self.concurrency
+        return min(max(math.ceil(wait), 1), MAX_RETRY_AFTER)
+
+    def _overloaded(self, reason: str) -> HTTPException:
+        return HTTPException(
+            status_code=503,
+            detail=f"Server busy ({self.name}: {reason}); retry shortly",
+            headers={"Retry-After": str(self._retry_after())},
+        )
+
+    def check_rate(self, client: str) -> None:
+        if self.rate <= 0:
+            return
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self.rate, self.burst)
+            while len(self._buckets) > MAX_CLIENTS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+        wait = bucket.take()
+        if wait > 0:
+            self._rate_limited += 1
+            raise HTTPException(
+                status_code=429,
+                detail=f"Too many {self.name} requests; retry shortly",
+                headers={"Retry-After": str(min(max(math.ceil(wait), 1), MAX_RETRY_AFTER))},
+            )
+
+    async def acquire(self) -> None:
+        if self._active < self.concurrency and not self._waiters:
+            self._active += 1
+            self._admitted += 1
+            return
+        if len(self._waiters) >= self.queue:
+            self._shed += 1
+            raise self._overloaded("queue full")
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        self._queued_total += 1
+        self._peak_queued = max(self._peak_queued, len(self._waiters))
+        try:
+            done, _ = await asyncio.wait({fut}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            # Client went away while queued; pass on a slot that was already handed over
+            if fut.done():
+                self.release()
+            else:
+                self._waiters.remove(fut)
+            raise
+        if not done:
+            self._waiters.remove(fut)
+            self._timed_out += 1
+            raise self._overloaded("queue timeout")
+        self._admitted += 1
+
+    def release(self, held_s: Optional[float] = None) -> None:
+        if held_s is not None:
+            self._avg_hold_s += 0.2 * (held_s - self._avg_hold_s)
+        # Hand the slot straight to the oldest waiter so late arrivals cannot overtake the queue
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "queue": self.queue,
+            "queue_timeout_s": self.queue_timeout,
+            "rate_per_s": self.rate,
+            "burst": self.burst,
+            "active": self._active,
+            "queued": len(self._waiters),
+            "peak_queued": self._peak_queued,
+            "admitted": self._admitted,
+            "queued_total": self._queued_total,
+            "shed": self._shed,
+            "timed_out": self._timed_out,
+            "rate_limited": self._rate_limited,
+            "avg_hold_ms": round(self._avg_hold_s * 1000, 2),
+            "clients": len(self._buckets),
+        }
+
+
+def _limiter(name: str, concurrency: int, queue: int, queue_timeout: float, rate: float, burst: float) -> AdmissionLimiter:
+    return AdmissionLimiter(
+        name,
+        concurrency=int(_env(name, "CONCURRENCY", concurrency)),
+        queue=int(_env(name, "QUEUE", queue)),
+        queue_timeout=_env(name, "QUEUE_TIMEOUT", queue_timeout),
+        rate=_env(name, "RATE", rate),
+        burst=_env(name, "BURST", burst),
+    )
+
+
+LIMITERS: Dict[str, AdmissionLimiter] = {
+    # Engine runs take milliseconds; queue briefly rather than shed
+    "forecast": _limiter("forecast", concurrency=8, queue=32, queue_timeout=2.0, rate=5.0, burst=20),
+    # OpenAI calls take seconds; each critique also runs two forecasts
+    "ai": _limiter("ai", concurrency=4, queue=8, queue_timeout=10.0, rate=0.2, burst=5),
+}
+
+
+def admit(name: str) -> Callable[[Request], AsyncIterator[None]]:
+    """Route dependency holding one `name` slot for the duration of the handler."""
+    limiter = LIMITERS[name]
+
+    async def dependency(request: Request) -> AsyncIterator[None]:
+        limiter.check_rate(client_key(request))
+        await limiter.acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            limiter.release(time.perf_counter() - started)
+
+    return dependency
+
+
+def admission_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: limiter.stats() for name, limiter in LIMITERS.items()}
@@ -6,6 +6,7 @@ Enhanced with GWI 2024 research data for Care Bears audience insights
 import os
 from typing import Dict, List, Any, Optional
 from models.schemas import InsightRequest, ParamTuneRequest
+from services.growth_stats import growth_context
 
 # GWI Research Context for AI prompts
 GWI_RESEARCH_CONTEXT = """
@@ -65,7 +66,8 @@ def analyze_strategy(
     months: int,
     preset: str,
     historical_data: Dict[str, Any],
-    budget_info: Optional[Dict[str, Any]] = None
+    budget_info: Optional[Dict[str, Any]] = None,
+    follower_growth: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Analyze the current strategy and provide AI recommendations
@@ -138,6 +140,12 @@ GROWTH MATH:
 - At ${cpf['mid']} CPF, budget supports ~{int((paid_weekly + growth_weekly) / cpf['mid']):,} paid followers/week
 - Organic growth must make up the remainder
 
+"""
+    observed = growth_context(follower_growth) if follower_growth else ""
+    if observed:
+        context += f"""OBSERVED FOLLOWER GROWTH (history):
+{observed}
+
 """
 
     prompt = context + """
@@ -380,7 +388,8 @@ def critique_strategy(
     goal: float,
     historical_data: Dict[str, Any],
     budget_info: Optional[Dict[str, Any]] = None,
-    previous_suggestions: Optional[List[Dict[str, Any]]] = None
+    previous_suggestions: Optional[List[Dict[str, Any]]] = None,
+    follower_growth: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Provide a balanced critique and optimization suggestions for the user's current strategy.
@@ -455,6 +464,12 @@ TARGET AUDIENCE MIX:
 BUDGET INFORMATION:
 - Paid Media Weekly: ${budget_info.get('paid_media_weekly', 0):,}
 - CPF Range: ${budget_info.get('cpf_range', {}).get('min', 0.10)}-${budget_info.get('cpf_range', {}).get('max', 0.20)}
+"""
+    observed = growth_context(follower_growth) if follower_growth else ""
+    if observed:
+        context += f"""
+OBSERVED FOLLOWER GROWTH (history):
+{observed}
 """
 
     prompt = context + """
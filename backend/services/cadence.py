@@ -0,0 +1,123 @@
+"""
+Historical posting cadence against the RECOMMENDED_FREQ bands.
+
+Monthly post counts from platform_metrics.json are converted to weekly rates
+and every platform-month is classified into a posting band. The engine's band
+factors (band_quality, oversaturation_penalty, consistency_boost) are applied
+to the whole history at once to estimate the reach the penalty model says the
+actual cadence cost.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.forecast_service import (
+    RECOMMENDED_FREQ,
+    band_quality_array,
+    consistency_boost_array,
+    oversaturation_penalty_array,
+)
+from services.platform_metrics import PlatformMetrics, to_json_lists
+
+BANDS = ("below_min", "in_band", "above_max", "over_soft", "over_hard")
+# Fallback when a month label cannot be parsed
+WEEKS_PER_MONTH = 52.0 / 12.0
+
+
+def weeks_in_months(labels: List[str]) -> np.ndarray:
+    """Calendar weeks per month label ('Jan 25', 'Jan 2025', '2025-01', ...)."""
+    parsed = pd.to_datetime(pd.Series(labels, dtype=object), format='%b %y', errors='coerce')
+    missing = parsed.isna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(pd.Series(labels, dtype=object)[missing], format='mixed', errors='coerce')
+    days = parsed.dt.days_in_month.to_numpy(dtype=float)
+    return np.where(np.isnan(days), WEEKS_PER_MONTH, days / 7.0)
+
+
+def band_factors(posts_per_week, cfg: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The engine's (band_quality, oversaturation_penalty, consistency_boost) at `posts_per_week`."""
+    return (
+        band_quality_array(posts_per_week, cfg["min"], cfg["max"], cfg["soft"], cfg["hard"]),
+        oversaturation_penalty_array(posts_per_week, cfg["soft"], cfg["hard"]),
+        consistency_boost_array(posts_per_week, cfg["min"], cfg["max"]),
+    )
+
+
+def analyze_cadence(metrics: PlatformMetrics) -> Dict[str, Any]:
+    """Weekly posting rates, band classification and implied reach loss per platform-month."""
+    platforms = [p for p in metrics.platforms if p in RECOMMENDED_FREQ]
+    rows = [metrics.platforms.index(p) for p in platforms]
+    posts = metrics.posts[rows]
+    views = metrics.views[rows]
+    weekly = posts / weeks_in_months(metrics.months)[None, :]
+
+    cfg = {k: np.array([[RECOMMENDED_FREQ[p][k]] for p in platforms], dtype=float) for k in ("min", "max", "soft", "hard")}
+    ppw = np.ma.filled(weekly, 0.0)
+    missing = np.ma.getmaskarray(weekly)
+
+    band_idx = np.select(
+        [ppw < cfg["min"], ppw <= cfg["max"], ppw <= cfg["soft"], ppw < cfg["hard"]],
+        [0, 1, 2, 3],
+        4,
+    )
+    quality, penalty, consistency = (np.ma.masked_where(missing, f) for f in band_factors(ppw, cfg))
+    # Per-post effectiveness relative to posting at the top of each platform's band
+    in_band = np.prod(band_factors(cfg["max"], cfg), axis=0)
+    effectiveness = quality * penalty * consistency / in_band
+    # Observed views were earned at `effectiveness`; the shortfall is what in-band posts would have added
+    lost_views = views * (1.0 - effectiveness) / effectiveness
+
+    bands = {
+        p: [None if m else BANDS[b] for b, m in zip(brow, mrow)]
+        for p, brow, mrow in zip(platforms, band_idx.tolist(), missing.tolist())
+    }
+    summary: Dict[str, Dict[str, Any]] = {}
+    for i, p in enumerate(platforms):
+        reported = ~missing[i]
+        lost_total = float(lost_views[i].sum()) if lost_views[i].count() else None
+        observed = float(views[i][~np.ma.getmaskarray(lost_views[i])].sum()) if lost_views[i].count() else None
+        summary[p] = {
+            "months_by_band": {b: int(((band_idx[i] == k) & reported).sum()) for k, b in enumerate(BANDS)},
+            "avg_weekly_posts": float(weekly[i].mean()) if weekly[i].count() else None,
+            "avg_effectiveness": float(effectiveness[i].mean()) if effectiveness[i].count() else None,
+            "lost_views": lost_total,
+            "lost_share": lost_total / (observed + lost_total) if lost_total and observed is not None else 0.0,
+        }
+
+    return {
+        "months": metrics.months,
+        "platforms": platforms,
+        "bands": {p: RECOMMENDED_FREQ[p] for p in platforms},
+        "weekly_posts": to_json_lists(weekly, platforms),
+        "band": bands,
+        "band_quality": to_json_lists(quality, platforms),
+        "oversaturation_penalty": to_json_lists(penalty, platforms),
+        "consistency_boost": to_json_lists(consistency, platforms),
+        "effectiveness": to_json_lists(effectiveness, platforms),
+        "lost_views": to_json_lists(lost_views, platforms),
+        "summary": summary,
+    }
+
+
+_CACHE_MAX = 8
+_LOCK = threading.Lock()
+# metrics file version -> analysis
+_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def get_cadence_analysis(metrics: PlatformMetrics) -> Dict[str, Any]:
+    """analyze_cadence memoized per platform_metrics.json version."""
+    cached = _CACHE.get(metrics.version)
+    if cached is None:
+        with _LOCK:
+            cached = _CACHE.get(metrics.version)
+            if cached is None:
+                cached = analyze_cadence(metrics)
+                _CACHE[metrics.version] = cached
+                while len(_CACHE) > _CACHE_MAX:
+                    _CACHE.pop(next(iter(_CACHE)))
+    return cached
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
+import hashlib
+import json
+import re
+import threading
 import zipfile
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
+from services import snapshot_cache
+from services.growth_stats import compound_monthly_rate
+from services.platform_metrics import metrics_version, views_per_post_from_metrics
+
 # Platforms mapping between sheet labels and model platforms
 PLATFORM_MAP = {
     'IG': 'Instagram',
@@ -27,90 +37,286 @@ def _col_letter_to_index(col: str) -> int:
     return result - 1
 
 
-def _xlsx_read_rows(xlsx_path: Path) -> Dict[str, List[List[str]]]:
-    ns_main = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
-    ns_r = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
-
-    with zipfile.ZipFile(xlsx_path) as z:
-        wb = ET.fromstring(z.read('xl/workbook.xml'))
-        sheets = wb.find(f'{{{ns_main}}}sheets')
-        rels = ET.fromstring(z.read('xl/_rels/workbook.xml.rels'))
-        rid_to_target = {rel.attrib.get('Id'): rel.attrib.get('Target') for rel in rels}
-
-        # Load shared strings
-        shared_strings: List[str] = []
-        if 'xl/sharedStrings.xml' in z.namelist():
-            sst = ET.fromstring(z.read('xl/sharedStrings.xml'))
-            for si in sst:
-                texts = []
-                for t in si.iter(f'{{{ns_main}}}t'):
-                    texts.append(t.text or '')
-                shared_strings.append(''.join(texts))
-
-        def get_text(c) -> str:
-            v = c.find(f'{{{ns_main}}}v')
-            t = c.attrib.get('t')
-            if v is None:
-                is_ = c.find(f'{{{ns_main}}}is')
-                if is_ is not None:
-                    texts = [t.text or '' for t in is_.iter(f'{{{ns_main}}}t')]
-                    return ''.join(texts)
-                return ''
-            val = v.text or ''
-            if t == 's':
-                try:
-                    idx = int(val)
-                    return shared_strings[idx] if 0 <= idx < len(shared_strings) else val
-                except Exception:
-                    return val
-            return val
-
-        def get_col_from_ref(ref: str) -> str:
-            """Extract column letters from cell reference like 'A1', 'AB23'."""
-            col = ''
-            for ch in ref:
-                if ch.isalpha():
-                    col += ch
-                else:
-                    break
-            return col
-
-        out: Dict[str, List[List[str]]] = {}
-        for sh in sheets:
-            name = sh.attrib.get('name')
-            rid = sh.attrib.get(f'{{{ns_r}}}id')
-            target = rid_to_target.get(rid)
-            path = 'xl/' + target if target and not target.startswith('xl/') else (target or '')
-            if not path:
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_R = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_T_SHEETS = f'{_NS_MAIN}sheets'
+_T_SHEETDATA = f'{_NS_MAIN}sheetData'
+_T_ROW = f'{_NS_MAIN}row'
+_T_SI = f'{_NS_MAIN}si'
+_T_T = f'{_NS_MAIN}t'
+_T_V = f'{_NS_MAIN}v'
+_T_IS = f'{_NS_MAIN}is'
+
+# Cell references are '<letters><digits>'; column letters repeat across rows, so memoize them
+_CELL_COL_RE = re.compile(r'[A-Za-z]+')
+_COL_INDEX: Dict[str, int] = {}
+
+
+def _ref_col_index(ref: str) -> int:
+    """0-based column index of a cell reference like 'AB23' (-1 when absent)."""
+    m = _CELL_COL_RE.match(ref)
+    if m is None:
+        return -1
+    letters = m.group()
+    idx = _COL_INDEX.get(letters)
+    if idx is None:
+        idx = _col_letter_to_index(letters)
+        _COL_INDEX[letters] = idx
+    return idx
+
+
+def _iter_shared_items(fp) -> Iterator[ET.Element]:
+    """Stream the <si> items of sharedStrings.xml, clearing each once the consumer moves on."""
+    root = None
+    for event, el in ET.iterparse(fp, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = el
+            continue
+        if el.tag == _T_SI:
+            yield el
+            root.clear()
+
+
+def _cell_value(c) -> Tuple[str, Optional[int]]:
+    """Cell text plus its shared-string index when the text still has to be looked up."""
+    v = c.find(_T_V)
+    if v is None:
+        is_ = c.find(_T_IS)
+        if is_ is not None:
+            return ''.join(t.text or '' for t in is_.iter(_T_T)), None
+        return '', None
+    val = v.text or ''
+    if c.get('t') == 's':
+        try:
+            return val, int(val)
+        except ValueError:
+            return val, None
+    return val, None
+
+
+def _iter_sheet_rows(fp, shared_refs: List[Tuple[List[str], int, int]]) -> Iterator[List[str]]:
+    """Stream a worksheet part row by row with iterparse, dropping each <row> once decoded.
+
+    Shared-string cells keep their raw index text and are recorded in `shared_refs`
+    as (row, column, index) so the caller can resolve only the strings it needs.
+    """
+    sheet_data = None
+    for event, el in ET.iterparse(fp, events=('start', 'end')):
+        if event == 'start':
+            if el.tag == _T_SHEETDATA:
+                sheet_data = el
+            continue
+        if el.tag != _T_ROW or sheet_data is None:
+            continue
+        cells = list(el)
+        if not cells:
+            yield []
+        else:
+            # Place values at their referenced columns, padding gaps with ''
+            placed = []
+            max_col_idx = 0
+            for c in cells:
+                idx = _ref_col_index(c.get('r', ''))
+                if idx >= 0:
+                    placed.append((idx, c))
+                    if idx > max_col_idx:
+                        max_col_idx = idx
+            row_data = [''] * (max_col_idx + 1)
+            for idx, c in placed:
+                text, sidx = _cell_value(c)
+                row_data[idx] = text
+                if sidx is not None:
+                    shared_refs.append((row_data, idx, sidx))
+            yield row_data
+        sheet_data.remove(el)
+
+
+def _xlsx_sheet_parts(z: zipfile.ZipFile) -> List[Tuple[str, str]]:
+    """(sheet name, zip part path) pairs in workbook order."""
+    wb = ET.fromstring(z.read('xl/workbook.xml'))
+    sheets = wb.find(_T_SHEETS)
+    rels = ET.fromstring(z.read('xl/_rels/workbook.xml.rels'))
+    rid_to_target = {rel.attrib.get('Id'): rel.attrib.get('Target') for rel in rels}
+    parts: List[Tuple[str, str]] = []
+    for sh in (sheets if sheets is not None else []):
+        target = rid_to_target.get(sh.attrib.get(f'{_NS_R}id')) or ''
+        if target.startswith('/'):
+            target = target.lstrip('/')
+        path = 'xl/' + target if target and not target.startswith('xl/') else target
+        if path:
+            parts.append((sh.attrib.get('name'), path))
+    return parts
+
+
+class SheetIndex:
+    """Lookup structures over one parsed sheet, built in a single pass.
+
+    - coordinate access: `cell(row, col)` ('' outside the sheet)
+    - label index: stripped column-A text -> row numbers (exact and upper-cased)
+    - text index: cell text -> (row, col) positions, with memoized substring search
+    - width index: row length -> row numbers
+    """
+
+    def __init__(self, rows: List[List[str]]):
+        self.rows = rows
+        self._labels: Dict[str, List[int]] = {}
+        self._labels_upper: Dict[str, List[int]] = {}
+        self._cells: Dict[str, List[Tuple[int, int]]] = {}
+        self._widths: Dict[int, List[int]] = {}
+        self._contains: Dict[str, List[Tuple[int, int]]] = {}
+        for ri, r in enumerate(rows):
+            self._widths.setdefault(len(r), []).append(ri)
+            if not r:
                 continue
-            xml = ET.fromstring(z.read(path))
-            sheetData = xml.find(f'{{{ns_main}}}sheetData')
-            rows: List[List[str]] = []
-            if sheetData is not None:
-                for row in sheetData:
-                    # Build row with proper column alignment using cell references
-                    cells = list(row)
-                    if not cells:
-                        rows.append([])
-                        continue
-                    # Find max column index
-                    max_col_idx = 0
-                    for c in cells:
-                        ref = c.attrib.get('r', '')
-                        col = get_col_from_ref(ref)
-                        if col:
-                            max_col_idx = max(max_col_idx, _col_letter_to_index(col))
-                    # Create row with proper size and fill in values at correct positions
-                    row_data = [''] * (max_col_idx + 1)
-                    for c in cells:
-                        ref = c.attrib.get('r', '')
-                        col = get_col_from_ref(ref)
-                        if col:
-                            col_idx = _col_letter_to_index(col)
-                            row_data[col_idx] = get_text(c)
-                    rows.append(row_data)
-            out[name] = rows
-        return out
+            label = str(r[0]).strip()
+            self._labels.setdefault(label, []).append(ri)
+            self._labels_upper.setdefault(label.upper(), []).append(ri)
+            for ci, v in enumerate(r):
+                if v != '':
+                    self._cells.setdefault(v, []).append((ri, ci))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def cell(self, row: int, col: int) -> str:
+        if 0 <= row < len(self.rows):
+            r = self.rows[row]
+            if 0 <= col < len(r):
+                return r[col]
+        return ''
+
+    def label_rows(self, *labels: str, upper: bool = False) -> List[int]:
+        """Row numbers (ascending) whose stripped column-A text is one of `labels`."""
+        index = self._labels_upper if upper else self._labels
+        found = [ri for label in labels for ri in index.get(label, ())]
+        return sorted(found) if len(labels) > 1 else found
+
+    def rows_with_width(self, width: int) -> List[int]:
+        return self._widths.get(width, [])
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """Positions of cells whose text equals `text`, in row-major order."""
+        return self._cells.get(text, [])
+
+    def find_containing(self, fragment: str) -> List[Tuple[int, int]]:
+        """Positions of cells whose text contains `fragment`, in row-major order."""
+        hits = self._contains.get(fragment)
+        if hits is None:
+            hits = sorted(pos for text, positions in self._cells.items() if fragment in text for pos in positions)
+            self._contains[fragment] = hits
+        return hits
+
+
+class XlsxWorkbook:
+    """Lazy, read-only view of a workbook's sheets as rows of strings.
+
+    Sheet names are resolved to parts up front, but a sheet is only parsed on
+    first access (or served from its snapshot). Shared strings are decoded on
+    demand: only the indices referenced by parsed sheets are materialized, and
+    the sharedStrings stream stops at the highest index still needed.
+    """
+
+    def __init__(self, xlsx_path: Path, use_snapshots: bool = True):
+        self.path = Path(xlsx_path)
+        self.use_snapshots = use_snapshots
+        self._parts: Optional[Dict[str, str]] = None
+        self._has_shared = False
+        self._rows: Dict[str, List[List[str]]] = {}
+        self._indexes: Dict[str, SheetIndex] = {}
+        self._strings: Dict[int, str] = {}
+        self._strings_count: Optional[int] = None
+
+    def _load_parts(self) -> Dict[str, str]:
+        if self._parts is None:
+            with zipfile.ZipFile(self.path) as z:
+                parts = dict(_xlsx_sheet_parts(z))
+                self._has_shared = 'xl/sharedStrings.xml' in z.namelist()
+            self._parts = parts
+        return self._parts
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self._load_parts())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._load_parts()
+
+    def __getitem__(self, name: str) -> List[List[str]]:
+        if name not in self:
+            raise KeyError(name)
+        return self.rows(name)
+
+    def get(self, name: str, default: Optional[List[List[str]]] = None) -> Optional[List[List[str]]]:
+        return self.rows(name) if name in self else default
+
+    def index(self, name: str) -> SheetIndex:
+        """SheetIndex over one sheet (empty for unknown sheets), built at most once."""
+        idx = self._indexes.get(name)
+        if idx is None:
+            idx = SheetIndex(self.rows(name))
+            self._indexes[name] = idx
+        return idx
+
+    def rows(self, name: str) -> List[List[str]]:
+        """Rows of one sheet (empty for unknown sheets), parsed at most once."""
+        cached = self._rows.get(name)
+        if cached is not None:
+            return cached
+        part = self._load_parts().get(name)
+        if part is None:
+            return []
+        rows = snapshot_cache.load_sheet(self.path, name) if self.use_snapshots else None
+        if rows is None:
+            rows = self._parse_sheet(part)
+            if self.use_snapshots:
+                snapshot_cache.save_sheet(self.path, name, rows)
+        self._rows[name] = rows
+        return rows
+
+    def _parse_sheet(self, part: str) -> List[List[str]]:
+        refs: List[Tuple[List[str], int, int]] = []
+        with zipfile.ZipFile(self.path) as z:
+            with z.open(part) as fp:
+                rows = list(_iter_sheet_rows(fp, refs))
+            if refs:
+                self._decode_strings(z, {sidx for _, _, sidx in refs})
+        strings = self._strings
+        for row_data, col, sidx in refs:
+            text = strings.get(sidx)
+            # Out-of-range indices keep their raw text, as before
+            if text is not None:
+                row_data[col] = text
+        return rows
+
+    def _decode_strings(self, z: zipfile.ZipFile, needed: set) -> None:
+        missing = {i for i in needed if i >= 0 and i not in self._strings}
+        if self._strings_count is not None:
+            missing = {i for i in missing if i < self._strings_count}
+        if not missing or not self._has_shared:
+            return
+        last = max(missing)
+        count = 0
+        with z.open('xl/sharedStrings.xml') as fp:
+            for i, si in enumerate(_iter_shared_items(fp)):
+                count = i + 1
+                if i in missing:
+                    self._strings[i] = ''.join(t.text or '' for t in si.iter(_T_T))
+                    if i == last:
+                        return
+        self._strings_count = count
+
+
+def _xlsx_parse_rows(xlsx_path: Path) -> Dict[str, List[List[str]]]:
+    """Parse every sheet of a workbook (no snapshots)."""
+    wb = XlsxWorkbook(xlsx_path, use_snapshots=False)
+    return {name: wb.rows(name) for name in wb.sheet_names}
+
+
+def _xlsx_read_rows(xlsx_path: Path) -> Dict[str, List[List[str]]]:
+    """Rows by sheet for every sheet, served from per-sheet snapshots when unchanged."""
+    wb = XlsxWorkbook(xlsx_path)
+    return {name: wb.rows(name) for name in wb.sheet_names}
 
 
 def _to_float(x: str) -> Optional[float]:
@@ -125,95 +331,88 @@ def _to_float(x: str) -> Optional[float]:
         return None
 
 
-def _extract_historical_mom(rows: List[List[str]]) -> Dict[str, float]:
+def _extract_historical_mom(sheet: SheetIndex) -> Dict[str, float]:
     result: Dict[str, float] = {}
-    for r in rows:
-        if not r:
-            continue
-        label = str(r[0]).strip()
-        if label in PLATFORM_MAP:
-            # pick a plausible monthly MoM growth value in (0, 0.2)
-            candidates = [v for v in (_to_float(c) for c in r[1:]) if v is not None and 0 < v < 0.2]
-            if candidates:
-                result[PLATFORM_MAP[label]] = max(candidates)  # prefer the larger MoM among row cells
+    for ri in sheet.label_rows(*PLATFORM_MAP):
+        r = sheet.rows[ri]
+        # pick a plausible monthly MoM growth value in (0, 0.2)
+        candidates = [v for v in (_to_float(c) for c in r[1:]) if v is not None and 0 < v < 0.2]
+        if candidates:
+            result[PLATFORM_MAP[str(r[0]).strip()]] = max(candidates)  # prefer the larger MoM among row cells
     return result
 
 
-def _extract_projected_mom(rows: List[List[str]]) -> Dict[str, float]:
-    # find header with 'Projected Growth'
-    proj_idx = None
-    for r in rows[:5]:
-        if any('Projected Growth' in str(c) for c in r):
-            proj_idx = next((i for i, c in enumerate(r) if 'Projected Growth' in str(c)), None)
-            break
+def _extract_projected_mom(sheet: SheetIndex) -> Dict[str, float]:
+    # find header with 'Projected Growth' within the first 5 rows
+    hits = sheet.find_containing('Projected Growth')
+    proj_idx = hits[0][1] if hits and hits[0][0] < 5 else None
     result: Dict[str, float] = {}
-    for r in rows:
-        if not r:
-            continue
+    for ri in sheet.label_rows('TikTok', 'Instagram', 'Facebook', 'YouTube'):
+        r = sheet.rows[ri]
         label = str(r[0]).strip()
-        if label in ('TikTok', 'Instagram', 'Facebook', 'YouTube'):
-            if proj_idx is not None and proj_idx < len(r):
-                v = _to_float(r[proj_idx])
-                if v is not None and 0 < v < 0.3:
-                    result[label] = v
-            else:
-                # fallback: second numeric in row
-                nums = [v for v in (_to_float(c) for c in r[1:]) if v is not None and 0 < v < 0.3]
-                if nums:
-                    result[label] = max(nums)
+        if proj_idx is not None and proj_idx < len(r):
+            v = _to_float(r[proj_idx])
+            if v is not None and 0 < v < 0.3:
+                result[label] = v
+        else:
+            # fallback: second numeric in row
+            nums = [v for v in (_to_float(c) for c in r[1:]) if v is not None and 0 < v < 0.3]
+            if nums:
+                result[label] = max(nums)
     return result
 
 
-def _extract_followers_per_view(rows: List[List[str]]) -> Optional[float]:
+def _extract_followers_per_view(sheet: SheetIndex) -> Optional[float]:
     # Prefer a single value row ~0.0001 to 0.05
-    for r in rows:
-        if len(r) == 1:
-            v = _to_float(r[0])
-            if v is not None and 0 < v < 0.05:
-                return v
+    for ri in sheet.rows_with_width(1):
+        v = _to_float(sheet.rows[ri][0])
+        if v is not None and 0 < v < 0.05:
+            return v
     # Fallback: TOTAL row with views and followers
-    for r in rows:
-        if r and str(r[0]).strip().upper() == 'TOTAL':
-            nums = [v for v in (_to_float(c) for c in r[1:]) if v is not None and v > 0]
-            if len(nums) >= 2:
-                # choose largest as views, smallest as followers
-                views = max(nums)
-                followers = min(nums)
-                if views > 0:
-                    return followers / views
+    for ri in sheet.label_rows('TOTAL', upper=True):
+        nums = [v for v in (_to_float(c) for c in sheet.rows[ri][1:]) if v is not None and v > 0]
+        if len(nums) >= 2:
+            # choose largest as views, smallest as followers
+            views = max(nums)
+            followers = min(nums)
+            if views > 0:
+                return followers / views
     return None
 
 
-def _extract_carebears_views_per_post(rows: List[List[str]]) -> Dict[str, float]:
+# Brand headers that end the Care Bears block in Competitor Benchmarks
+_BENCHMARK_BRANDS = ('Barbie', 'Strawberry Shortcake', 'Peanuts', 'Hello Kitty', 'Squishmallows', 'CreativeInc')
+
+
+def _extract_carebears_views_per_post(sheet: SheetIndex) -> Dict[str, float]:
     """Return approximate views per post per platform using the Care Bears block in Competitor Benchmarks."""
     out: Dict[str, float] = {}
-    active = False
-    for r in rows:
+    hits = sheet.find_containing('Care Bears')
+    if not hits:
+        return out
+    start = hits[0][0]
+    # Stop if another brand header appears
+    stop = next((ri for ri in sheet.label_rows(*_BENCHMARK_BRANDS) if ri > start), len(sheet))
+    for ri in range(start + 1, stop):
+        r = sheet.rows[ri]
         if not r:
             continue
-        if not active and any('Care Bears' in str(c) for c in r):
-            active = True
-            continue
-        if active:
-            label = str(r[0]).strip()
-            # Stop if another brand header appears
-            if label in ('Barbie', 'Strawberry Shortcake', 'Peanuts', 'Hello Kitty', 'Squishmallows', 'CreativeInc'):
-                break
-            posts = _to_float(r[1]) if len(r) > 1 else None
-            views = _to_float(r[2]) if len(r) > 2 else None
-            if posts and views and posts > 0:
-                if label.startswith('IG Reels'):
-                    out['Instagram'] = views / posts
-                elif label.startswith('FB Reels'):
-                    out['Facebook'] = views / posts
-                elif label.startswith('TT') or label.startswith('TikTok'):
-                    out['TikTok'] = views / posts
-                elif label.startswith('YT') or label.startswith('YouTube'):
-                    out['YouTube'] = views / posts
+        label = str(r[0]).strip()
+        posts = _to_float(r[1]) if len(r) > 1 else None
+        views = _to_float(r[2]) if len(r) > 2 else None
+        if posts and views and posts > 0:
+            if label.startswith('IG Reels'):
+                out['Instagram'] = views / posts
+            elif label.startswith('FB Reels'):
+                out['Facebook'] = views / posts
+            elif label.startswith('TT') or label.startswith('TikTok'):
+                out['TikTok'] = views / posts
+            elif label.startswith('YT') or label.startswith('YouTube'):
+                out['YouTube'] = views / posts
     return out
 
 
-def _extract_cpf_overrides(rows: List[List[str]]) -> Dict[str, Dict[str, float]]:
+def _extract_cpf_overrides(sheet: SheetIndex) -> Dict[str, Dict[str, float]]:
     """Extract CPF midpoints from TOTAL rows across the two tables.
     Returns dict with keys: cpf_paid_mid, cpf_creator_mid.
     """
@@ -221,9 +420,9 @@ def _extract_cpf_overrides(rows: List[List[str]]) -> Dict[str, Dict[str, float]]
     cpf_creator_vals: List[float] = []
 
     table = 0
-    for r in rows:
-        if not r:
-            continue
+    # Only table headers, TOTAL and Creators rows matter; visit them in sheet order
+    for ri in sheet.label_rows('Channel', 'TOTAL', 'Creators'):
+        r = sheet.rows[ri]
         if r[0] == 'Channel' and 'Est CPV' in r:
             table = 2
             continue
@@ -254,19 +453,46 @@ def _extract_cpf_overrides(rows: List[List[str]]) -> Dict[str, Dict[str, float]]
     }
 
 
-def load_calibration_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
-    rows_by_sheet = _xlsx_read_rows(xlsx_path)
+# Override keys produced by load_calibration_from_xlsx
+CALIBRATION_KEYS = (
+    'base_monthly_rate',
+    'platform_monthly_cap',
+    'per_post_gain_base',
+    'cpf_paid',
+    'cpf_creator',
+    'month_decay_per_month',
+)
+
+# Sheets read by load_calibration_from_xlsx
+CALIBRATION_SHEETS = (
+    'Historical Growth',
+    'Projected Follower Growth',
+    'Views and Engagements past 8 mo',
+    'Competitor Benchmarks',
+    'Paid and Creators CPT',
+)
+
+
+def load_calibration_from_xlsx(xlsx_path: Path, diagnostics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Derive calibration overrides from the KPI workbook.
+
+    When `diagnostics` is given it is filled with what each extractor found
+    (sheet presence/row counts and the intermediate values behind the overrides).
+    """
+    rows_by_sheet = XlsxWorkbook(xlsx_path)
 
     # Historical MoM floors
-    hist = _extract_historical_mom(rows_by_sheet.get('Historical Growth', []))
+    hist = _extract_historical_mom(rows_by_sheet.index('Historical Growth'))
     # Projected MoM bounds
-    proj = _extract_projected_mom(rows_by_sheet.get('Projected Follower Growth', []))
+    proj = _extract_projected_mom(rows_by_sheet.index('Projected Follower Growth'))
     # Followers per view
-    fpv = _extract_followers_per_view(rows_by_sheet.get('Views and Engagements past 8 mo', []))
+    fpv = _extract_followers_per_view(rows_by_sheet.index('Views and Engagements past 8 mo'))
     # Views per post per platform from Care Bears block
-    vpp = _extract_carebears_views_per_post(rows_by_sheet.get('Competitor Benchmarks', []))
+    vpp = _extract_carebears_views_per_post(rows_by_sheet.index('Competitor Benchmarks'))
+    # Platforms missing from the benchmark block use views/post from platform_metrics.json
+    metrics_vpp = {k: v for k, v in views_per_post_from_metrics().items() if k not in vpp}
     # CPF overrides from paid/creator tables
-    cpf = _extract_cpf_overrides(rows_by_sheet.get('Paid and Creators CPT', []))
+    cpf = _extract_cpf_overrides(rows_by_sheet.index('Paid and Creators CPT'))
 
     # Build overrides
     base_monthly_rate = hist if hist else None
@@ -277,8 +503,8 @@ def load_calibration_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
         platform_monthly_cap = {k: min(max(v * 1.6, 0.04), 0.15) for k, v in proj.items()}
 
     per_post_gain_base = None
-    if fpv and vpp:
-        per_post_gain_base = {k: max(fpv * v, 1.0) for k, v in vpp.items()}
+    if fpv and (vpp or metrics_vpp):
+        per_post_gain_base = {k: max(fpv * v, 1.0) for k, v in {**metrics_vpp, **vpp}.items()}
 
     out = {
         'base_monthly_rate': base_monthly_rate,
@@ -289,9 +515,108 @@ def load_calibration_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
         # seasonality: gentle 2% monthly decay to align with slowing growth chart
         'month_decay_per_month': 0.02,
     }
+    if diagnostics is not None:
+        diagnostics['sheets'] = {
+            name: {'present': name in rows_by_sheet, 'rows': len(rows_by_sheet.get(name, []))}
+            for name in CALIBRATION_SHEETS
+        }
+        diagnostics['historical_mom'] = hist
+        diagnostics['projected_mom'] = proj
+        diagnostics['followers_per_view'] = fpv
+        diagnostics['views_per_post'] = vpp
+        diagnostics['views_per_post_from_metrics'] = metrics_vpp
+        diagnostics['defaulted'] = [k for k in CALIBRATION_KEYS if out.get(k) is None]
     return out
 
 
+# Default KPI workbook shipped with the frontend
+DEFAULT_WORKBOOK = Path(__file__).resolve().parents[2] / 'public' / 'Care Bears Audience Growth KPis .xlsx'
+# Server-side workbook paths taken from API callers must resolve inside one of these
+WORKBOOK_DIRS: Tuple[Path, ...] = (DEFAULT_WORKBOOK.parent,)
+
+
+def resolve_workbook_path(sheet_path: Optional[str], extra_dirs: Tuple[Path, ...] = ()) -> Path:
+    """Resolve a caller-supplied workbook path; empty means the bundled workbook.
+
+    Raises ValueError for paths outside WORKBOOK_DIRS (plus `extra_dirs`), so API
+    callers cannot point the parsers or caches at arbitrary server files.
+    """
+    if not sheet_path:
+        return DEFAULT_WORKBOOK
+    path = Path(sheet_path).resolve()
+    if not any(path.is_relative_to(Path(root).resolve()) for root in (*WORKBOOK_DIRS, *extra_dirs)):
+        raise ValueError("sheet_path is outside the allowed workbook directories")
+    return path
+
+_CALIB_CACHE_MAX = 32
+_CALIB_LOCK = threading.Lock()
+# resolved path -> {"stamp": (mtime_ns, size, metrics version), "overrides": ..., "fingerprint": ...}
+_CALIB_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def calibration_fingerprint(overrides: Dict[str, Any], metrics: Optional[str] = None) -> str:
+    """Stable digest of calibration overrides (and the platform metrics version they used),
+    for keying downstream result caches."""
+    data = {k: overrides.get(k) for k in CALIBRATION_KEYS}
+    if metrics:
+        data['_metrics'] = metrics
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def _stamp(path: Path) -> Tuple[int, int, Optional[str]]:
+    """Workbook version plus the platform_metrics.json version, which feeds per_post_gain_base."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size, metrics_version())
+
+
+def peek_calibration_cached(xlsx_path: Path) -> Optional[Dict[str, Any]]:
+    """Cached calibration entry if it is current for the workbook on disk, else None (never parses)."""
+    path = Path(xlsx_path).resolve()
+    entry = _CALIB_CACHE.get(str(path))
+    if entry is not None and entry['stamp'] == _stamp(path):
+        return entry
+    return None
+
+
+def store_calibration(xlsx_path: Path, overrides: Dict[str, Any], stamp: Tuple[int, int, Optional[str]]) -> Dict[str, Any]:
+    """Publish overrides derived elsewhere (e.g. a background job) for a workbook version."""
+    key = str(Path(xlsx_path).resolve())
+    entry = {
+        'path': key,
+        'stamp': stamp,
+        'overrides': overrides,
+        'fingerprint': calibration_fingerprint(overrides, stamp[2]),
+    }
+    with _CALIB_LOCK:
+        _CALIB_CACHE.pop(key, None)
+        while len(_CALIB_CACHE) >= _CALIB_CACHE_MAX:
+            _CALIB_CACHE.pop(next(iter(_CALIB_CACHE)))
+        _CALIB_CACHE[key] = entry
+    return entry
+
+
+def evict_calibration(xlsx_path: Path) -> None:
+    """Drop a workbook's cached calibration (it is re-derived on next use)."""
+    with _CALIB_LOCK:
+        _CALIB_CACHE.pop(str(Path(xlsx_path).resolve()), None)
+
+
+def get_calibration_cached(xlsx_path: Path) -> Dict[str, Any]:
+    """Calibration overrides for a workbook, re-derived only when its mtime or size (or the
+    platform metrics file) change.
+
+    Returns an immutable entry with keys path, overrides and fingerprint; callers
+    must not mutate the override dicts.
+    """
+    path = Path(xlsx_path).resolve()
+    entry = peek_calibration_cached(path)
+    if entry is not None:
+        return entry
+    stamp = _stamp(path)
+    return store_calibration(path, load_calibration_from_xlsx(path), stamp)
+
+
 def _excel_serial_to_date(serial: float) -> datetime:
     """Convert Excel serial number to datetime."""
     from datetime import timedelta
@@ -300,15 +625,54 @@ def _excel_serial_to_date(serial: float) -> datetime:
     return datetime(1899, 12, 30) + timedelta(days=serial)
 
 
+def _fill_series_gaps(series: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Fill NaN gaps in a follower series; returns (values, filled mask).
+
+    Interior gaps are linearly interpolated between the neighbouring known
+    points; leading/trailing gaps are extrapolated from the first/last two
+    known points and clamped at zero. A single known point is repeated.
+    """
+    out = series.copy()
+    missing = np.isnan(series)
+    known = np.flatnonzero(~missing)
+    if len(known) == 0:
+        return out, np.zeros(len(series), dtype=bool)
+    if len(known) == 1:
+        out[missing] = series[known[0]]
+        return out, missing
+    idx = np.flatnonzero(missing)
+    pos = np.searchsorted(known, idx)
+
+    inner = (pos > 0) & (pos < len(known))
+    i = idx[inner]
+    bi, ai = known[pos[inner] - 1], known[pos[inner]]
+    bv, av = series[bi], series[ai]
+    out[i] = bv + (av - bv) * ((i - bi) / (ai - bi))
+
+    i = idx[pos == len(known)]
+    if len(i):
+        i1, i2 = known[-2], known[-1]
+        growth = (series[i2] - series[i1]) / (i2 - i1)
+        out[i] = np.maximum(series[i2] + growth * (i - i2), 0.0)
+
+    i = idx[pos == 0]
+    if len(i):
+        i1, i2 = known[0], known[1]
+        growth = (series[i2] - series[i1]) / (i2 - i1)
+        out[i] = np.maximum(series[i1] - growth * (i1 - i), 0.0)
+    return out, missing
+
+
 def load_follower_history_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
     """Parse follower history from the workbook.
     Prefers the 'Care Bears Data' tab with explicit per-month, per-platform values.
     Falls back to 'Growth Chart' tab, then reconstructing from 'Historical Growth' if needed.
     """
-    rows_by_sheet = _xlsx_read_rows(xlsx_path)
+    rows_by_sheet = XlsxWorkbook(xlsx_path)
 
     # 0) Try 'Care Bears Data' sheet first (new preferred source)
-    cbd = rows_by_sheet.get('Care Bears Data', [])
+    cbd_index = rows_by_sheet.index('Care Bears Data')
+    cbd = cbd_index.rows
     if cbd and len(cbd) >= 6:
         # Find the rows by looking for platform names in column A
         # The sheet has multiple sections (Followers, # of posts, Engagement %, Views)
@@ -317,7 +681,9 @@ def load_follower_history_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
         platform_rows: Dict[str, List[str]] = {}
         in_followers_section = False
 
-        for r in cbd:
+        # Nothing before the first "Followers" label can be captured, so start there
+        followers_at = cbd_index.label_rows('Followers')
+        for r in (cbd[followers_at[0]:] if followers_at else []):
             if not r:
                 # Empty row might signal end of section
                 if in_followers_section and platform_rows:
@@ -386,71 +752,28 @@ def load_follower_history_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
             if data_rows:
                 # Interpolate missing platform data to avoid jumps
                 platforms = ["Instagram", "TikTok", "YouTube", "Facebook"]
-
-                for pname in platforms:
-                    # Collect indices where we have data
-                    vals = [(i, data_rows[i].get(pname)) for i in range(len(data_rows))]
-                    known = [(i, v) for i, v in vals if v is not None]
-
-                    if len(known) < 2:
-                        # Not enough data to interpolate - use first/last known value
-                        if known:
-                            single_val = known[0][1]
-                            single_idx = known[0][0]
-                            # Mark all as interpolated except the known one
-                            for i in range(len(data_rows)):
-                                if i != single_idx:
-                                    data_rows[i][pname] = single_val
-                                    data_rows[i][f'{pname}_interpolated'] = True
-                        continue
-
-                    # Linear interpolation for gaps
-                    for i in range(len(data_rows)):
-                        if data_rows[i].get(pname) is None:
-                            # Find nearest known values before and after
-                            before = [(idx, v) for idx, v in known if idx < i]
-                            after = [(idx, v) for idx, v in known if idx > i]
-
-                            if before and after:
-                                # Interpolate between
-                                bi, bv = before[-1]
-                                ai, av = after[0]
-                                ratio = (i - bi) / (ai - bi)
-                                interpolated = bv + (av - bv) * ratio
-                                data_rows[i][pname] = float(interpolated)
-                                data_rows[i][f'{pname}_interpolated'] = True
-                            elif before:
-                                # Extrapolate forward using last known growth rate
-                                if len(before) >= 2:
-                                    (i1, v1), (i2, v2) = before[-2], before[-1]
-                                    monthly_growth = (v2 - v1) / (i2 - i1) if i2 != i1 else 0
-                                    extrapolated = v2 + monthly_growth * (i - i2)
-                                else:
-                                    extrapolated = before[-1][1]
-                                data_rows[i][pname] = float(max(extrapolated, 0))
-                                data_rows[i][f'{pname}_interpolated'] = True
-                            elif after:
-                                # Extrapolate backward
-                                if len(after) >= 2:
-                                    (i1, v1), (i2, v2) = after[0], after[1]
-                                    monthly_growth = (v2 - v1) / (i2 - i1) if i2 != i1 else 0
-                                    extrapolated = v1 - monthly_growth * (i1 - i)
-                                else:
-                                    extrapolated = after[0][1]
-                                data_rows[i][pname] = float(max(extrapolated, 0))
-                                data_rows[i][f'{pname}_interpolated'] = True
+                n_rows = len(data_rows)
+                values = np.full((len(platforms), n_rows), np.nan)
+                for i, row in enumerate(data_rows):
+                    for j, pname in enumerate(platforms):
+                        v = row.get(pname)
+                        if v is not None:
+                            values[j, i] = v
+                filled = np.zeros(values.shape, dtype=bool)
+                for j, pname in enumerate(platforms):
+                    values[j], filled[j] = _fill_series_gaps(values[j])
+                    for i in np.flatnonzero(filled[j]).tolist():
+                        data_rows[i][pname] = float(values[j, i])
+                        data_rows[i][f'{pname}_interpolated'] = True
 
                 # Recalculate totals and mark if any component was interpolated
-                for row in data_rows:
-                    total = 0.0
-                    any_interpolated = False
-                    for pname in platforms:
-                        if pname in row and row[pname] is not None:
-                            total += row[pname]
-                            if row.get(f'{pname}_interpolated'):
-                                any_interpolated = True
-                    row['Total'] = float(total)
-                    if any_interpolated:
+                totals = np.zeros(n_rows)
+                for j in range(len(platforms)):
+                    totals = totals + np.where(np.isnan(values[j]), 0.0, values[j])
+                any_interpolated = filled.any(axis=0)
+                for i, row in enumerate(data_rows):
+                    row['Total'] = float(totals[i])
+                    if any_interpolated[i]:
                         row['Total_interpolated'] = True
 
                 # Mark Dec 2025 as interpolated (projected/estimated data)
@@ -581,16 +904,13 @@ def load_follower_history_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
             return build_from_table(header, table, hint_end)
 
     # 2) Fallback: reconstruct from Historical Growth (start/end)
-    rows = rows_by_sheet.get('Historical Growth', [])
+    hist_index = rows_by_sheet.index('Historical Growth')
     def find_row(prefix: str) -> Optional[List[float]]:
-        for r in rows:
-            if not r:
-                continue
-            if str(r[0]).strip() == prefix:
-                nums = [_to_float(c) for c in r[1:6]]
-                nums = [n for n in nums if n is not None]
-                if len(nums) >= 2 and nums[0] > 0 and nums[1] > 0:
-                    return nums[:2]
+        for ri in hist_index.label_rows(prefix):
+            nums = [_to_float(c) for c in hist_index.rows[ri][1:6]]
+            nums = [n for n in nums if n is not None]
+            if len(nums) >= 2 and nums[0] > 0 and nums[1] > 0:
+                return nums[:2]
         return None
 
     series: Dict[str, List[float]] = {}
@@ -601,10 +921,7 @@ def load_follower_history_from_xlsx(xlsx_path: Path) -> Dict[str, Any]:
         if not vals:
             continue
         start, end = vals
-        try:
-            r = (end / start) ** (1.0 / count_months) - 1.0 if start > 0 else 0.0
-        except Exception:
-            r = 0.0
+        r = compound_monthly_rate(start, end, count_months)
         seq = [start * ((1 + r) ** i) for i in range(0, count_months + 1)]
         series[pname] = [float(x) for x in seq]
 
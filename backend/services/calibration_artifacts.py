@@ -0,0 +1,196 @@
+"""
+Compiled calibration artifacts.
+
+The KPI workbook is compiled offline into a small versioned JSON artifact
+(overrides + source hash + extraction diagnostics) so the API never opens the
+workbook on the request path:
+
+    cd backend
+    python -m services.calibration_artifacts compile "../public/Care Bears Audience Growth KPis .xlsx"
+    python -m services.calibration_artifacts list
+
+Forecast requests then reference the artifact with `calibration_id`.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from services.calibration import (
+    CALIBRATION_KEYS,
+    DEFAULT_WORKBOOK,
+    calibration_fingerprint,
+    load_calibration_from_xlsx,
+)
+from services.platform_metrics import metrics_version
+
+ARTIFACT_DIR = Path(os.getenv("CALIBRATION_DIR", Path(__file__).resolve().parent.parent / "data" / "calibrations"))
+FORMAT_VERSION = 1
+# Parsed artifacts kept in memory (least recently used are dropped first)
+ARTIFACT_CACHE_SIZE = int(os.getenv("CALIBRATION_ARTIFACT_CACHE", "32"))
+
+_ID_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$')
+_LOCK = threading.Lock()
+# artifact id -> (stamp, artifact), in LRU order
+_LOADED: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def validate_id(artifact_id: str) -> str:
+    if not artifact_id or not _ID_RE.match(artifact_id):
+        raise ValueError(f"Invalid calibration id '{artifact_id}' (letters, digits, '.', '_' and '-' only)")
+    return artifact_id
+
+
+def _slug(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-').lower()[:40] or 'workbook'
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def artifact_path(artifact_id: str, out_dir: Optional[Path] = None) -> Path:
+    return Path(out_dir or ARTIFACT_DIR) / f"{validate_id(artifact_id)}.json"
+
+
+def compile_workbook(xlsx_path: Path, artifact_id: Optional[str] = None, source_name: Optional[str] = None) -> Dict[str, Any]:
+    """Run the workbook extractors once and package the result as an artifact.
+    `source_name` labels the workbook when `xlsx_path` is a temporary copy (uploads).
+    """
+    xlsx_path = Path(xlsx_path)
+    source_name = source_name or xlsx_path.name
+    digest = _sha256(xlsx_path)
+    artifact_id = validate_id(artifact_id or f"{_slug(Path(source_name).stem)}-{digest[:12]}")
+    metrics = metrics_version()
+    diagnostics: Dict[str, Any] = {}
+    overrides = load_calibration_from_xlsx(xlsx_path, diagnostics=diagnostics)
+    return {
+        "format_version": FORMAT_VERSION,
+        "id": artifact_id,
+        "compiled_at": datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        "source": {"name": source_name, "sha256": digest, "size": xlsx_path.stat().st_size, "metrics_version": metrics},
+        "overrides": {k: overrides.get(k) for k in CALIBRATION_KEYS},
+        "fingerprint": calibration_fingerprint(overrides, metrics),
+        "diagnostics": diagnostics,
+    }
+
+
+def artifact_exists(artifact_id: str, out_dir: Optional[Path] = None) -> bool:
+    return artifact_path(artifact_id, out_dir).exists()
+
+
+def write_artifact(artifact: Dict[str, Any], out_dir: Optional[Path] = None, overwrite: bool = True) -> Path:
+    """Atomically write an artifact as compact JSON; returns its path.
+    With overwrite=False an existing artifact is never replaced (raises ValueError).
+    """
+    target = artifact_path(artifact["id"], out_dir)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_text(json.dumps(artifact, separators=(',', ':'), default=str))
+    if overwrite:
+        os.replace(tmp, target)
+        return target
+    try:
+        # link() fails if the target exists, so concurrent writers cannot clobber each other
+        os.link(tmp, target)
+    except FileExistsError:
+        raise ValueError(f"Calibration id '{artifact['id']}' already exists")
+    finally:
+        tmp.unlink()
+    return target
+
+
+def load_artifact(artifact_id: str) -> Dict[str, Any]:
+    """Load a compiled artifact, memoized until the file changes. Raises ValueError if unknown."""
+    path = artifact_path(artifact_id)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise ValueError(f"Unknown calibration id '{artifact_id}'")
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _LOCK:
+        cached = _LOADED.get(artifact_id)
+        if cached is not None and cached[0] == stamp:
+            _LOADED.move_to_end(artifact_id)
+            return cached[1]
+        artifact = json.loads(path.read_text())
+        if artifact.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Calibration '{artifact_id}' has format version {artifact.get('format_version')}; "
+                f"recompile it (expected {FORMAT_VERSION})"
+            )
+        _LOADED[artifact_id] = (stamp, artifact)
+        _LOADED.move_to_end(artifact_id)
+        while len(_LOADED) > max(ARTIFACT_CACHE_SIZE, 1):
+            _LOADED.popitem(last=False)
+    return artifact
+
+
+def evict_artifact(artifact_id: str) -> None:
+    """Drop a parsed artifact from memory (it is re-read from disk on next use)."""
+    with _LOCK:
+        _LOADED.pop(artifact_id, None)
+
+
+def list_artifacts(out_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for p in sorted(Path(out_dir or ARTIFACT_DIR).glob('*.json')):
+        try:
+            a = json.loads(p.read_text())
+        except (OSError, ValueError):
+            continue
+        if not isinstance(a, dict) or "overrides" not in a:
+            continue
+        out.append({
+            "id": a.get("id"),
+            "compiled_at": a.get("compiled_at"),
+            "source": a.get("source"),
+            "fingerprint": a.get("fingerprint"),
+        })
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m services.calibration_artifacts", description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_compile = sub.add_parser("compile", help="Compile a KPI workbook into a calibration artifact")
+    p_compile.add_argument("workbook", nargs="?", default=str(DEFAULT_WORKBOOK), help="Path to the .xlsx workbook")
+    p_compile.add_argument("--id", dest="artifact_id", default=None, help="Artifact id (defaults to <workbook>-<sha256[:12]>)")
+    p_compile.add_argument("--out", default=None, help=f"Output directory (default: {ARTIFACT_DIR})")
+
+    p_list = sub.add_parser("list", help="List compiled artifacts")
+    p_list.add_argument("--out", default=None, help=f"Artifact directory (default: {ARTIFACT_DIR})")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "compile":
+            artifact = compile_workbook(Path(args.workbook), args.artifact_id)
+            path = write_artifact(artifact, Path(args.out) if args.out else None)
+            print(f"Wrote {path}")
+            print(json.dumps({"id": artifact["id"], "fingerprint": artifact["fingerprint"],
+                              "defaulted": artifact["diagnostics"].get("defaulted")}, indent=2))
+        else:
+            print(json.dumps(list_artifacts(Path(args.out) if args.out else None), indent=2))
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
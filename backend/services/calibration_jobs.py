@@ -0,0 +1,170 @@
+"""
+Background calibration jobs.
+
+Workbook parsing runs on the `calibration` executor pool instead of inside
+request handlers. Each job records its status and timings; results are
+published to the calibration cache (and, for API-submitted jobs, compiled into
+an artifact that forecasts can reference by `calibration_id`).
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from services.calibration import _stamp, peek_calibration_cached, store_calibration
+from services.calibration_artifacts import compile_workbook, write_artifact
+from services.executors import POOLS
+
+# Finished jobs kept for status polling
+MAX_JOBS = 200
+
+_LOCK = threading.Lock()
+_JOBS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_FUTURES: Dict[str, Future] = {}
+# (resolved path, stamp) -> id of the queued/running job for that workbook version
+_ACTIVE: Dict[tuple, str] = {}
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat(timespec='milliseconds') + 'Z'
+
+
+def _public(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in job.items() if not k.startswith('_')}
+
+
+def _run(job_id: str) -> Dict[str, Any]:
+    job = _JOBS[job_id]
+    started = time.perf_counter()
+    job.update(status="running", started_at=_now())
+    job["timings"]["queued_ms"] = round((started - job["_submitted"]) * 1000, 2)
+    path: Path = job["_path"]
+    try:
+        stamp = _stamp(path)
+        artifact = compile_workbook(path, job["_artifact_id"], source_name=job["source"] if job["_cleanup"] else None)
+        parsed = time.perf_counter()
+        job["timings"]["parse_ms"] = round((parsed - started) * 1000, 2)
+        result: Dict[str, Any] = {
+            "fingerprint": artifact["fingerprint"],
+            "defaulted": artifact["diagnostics"].get("defaulted"),
+        }
+        if job["_publish_artifact"]:
+            # Caller-chosen ids are never overwritten; derived ids are content hashes
+            write_artifact(artifact, overwrite=job["_artifact_id"] is None)
+            result["calibration_id"] = artifact["id"]
+        if not job["_cleanup"]:
+            store_calibration(path, artifact["overrides"], stamp)
+            result["path"] = str(path)
+        job.update(status="succeeded", result=result)
+        return artifact
+    except Exception as e:
+        job.update(status="failed", error=str(e))
+        raise
+    finally:
+        job["finished_at"] = _now()
+        job["timings"]["total_ms"] = round((time.perf_counter() - job["_submitted"]) * 1000, 2)
+        with _LOCK:
+            _FUTURES.pop(job_id, None)
+            if job.get("_key") is not None and _ACTIVE.get(job["_key"]) == job_id:
+                _ACTIVE.pop(job["_key"], None)
+        if job["_cleanup"]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _trim_jobs() -> None:
+    """Evict the oldest finished jobs beyond MAX_JOBS; queued and running jobs are kept. Caller holds _LOCK."""
+    excess = len(_JOBS) - MAX_JOBS
+    if excess <= 0:
+        return
+    finished = [job_id for job_id, job in _JOBS.items() if job["status"] not in ("queued", "running")]
+    for job_id in finished[:excess]:
+        del _JOBS[job_id]
+
+
+def _submit(path: Path, source: str, artifact_id: Optional[str], publish_artifact: bool, cleanup: bool) -> Dict[str, Any]:
+    path = path.resolve()
+    key = None if cleanup else (str(path), _stamp(path))
+    with _LOCK:
+        # Coalesce onto a job already working on this exact workbook version
+        if key is not None and key in _ACTIVE:
+            existing = _JOBS[_ACTIVE[key]]
+            if not publish_artifact or (existing["_publish_artifact"] and artifact_id in (None, existing["_artifact_id"])):
+                return existing
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "id": job_id,
+            "status": "queued",
+            "source": source,
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+            "timings": {},
+            "result": None,
+            "error": None,
+            "_path": path,
+            "_key": key,
+            "_artifact_id": artifact_id,
+            "_publish_artifact": publish_artifact,
+            "_cleanup": cleanup,
+            "_submitted": time.perf_counter(),
+        }
+        _JOBS[job_id] = job
+        _trim_jobs()
+        if key is not None:
+            _ACTIVE[key] = job_id
+        _FUTURES[job_id] = POOLS["calibration"].submit(_run, job_id)
+    return job
+
+
+def submit_workbook(xlsx_path: Path, artifact_id: Optional[str] = None, publish_artifact: bool = True) -> Dict[str, Any]:
+    """Queue calibration of a workbook on disk; returns the job status."""
+    path = Path(xlsx_path)
+    if not path.exists():
+        raise ValueError(f"Workbook not found: {xlsx_path}")
+    return _public(_submit(path, str(path), artifact_id, publish_artifact, cleanup=False))
+
+
+def submit_upload(tmp_path: Path, filename: str, artifact_id: Optional[str] = None) -> Dict[str, Any]:
+    """Queue calibration of an uploaded workbook; the temp file is removed when the job ends."""
+    return _public(_submit(Path(tmp_path), filename, artifact_id, publish_artifact=True, cleanup=True))
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    job = _JOBS.get(job_id)
+    return _public(job) if job is not None else None
+
+
+def list_jobs(limit: int = 20) -> List[Dict[str, Any]]:
+    jobs = list(_JOBS.values())[-limit:]
+    return [_public(j) for j in reversed(jobs)]
+
+
+async def ensure_calibration(xlsx_path: Path) -> Dict[str, Any]:
+    """Calibration cache entry for a workbook without parsing on the event loop.
+
+    Cache hits return immediately; misses queue (or join) a background job and
+    await it, so concurrent requests for the same workbook share one parse.
+    """
+    entry = peek_calibration_cached(xlsx_path)
+    if entry is not None:
+        return entry
+    job = _submit(Path(xlsx_path), str(xlsx_path), None, publish_artifact=False, cleanup=False)
+    fut = _FUTURES.get(job["id"])
+    if fut is not None:
+        await asyncio.wrap_future(fut)
+    elif job["status"] == "failed":
+        raise ValueError(job["error"])
+    entry = peek_calibration_cached(xlsx_path)
+    if entry is None:
+        raise ValueError(f"Calibration for {xlsx_path} is not available (workbook changed while parsing)")
+    return entry
@@ -0,0 +1,177 @@
+"""
+Named calibration profiles (per brand, quarter or scenario).
+
+Profiles are defined in data/calibrations/profiles.json and point either at a
+compiled artifact (`calibration_id`) or at a workbook (`sheet_path`). Resolved
+profiles stay resident in a size-bounded LRU; when a profile is evicted, the
+artifact or workbook calibration behind it is dropped from memory too (unless
+another resident profile shares it). Forecasts select profiles with
+`calibration_profile`.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from services.calibration import DEFAULT_WORKBOOK, evict_calibration, peek_calibration_cached, resolve_workbook_path
+from services.calibration_artifacts import ARTIFACT_DIR, artifact_exists, evict_artifact, load_artifact, validate_id
+from services.calibration_jobs import ensure_calibration
+from services.executors import run_data
+
+PROFILES_FILE = ARTIFACT_DIR / "profiles.json"
+PROFILE_CACHE_SIZE = int(os.getenv("CALIBRATION_PROFILE_CACHE", "16"))
+
+# Always available unless profiles.json redefines it
+BUILTIN_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {"sheet_path": str(DEFAULT_WORKBOOK), "description": "Bundled Care Bears KPI workbook"},
+}
+
+
+class CalibrationProfileRegistry:
+    """Profile definitions plus an LRU of resolved overrides."""
+
+    def __init__(self, path: Path, capacity: int = PROFILE_CACHE_SIZE):
+        self.path = Path(path)
+        self.capacity = max(int(capacity), 1)
+        self._lock = threading.Lock()
+        self._defs: Dict[str, Dict[str, Any]] = {}
+        self._defs_stamp: Optional[tuple] = None
+        # name -> {"definition": ..., "source": underlying cache entry, "profile": resolved profile}
+        self._resident: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _stamp(self) -> Optional[tuple]:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def definitions(self) -> Dict[str, Dict[str, Any]]:
+        stamp = self._stamp()
+        if stamp != self._defs_stamp:
+            with self._lock:
+                defs = dict(BUILTIN_PROFILES)
+                if stamp is not None:
+                    defs.update(json.loads(self.path.read_text()).get("profiles", {}))
+                self._defs, self._defs_stamp = defs, stamp
+        return self._defs
+
+    def _write(self, profiles: Dict[str, Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp.write_text(json.dumps({"profiles": profiles}, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
+
+    def _stored(self) -> Dict[str, Dict[str, Any]]:
+        if self._stamp() is None:
+            return {}
+        return dict(json.loads(self.path.read_text()).get("profiles", {}))
+
+    def define(self, name: str, calibration_id: Optional[str] = None, sheet_path: Optional[str] = None,
+               description: Optional[str] = None) -> Dict[str, Any]:
+        """Create or replace a profile; exactly one of calibration_id / sheet_path is required.
+        The artifact must already be compiled, and workbooks must live in the bundled workbook directory.
+        """
+        validate_id(name)
+        if bool(calibration_id) == bool(sheet_path):
+            raise ValueError("A profile needs exactly one of calibration_id or sheet_path")
+        definition: Dict[str, Any] = {"description": description}
+        if calibration_id:
+            if not artifact_exists(validate_id(calibration_id)):
+                raise ValueError(f"Unknown calibration id '{calibration_id}'")
+            definition["calibration_id"] = calibration_id
+        else:
+            path = resolve_workbook_path(sheet_path)
+            if not path.exists():
+                raise ValueError(f"Workbook not found: {sheet_path}")
+            definition["sheet_path"] = str(path)
+        with self._lock:
+            profiles = self._stored()
+            profiles[name] = definition
+            self._write(profiles)
+            self._drop(name)
+        return {"name": name, **definition}
+
+    def delete(self, name: str) -> bool:
+        with self._lock:
+            profiles = self._stored()
+            if name not in profiles:
+                return False
+            del profiles[name]
+            self._write(profiles)
+            self._drop(name)
+        return True
+
+    def list(self) -> List[Dict[str, Any]]:
+        out = []
+        for name, definition in sorted(self.definitions().items()):
+            entry = self._resident.get(name)
+            out.append({
+                "name": name,
+                **definition,
+                "resident": entry is not None,
+                "fingerprint": entry["profile"]["fingerprint"] if entry else None,
+            })
+        return out
+
+    def _current_source(self, definition: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Underlying cache entry if it is already loaded and current (never parses)."""
+        if definition.get("calibration_id"):
+            return load_artifact(definition["calibration_id"])
+        path = Path(definition["sheet_path"])
+        return peek_calibration_cached(path) if path.exists() else None
+
+    def _drop(self, name: str) -> None:
+        """Remove a resident profile and release its source unless another resident profile shares it.
+        Caller holds _lock.
+        """
+        entry = self._resident.pop(name, None)
+        if entry is None or any(e["source"] is entry["source"] for e in self._resident.values()):
+            return
+        definition = entry["definition"]
+        if definition.get("calibration_id"):
+            evict_artifact(definition["calibration_id"])
+        else:
+            evict_calibration(Path(definition["sheet_path"]))
+
+    def _lookup(self, name: str) -> tuple:
+        definition = self.definitions().get(name)
+        if definition is None:
+            raise ValueError(f"Unknown calibration profile '{name}'")
+        return definition, self._current_source(definition)
+
+    async def resolve(self, name: str) -> Dict[str, Any]:
+        """Resolved profile {name, fingerprint, overrides}; raises ValueError for unknown names."""
+        # Reading profiles.json and stat-ing/loading artifacts is file I/O
+        definition, source = await run_data(self._lookup, name)
+        entry = self._resident.get(name)
+        if entry is not None and source is not None and entry["source"] is source:
+            with self._lock:
+                if name in self._resident:
+                    self._resident.move_to_end(name)
+            return entry["profile"]
+
+        if source is None:
+            path = Path(definition["sheet_path"])
+            if not path.exists():
+                raise ValueError(f"Workbook for profile '{name}' not found: {path}")
+            source = await ensure_calibration(path)
+        profile = {
+            "name": name,
+            "fingerprint": source["fingerprint"],
+            "overrides": source["overrides"],
+        }
+        with self._lock:
+            self._resident.pop(name, None)
+            self._resident[name] = {"definition": definition, "source": source, "profile": profile}
+            while len(self._resident) > self.capacity:
+                self._drop(next(iter(self._resident)))
+        return profile
+
+
+registry = CalibrationProfileRegistry(PROFILES_FILE)
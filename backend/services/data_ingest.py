@@ -0,0 +1,167 @@
+"""
+Streaming ingestion of YouScan social-listening exports (CSV/XLSX).
+
+Uploads are parsed in fixed-size row chunks, cleaned the same way as the
+historical loaders, written to a versioned snapshot under data/snapshots and
+then atomically swapped in as the live source file. Only the newest
+DATA_SNAPSHOT_KEEP snapshots per dataset are kept (0 keeps all).
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from services.forecast_service import _clean_columns, _parse_time, reload_historical_data
+
+# Upload dataset name -> live source file and column expectations
+DATASETS: Dict[str, Dict[str, Any]] = {
+    "mentions": {"file": "generaldynamics.csv", "any_of": ["Mentions"], "min_columns": 2},
+    "sentiment": {"file": "sentiment-dynamics.csv", "any_of": ["Positive", "Neutral", "Negative"], "min_columns": 2},
+    "tags": {"file": "tags-dynamics.csv", "any_of": [], "min_columns": 2},
+}
+
+CHUNK_ROWS = int(os.getenv("UPLOAD_CHUNK_ROWS", "50000"))
+TIME_FORMAT = "%d.%m.%Y %H:%M"
+SNAPSHOT_KEEP = int(os.getenv("DATA_SNAPSHOT_KEEP", "10"))
+
+
+def _check_headers(header: List[Any]) -> None:
+    """Reject exports whose headers repeat (after cleaning) instead of guessing which column wins."""
+    cleaned = _clean_columns(header)
+    dupes = sorted({c for c in cleaned if cleaned.count(c) > 1})
+    if dupes:
+        raise ValueError(f"Export has duplicate column headers: {dupes}")
+
+
+def _iter_csv_chunks(fileobj: BinaryIO, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    # read_csv renames repeated headers ('A', 'A.1'), so check the raw header row first
+    try:
+        header = pd.read_csv(fileobj, encoding="utf-8-sig", header=None, nrows=1, dtype=str)
+    except pd.errors.EmptyDataError:
+        return
+    _check_headers(header.iloc[0].tolist() if len(header) else [])
+    fileobj.seek(0)
+    yield from pd.read_csv(fileobj, encoding="utf-8-sig", chunksize=chunk_rows)
+
+
+def _iter_xlsx_chunks(fileobj: BinaryIO, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [c if c is not None else f"Unnamed: {i}" for i, c in enumerate(header)]
+        _check_headers(header)
+        buf: List[tuple] = []
+        for r in rows:
+            buf.append(r)
+            if len(buf) >= chunk_rows:
+                yield pd.DataFrame(buf, columns=header)
+                buf = []
+        if buf:
+            yield pd.DataFrame(buf, columns=header)
+    finally:
+        wb.close()
+
+
+def _validate_columns(dataset: str, columns: List[str]) -> None:
+    spec = DATASETS[dataset]
+    if "Time" not in columns:
+        raise ValueError(f"Export is missing the 'Time' column (found: {columns})")
+    if len(columns) < spec["min_columns"]:
+        raise ValueError(f"Export for '{dataset}' needs at least {spec['min_columns']} columns")
+    if spec["any_of"] and not any(c in columns for c in spec["any_of"]):
+        raise ValueError(f"Export for '{dataset}' needs one of {spec['any_of']} (found: {columns})")
+
+
+def prune_snapshots(snap_dir: Path, keep: int = SNAPSHOT_KEEP) -> List[Path]:
+    """Delete all but the newest `keep` snapshots in a dataset directory; returns the deleted paths."""
+    if keep <= 0:
+        return []
+    # Versions start with a UTC timestamp; mtime breaks ties within the same second
+    snapshots = sorted(snap_dir.glob("*.csv"), key=lambda p: (p.stat().st_mtime_ns, p.name), reverse=True)
+    removed = []
+    for path in snapshots[keep:]:
+        try:
+            path.unlink()
+            removed.append(path)
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def ingest_upload(
+    fileobj: BinaryIO,
+    filename: str,
+    dataset: str,
+    data_dir: Path,
+    chunk_rows: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Parse an uploaded export chunk by chunk, snapshot it and publish it as the live source."""
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset '{dataset}'. Expected one of {sorted(DATASETS)}")
+    chunk_rows = max(int(chunk_rows or CHUNK_ROWS), 1)
+    is_xlsx = (filename or "").lower().endswith((".xlsx", ".xlsm"))
+    chunks = _iter_xlsx_chunks(fileobj, chunk_rows) if is_xlsx else _iter_csv_chunks(fileobj, chunk_rows)
+
+    version = f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    snap_dir = data_dir / "snapshots" / dataset
+    snap_dir.mkdir(parents=True, exist_ok=True)
+    snap_path = snap_dir / f"{version}.csv"
+    tmp_path = snap_dir / f".{version}.csv.tmp"
+
+    rows = 0
+    columns: Optional[List[str]] = None
+    first_time = last_time = None
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as out:
+            for chunk in chunks:
+                chunk.columns = _clean_columns(chunk.columns)
+                if columns is None:
+                    columns = list(chunk.columns)
+                    _validate_columns(dataset, columns)
+                chunk["Time"] = _parse_time(chunk["Time"])
+                chunk = chunk.dropna(subset=["Time"])
+                if chunk.empty:
+                    continue
+                chunk_min, chunk_max = chunk["Time"].min(), chunk["Time"].max()
+                first_time = chunk_min if first_time is None else min(first_time, chunk_min)
+                last_time = chunk_max if last_time is None else max(last_time, chunk_max)
+                chunk.to_csv(out, header=(rows == 0), index=False, date_format=TIME_FORMAT)
+                rows += len(chunk)
+        if columns is None:
+            raise ValueError("Export is empty")
+        if rows == 0:
+            raise ValueError("Export has no rows with a parseable 'Time' value")
+        os.replace(tmp_path, snap_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    # Swap the live source file atomically, then publish to the historical cache
+    live_path = data_dir / DATASETS[dataset]["file"]
+    live_tmp = data_dir / f".{live_path.name}.{version}.tmp"
+    shutil.copyfile(snap_path, live_tmp)
+    os.replace(live_tmp, live_path)
+    reload_historical_data(data_dir)
+    prune_snapshots(snap_dir, SNAPSHOT_KEEP)
+
+    return {
+        "dataset": dataset,
+        "version": version,
+        "rows": rows,
+        "columns": columns,
+        "first_time": str(first_time),
+        "last_time": str(last_time),
+        "snapshot": str(snap_path.relative_to(data_dir)),
+        "published": True,
+    }
@@ -0,0 +1,147 @@
+"""
+Rolling-window statistics over the engagement index.
+
+Prefix sums (and lazily built EWMA state) are computed once per data load, so
+window means, trend deltas and EWMA values at any cutoff are O(1) lookups
+(plus a binary search when the cutoff is given as a date).
+
+The index is mentions normalized by the max mentions over the whole history.
+Given the raw mention counts, as-of lookups are rescaled to the running max at
+the cutoff, so a backtest baseline never sees later data. Means and EWMA are
+linear in the index, so the rescale is a single factor per cutoff.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BASELINE_WINDOW = 8
+
+
+def as_of_cutoff(value: Any) -> np.datetime64:
+    """Exclusive upper bound for an inclusive as-of value (a bare date covers the whole day)."""
+    ts = pd.Timestamp(value)
+    ts = ts + (pd.Timedelta(days=1) if ts == ts.normalize() else pd.Timedelta(1, 'ns'))
+    return np.datetime64(ts.to_datetime64(), 'ns')
+
+
+class EngagementStore:
+    """Immutable time-series store over the weekly engagement index."""
+
+    def __init__(self, values: Sequence[float], times: Optional[Sequence[Any]] = None,
+                 mentions: Optional[Sequence[float]] = None):
+        vals = np.asarray(values, dtype=float)
+        valid = ~np.isnan(vals)
+        self._values = vals
+        # NaNs are skipped (same as Series.mean), so track valid counts alongside sums
+        self._sum = np.concatenate(([0.0], np.cumsum(np.where(valid, vals, 0.0))))
+        self._count = np.concatenate(([0], np.cumsum(valid, dtype=np.int64)))
+        self._times: Optional[np.ndarray] = None
+        if times is not None:
+            t = pd.to_datetime(pd.Series(times)).to_numpy(dtype='datetime64[ns]')
+            if len(t) == len(vals):
+                self._times = t
+        self._ewma: Dict[int, np.ndarray] = {}
+        # Normalization denominator (max(running max of mentions, 1)) after each point
+        self._norm: Optional[np.ndarray] = None
+        if mentions is not None:
+            m = np.asarray(mentions, dtype=float)
+            if len(m) == len(vals) and len(m):
+                self._norm = np.maximum(np.maximum.accumulate(m), 1.0)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def has_times(self) -> bool:
+        return self._times is not None
+
+    def end_index(self, as_of: Any = None) -> int:
+        """Number of points at or before `as_of` (all points when omitted)."""
+        if as_of is None:
+            return len(self._values)
+        if self._times is None:
+            raise ValueError("Engagement index has no timestamps; as-of baselines are unavailable")
+        return int(np.searchsorted(self._times, as_of_cutoff(as_of), side='left'))
+
+    def _scale(self, end):
+        """Factor taking index values normalized over all points to values normalized over the first `end`."""
+        if self._norm is None:
+            return 1.0
+        ends = np.maximum(np.asarray(end), 1)
+        return self._norm[-1] / self._norm[ends - 1]
+
+    def _mean(self, start: int, end: int) -> Optional[float]:
+        start = max(start, 0)
+        n = int(self._count[end] - self._count[start])
+        if n <= 0:
+            return None
+        return float((self._sum[end] - self._sum[start]) / n)
+
+    def window_mean(self, window: int = DEFAULT_BASELINE_WINDOW, as_of: Any = None) -> Optional[float]:
+        """Mean of the last `window` points up to `as_of` (equivalent to `tail(window).mean()`)."""
+        end = self.end_index(as_of)
+        value = self._mean(end - max(int(window), 1), end)
+        return None if value is None else value * float(self._scale(end))
+
+    def trend_delta(self, window: int = DEFAULT_BASELINE_WINDOW, as_of: Any = None) -> Optional[float]:
+        """Last-window mean minus the preceding window's mean (e.g. 8 vs prior 8 weeks)."""
+        window = max(int(window), 1)
+        end = self.end_index(as_of)
+        recent = self._mean(end - window, end)
+        prior = self._mean(end - 2 * window, end - window) if end - window > 0 else None
+        if recent is None or prior is None:
+            return None
+        return (recent - prior) * float(self._scale(end))
+
+    def _ewma_state(self, span: int) -> np.ndarray:
+        span = max(int(span), 1)
+        state = self._ewma.get(span)
+        if state is None:
+            ewm = pd.Series(self._values).ewm(span=span, adjust=False, ignore_na=True).mean()
+            state = ewm.to_numpy(dtype=float)
+            self._ewma[span] = state
+        return state
+
+    def ewma(self, span: int = DEFAULT_BASELINE_WINDOW, as_of: Any = None) -> Optional[float]:
+        end = self.end_index(as_of)
+        if end <= 0:
+            return None
+        v = float(self._ewma_state(span)[end - 1])
+        return None if np.isnan(v) else v * float(self._scale(end))
+
+    def window_means(self, window: int, as_of_dates: Iterable[Any]) -> np.ndarray:
+        """Vectorized window means at many cutoffs (NaN where the window is empty)."""
+        if self._times is None:
+            raise ValueError("Engagement index has no timestamps; as-of baselines are unavailable")
+        cutoffs = np.array([as_of_cutoff(v) for v in as_of_dates], dtype='datetime64[ns]')
+        ends = np.searchsorted(self._times, cutoffs, side='left')
+        starts = np.maximum(ends - max(int(window), 1), 0)
+        n = self._count[ends] - self._count[starts]
+        sums = self._sum[ends] - self._sum[starts]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(n > 0, sums / np.maximum(n, 1) * self._scale(ends), np.nan)
+
+    def baseline(self, window: Optional[int] = None, as_of: Any = None, method: Optional[str] = None) -> float:
+        """Engagement baseline used by the forecast engine."""
+        window = int(window or DEFAULT_BASELINE_WINDOW)
+        method = (method or 'mean').lower()
+        if method == 'mean':
+            value = self.window_mean(window, as_of)
+        elif method == 'ewma':
+            value = self.ewma(window, as_of)
+        else:
+            raise ValueError(f"Invalid baseline method: {method}")
+        if value is None:
+            raise ValueError("No engagement data available for the requested baseline window")
+        return value
+
+    def summary(self, window: int = DEFAULT_BASELINE_WINDOW, as_of: Any = None) -> Dict[str, Optional[float]]:
+        return {
+            "window": window,
+            "mean": self.window_mean(window, as_of),
+            "trend_delta": self.trend_delta(window, as_of),
+            "ewma": self.ewma(window, as_of),
+        }
@@ -0,0 +1,199 @@
+"""
+Bulkhead executor pools for work that must not run on the event loop.
+
+Route handlers stay `async def` and only do request plumbing; blocking work is
+awaited on one of several named, bounded pools so that a slow class of work
+can only exhaust its own workers:
+
+- `engine`: forecast engine runs. A thread pool by default, or a process pool
+  with ENGINE_EXECUTOR=process, so callers pass module-level, picklable
+  functions and arguments only.
+- `data`: file and CSV loads and work on the in-process caches built from them.
+- `llm`: OpenAI calls, which can block for many seconds.
+- `db`: SQLAlchemy sessions (sized to the engine's default connection pool).
+- `calibration`: background workbook calibration jobs (services.calibration_jobs).
+
+Pool sizes come from ENGINE_WORKERS (default: CPU count, at most 4),
+DATA_WORKERS (8), LLM_WORKERS (8), DB_WORKERS (5) and CALIBRATION_JOB_WORKERS
+(2). Each pool counts queued and running calls; `pool_stats()` reports queue
+depth and utilization.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+ENGINE_EXECUTOR = os.getenv("ENGINE_EXECUTOR", "thread").strip().lower()
+
+
+def _workers(env: str, default: int) -> int:
+    return max(int(os.getenv(env, str(default))), 1)
+
+
+class BulkheadPool:
+    """A bounded executor with queue-depth and utilization counters.
+
+    Thread pools are measured exactly: a call is queued until a worker picks
+    it up. A process pool cannot report when a worker starts, so there a call
+    counts as running while at most `workers` are in flight and as queued
+    beyond that.
+    """
+
+    def __init__(self, name: str, workers: int, processes: bool = False):
+        self.name = name
+        self.workers = workers
+        self.processes = processes
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._created = time.monotonic()
+        self._queued = 0
+        self._active = 0
+        self._peak_queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._wait_s = 0.0
+        self._busy_s = 0.0
+
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.processes:
+                        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name)
+        return self._executor
+
+    def _tracked(self, call: Callable[[], T], enqueued: float, state: Dict[str, bool]) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            state["started"] = True
+            self._queued -= 1
+            self._active += 1
+            self._wait_s += started - enqueued
+        ok = False
+        try:
+            result = call()
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._failed += not ok
+                self._busy_s += time.perf_counter() - started
+
+    def _thread_done(self, fut: Future, state: Dict[str, bool]) -> None:
+        # A call cancelled before a worker picked it up never reaches _tracked
+        if fut.cancelled() and not state["started"]:
+            with self._lock:
+                self._queued -= 1
+                self._cancelled += 1
+
+    def _process_done(self, fut: Future, enqueued: float) -> None:
+        with self._lock:
+            self._queued -= 1
+            if fut.cancelled():
+                self._cancelled += 1
+                return
+            self._completed += 1
+            self._failed += fut.exception() is not None
+            self._busy_s += time.perf_counter() - enqueued
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Queue a call from synchronous code; returns its concurrent Future."""
+        call = functools.partial(fn, *args, **kwargs)
+        enqueued = time.perf_counter()
+        with self._lock:
+            self._submitted += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued - (self.workers if self.processes else 0))
+        if self.processes:
+            fut = self.executor().submit(call)
+            fut.add_done_callback(lambda f: self._process_done(f, enqueued))
+            return fut
+        state = {"started": False}
+        fut = self.executor().submit(self._tracked, call, enqueued, state)
+        fut.add_done_callback(lambda f: self._thread_done(f, state))
+        return fut
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # Cancelling the awaiting task cancels the call if it has not started yet
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            if self.processes:
+                active, queued = min(self._queued, self.workers), max(self._queued - self.workers, 0)
+            else:
+                active, queued = self._active, self._queued
+            started = self._completed + active
+            uptime = time.monotonic() - self._created
+            return {
+                "kind": "process" if self.processes else "thread",
+                "workers": self.workers,
+                "active": active,
+                "queued": queued,
+                "peak_queued": self._peak_queued,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "utilization": round(active / self.workers, 4),
+                "busy_ratio": round(self._busy_s / (uptime * self.workers), 4) if uptime > 0 else 0.0,
+                "avg_wait_ms": round(self._wait_s / started * 1000, 2) if started and not self.processes else None,
+                "avg_run_ms": round(self._busy_s / self._completed * 1000, 2) if self._completed else None,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+POOLS: Dict[str, BulkheadPool] = {
+    "engine": BulkheadPool("engine", _workers("ENGINE_WORKERS", min(os.cpu_count() or 1, 4)), ENGINE_EXECUTOR == "process"),
+    "data": BulkheadPool("data", _workers("DATA_WORKERS", 8)),
+    "llm": BulkheadPool("llm", _workers("LLM_WORKERS", 8)),
+    "db": BulkheadPool("db", _workers("DB_WORKERS", 5)),
+    "calibration": BulkheadPool("calibration", _workers("CALIBRATION_JOB_WORKERS", 2)),
+}
+
+
+async def run_engine(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a pure engine function on the engine pool."""
+    return await POOLS["engine"].run(fn, *args, **kwargs)
+
+
+async def run_data(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking file load (or work on in-process caches) on the data pool."""
+    return await POOLS["data"].run(fn, *args, **kwargs)
+
+
+async def run_llm(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking OpenAI call on the LLM pool."""
+    return await POOLS["llm"].run(fn, *args, **kwargs)
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run SQLAlchemy session work on the database pool."""
+    return await POOLS["db"].run(fn, *args, **kwargs)
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: pool.stats() for name, pool in POOLS.items()}
+
+
+def shutdown(wait: bool = True) -> None:
+    for pool in POOLS.values():
+        pool.shutdown(wait=wait)
@@ -0,0 +1,50 @@
+"""
+Fast JSON encoding for large responses.
+
+Uses orjson when it is installed (numpy arrays and scalars are serialized
+natively) and falls back to the stdlib encoder with a numpy-aware default.
+Routes return FastJSONResponse directly, which skips FastAPI's response_model
+re-validation while the declared response_model still documents the schema.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (date, datetime)):
+        # Same ISO 8601 text orjson writes
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes; numpy arrays and scalars and dates are accepted.
+    orjson writes NaN and infinities as null, while the fallback rejects them like JSONResponse.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with `dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
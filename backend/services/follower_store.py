@@ -0,0 +1,357 @@
+"""
+Follower history time-series store.
+
+Each platform keeps a sorted timestamp array and a value array. Range queries
+are answered with binary search (plus optional last-per-period resampling), and
+new readings are appended in place: the arrays grow geometrically and the
+readings are written to an append-only log in the data directory, so history is
+never rewritten. Each base source has its own log: followers_readings.csv for
+the monthly CSV, followers_readings.<workbook>-<hash>.csv per workbook.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.calibration import load_follower_history_from_xlsx
+from services.engagement_store import as_of_cutoff
+from services.followers_service import FOLLOWERS_CSV, _file_version
+from services.growth_stats import DEFAULT_WINDOW, series_stats
+
+READINGS_LOG = "followers_readings.csv"
+LOG_FIELDS = ["timestamp", "platform", "value"]
+
+# resample code -> numpy unit the timestamps are floored to ('W' is handled separately)
+RESAMPLE_UNITS = {"D": "D", "W": "W", "M": "M", "Q": "Q", "Y": "Y"}
+_INITIAL_CAPACITY = 64
+# Memoized growth-stat queries kept per store revision
+_STATS_CACHE_SIZE = 64
+
+
+def _to_ns(value: Any) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value).to_datetime64(), 'ns')
+
+
+def _period_start(times: np.ndarray, code: str) -> np.ndarray:
+    """Floor datetime64[ns] timestamps to the start of their resample period."""
+    if code == "W":
+        days = times.astype('datetime64[D]')
+        # 1970-01-01 was a Thursday; weeks start on Monday
+        return days - ((days.astype(np.int64) + 3) % 7)
+    if code == "Q":
+        months = times.astype('datetime64[M]').astype(np.int64)
+        return (months - months % 3).astype('datetime64[M]')
+    return times.astype(f'datetime64[{RESAMPLE_UNITS[code]}]')
+
+
+class _Series:
+    """Sorted (timestamp, value) arrays with spare capacity for appends."""
+
+    __slots__ = ("times", "values", "n")
+
+    def __init__(self, times: np.ndarray, values: np.ndarray):
+        order = np.argsort(times, kind='stable')
+        times, values = times[order], values[order]
+        # Keep the latest reading for duplicate timestamps
+        if len(times) > 1:
+            keep = np.r_[times[1:] != times[:-1], True]
+            times, values = times[keep], values[keep]
+        self.n = len(times)
+        cap = max(_INITIAL_CAPACITY, self.n * 2)
+        self.times = np.empty(cap, dtype='datetime64[ns]')
+        self.values = np.empty(cap, dtype=float)
+        self.times[:self.n] = times
+        self.values[:self.n] = values
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        n = self.n
+        return self.times[:n], self.values[:n]
+
+    def last(self) -> Optional[np.datetime64]:
+        return self.times[self.n - 1] if self.n else None
+
+    def extend(self, times: np.ndarray, values: np.ndarray) -> None:
+        need = self.n + len(times)
+        if need > len(self.times):
+            cap = max(need, len(self.times) * 2)
+            t = np.empty(cap, dtype='datetime64[ns]')
+            v = np.empty(cap, dtype=float)
+            t[:self.n] = self.times[:self.n]
+            v[:self.n] = self.values[:self.n]
+            self.times, self.values = t, v
+        self.times[self.n:need] = times
+        self.values[self.n:need] = values
+        # Publish the new length last so concurrent readers only see filled slots
+        self.n = need
+
+
+class FollowerHistoryStore:
+    """Per-platform follower readings loaded from a base source plus the readings log."""
+
+    def __init__(self, series: Dict[str, Tuple[np.ndarray, np.ndarray]], log_path: Optional[Path] = None):
+        self._series: Dict[str, _Series] = {
+            p: _Series(np.asarray(t, dtype='datetime64[ns]'), np.asarray(v, dtype=float))
+            for p, (t, v) in series.items()
+        }
+        self._lock = threading.Lock()
+        self.log_path = Path(log_path) if log_path is not None else None
+        self.log_stamp: Optional[Tuple[int, int]] = None
+        # Bumped on every append; growth stats are memoized per revision
+        self.revision = 0
+        self._stats: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+    @property
+    def platforms(self) -> List[str]:
+        return list(self._series)
+
+    def __len__(self) -> int:
+        return sum(s.n for s in self._series.values())
+
+    def series(self, platform: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted (timestamps, values) for a platform (views; do not modify)."""
+        s = self._series.get(platform)
+        if s is None:
+            raise ValueError(f"Unknown platform '{platform}'")
+        return s.view()
+
+    # Queries ---------------------------------------------------------------
+
+    def query(
+        self,
+        start: Any = None,
+        end: Any = None,
+        platforms: Optional[Sequence[str]] = None,
+        resample: Optional[str] = None,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Readings in [start, end] per platform; a bare `end` date covers the whole day.
+
+        With `resample` (D, W, M, Q or Y) each platform keeps its last reading per
+        period, timestamped with the period start.
+        """
+        code = resample.upper() if resample else None
+        if code is not None and code not in RESAMPLE_UNITS:
+            raise ValueError(f"Invalid resample '{resample}' (use one of {', '.join(RESAMPLE_UNITS)})")
+        lo = _to_ns(start) if start is not None else None
+        hi = as_of_cutoff(end) if end is not None else None
+        if lo is not None and hi is not None and hi <= lo:
+            raise ValueError("'from' must be on or before 'to'")
+
+        out: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for p in (platforms or self.platforms):
+            times, values = self.series(p)
+            i = int(np.searchsorted(times, lo, side='left')) if lo is not None else 0
+            j = int(np.searchsorted(times, hi, side='left')) if hi is not None else len(times)
+            t, v = times[i:j], values[i:j]
+            if code is not None and len(t):
+                periods = _period_start(t, code)
+                last = np.flatnonzero(np.r_[periods[1:] != periods[:-1], True])
+                t, v = periods[last].astype('datetime64[ns]'), v[last]
+            out[p] = (t, v)
+        return out
+
+    def query_payload(self, start: Any = None, end: Any = None, platforms: Optional[Sequence[str]] = None,
+                      resample: Optional[str] = None) -> Dict[str, Any]:
+        unit = 'D' if resample else 's'
+        result = self.query(start, end, platforms, resample)
+        return {
+            "from": str(start) if start is not None else None,
+            "to": str(end) if end is not None else None,
+            "resample": resample.upper() if resample else None,
+            "series": {
+                p: {"timestamps": np.datetime_as_string(t, unit=unit).tolist(), "values": v.tolist()}
+                for p, (t, v) in result.items()
+            },
+        }
+
+    def growth_stats(self, start: Any = None, end: Any = None, platforms: Optional[Sequence[str]] = None,
+                     window: int = DEFAULT_WINDOW) -> Dict[str, Any]:
+        """Per-platform growth statistics over month-end readings in [start, end], memoized per revision."""
+        key = (self.revision, start, end, tuple(platforms or ()), int(window))
+        cached = self._stats.get(key)
+        if cached is not None:
+            return cached
+        monthly = self.query(start, end, platforms, resample="M")
+        result = {
+            "from": str(start) if start is not None else None,
+            "to": str(end) if end is not None else None,
+            "window": int(window),
+            "platforms": {p: series_stats(t, v, window) for p, (t, v) in monthly.items()},
+        }
+        with self._lock:
+            self._stats[key] = result
+            while len(self._stats) > _STATS_CACHE_SIZE:
+                self._stats.popitem(last=False)
+        return result
+
+    # Appends ---------------------------------------------------------------
+
+    def append(self, readings: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Append readings ({platform, timestamp, value}); returns counts per platform.
+
+        Readings must be later than the platform's latest reading. The batch is
+        validated as a whole before anything is logged or stored.
+        """
+        batch: Dict[str, List[Tuple[np.datetime64, float]]] = {}
+        for r in readings:
+            platform = str(r["platform"]).strip()
+            if not platform:
+                raise ValueError("Reading is missing a platform")
+            value = float(r["value"])
+            if not np.isfinite(value):
+                raise ValueError(f"Reading for {platform} has a non-finite value")
+            batch.setdefault(platform, []).append((_to_ns(r["timestamp"]), value))
+
+        with self._lock:
+            prepared: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+            for platform, items in batch.items():
+                times = np.array([t for t, _ in items], dtype='datetime64[ns]')
+                values = np.array([v for _, v in items], dtype=float)
+                order = np.argsort(times, kind='stable')
+                times, values = times[order], values[order]
+                if len(times) > 1 and (times[1:] == times[:-1]).any():
+                    raise ValueError(f"Duplicate timestamps for {platform} in one batch")
+                s = self._series.get(platform)
+                last = s.last() if s is not None else None
+                if last is not None and times[0] <= last:
+                    raise ValueError(
+                        f"Readings for {platform} must be after {np.datetime_as_string(last, unit='s')}"
+                    )
+                prepared[platform] = (times, values)
+
+            if self.log_path is not None and prepared:
+                self._write_log(prepared)
+            for platform, (times, values) in prepared.items():
+                s = self._series.get(platform)
+                if s is None:
+                    self._series[platform] = _Series(times, values)
+                else:
+                    s.extend(times, values)
+            if prepared:
+                self.revision += 1
+                self._stats.clear()
+        return {p: len(t) for p, (t, _) in prepared.items()}
+
+    def _write_log(self, prepared: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> None:
+        new_file = not self.log_path.exists()
+        with open(self.log_path, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(LOG_FIELDS)
+            for platform, (times, values) in prepared.items():
+                for t, v in zip(np.datetime_as_string(times, unit='s'), values.tolist()):
+                    writer.writerow([t, platform, repr(v)])
+        self.log_stamp = _log_stamp(self.log_path)
+
+    def replay_log(self) -> None:
+        """Apply the readings log on top of the base data (used when loading)."""
+        if self.log_path is None or not self.log_path.exists():
+            return
+        log = pd.read_csv(self.log_path)
+        if len(log):
+            times = pd.to_datetime(log['timestamp'], format='mixed').to_numpy(dtype='datetime64[ns]')
+            values = log['value'].to_numpy(dtype=float)
+            platforms = log['platform'].astype(str).to_numpy()
+            for platform in pd.unique(platforms):
+                mask = platforms == platform
+                s = self._series.get(platform)
+                if s is None:
+                    self._series[platform] = _Series(times[mask], values[mask])
+                else:
+                    base_t, base_v = s.view()
+                    self._series[platform] = _Series(
+                        np.concatenate([base_t, times[mask]]), np.concatenate([base_v, values[mask]])
+                    )
+        self.log_stamp = _log_stamp(self.log_path)
+
+
+def _log_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _series_from_csv(csv_path: Path) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    df = pd.read_csv(csv_path)
+    dates = pd.to_datetime(df['Month'], errors='coerce', format='mixed')
+    ok = dates.notna().to_numpy()
+    times = dates.to_numpy(dtype='datetime64[ns]')[ok]
+    out: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for col in df.columns:
+        if col in ('Month', 'Total'):
+            continue
+        values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)[ok]
+        valid = ~np.isnan(values)
+        out[col] = (times[valid], values[valid])
+    return out
+
+
+def _series_from_workbook(xlsx_path: Path) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Observed (non-interpolated) monthly values from the KPI workbook."""
+    payload = load_follower_history_from_xlsx(xlsx_path)
+    points: Dict[str, List[Tuple[pd.Timestamp, float]]] = {}
+    for row in payload.get("data", []):
+        ts = pd.to_datetime(row.get("label"), format='%b %Y', errors='coerce')
+        if pd.isna(ts):
+            continue
+        for key, value in row.items():
+            if key in ("label", "Total") or key.endswith("_interpolated") or row.get(f"{key}_interpolated"):
+                continue
+            if isinstance(value, (int, float)) and np.isfinite(value):
+                points.setdefault(key, []).append((ts, float(value)))
+    return {
+        p: (np.array([t.to_datetime64() for t, _ in pts], dtype='datetime64[ns]'), np.array([v for _, v in pts]))
+        for p, pts in points.items()
+    }
+
+
+def readings_log_path(data_dir: Path, base: Optional[Path]) -> Path:
+    """Readings log for a base source, so readings for one workbook never show up under another."""
+    if base is None or base.suffix.lower() == ".csv":
+        return Path(data_dir) / READINGS_LOG
+    digest = hashlib.sha1(str(base.resolve()).encode()).hexdigest()[:10]
+    return Path(data_dir) / f"{Path(READINGS_LOG).stem}.{base.stem}-{digest}.csv"
+
+
+_STORE_LOCK = threading.Lock()
+# (data dir, base source) -> (base version, store)
+_STORES: Dict[Tuple[str, str], Tuple[str, FollowerHistoryStore]] = {}
+
+
+def get_follower_store(data_dir: Path, sheet_path: Optional[Path] = None) -> FollowerHistoryStore:
+    """Store over the monthly CSV (or the workbook) plus appended readings.
+
+    Rebuilt when the base file changes or the readings log is modified outside
+    this process; appends through the store keep it current without a reload.
+    """
+    data_dir = Path(data_dir)
+    csv_path = data_dir / FOLLOWERS_CSV
+    if csv_path.exists():
+        base, loader = csv_path, _series_from_csv
+    elif sheet_path is not None and Path(sheet_path).exists():
+        base, loader = Path(sheet_path), _series_from_workbook
+    else:
+        base, loader = None, None
+    log_path = readings_log_path(data_dir, base)
+    version = _file_version(base) if base is not None else ""
+    key = (str(data_dir.resolve()), str(base.resolve()) if base is not None else "")
+
+    cached = _STORES.get(key)
+    if cached is not None and cached[0] == version and cached[1].log_stamp == _log_stamp(log_path):
+        return cached[1]
+    with _STORE_LOCK:
+        cached = _STORES.get(key)
+        if cached is not None and cached[0] == version and cached[1].log_stamp == _log_stamp(log_path):
+            return cached[1]
+        store = FollowerHistoryStore(loader(base) if loader else {}, log_path=log_path)
+        store.replay_log()
+        _STORES[key] = (version, store)
+        return store
@@ -0,0 +1,113 @@
+"""
+Follower history payloads for /api/followers-history.
+
+The monthly CSV export (or, without it, the KPI workbook) is parsed once per
+file version with vectorized date parsing; the extrapolated payload is kept
+pre-encoded so dashboard loads only compare versions and return bytes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.calibration import load_follower_history_from_xlsx
+from services.growth_stats import recent_monthly_delta
+
+FOLLOWERS_CSV = "followers_history_2025.csv"
+CSV_PLATFORMS = ['Instagram', 'TikTok', 'Facebook', 'YouTube']
+
+_LOCK = threading.Lock()
+# source path -> {"version", "payload", "body"}
+_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def _file_version(path: Path) -> str:
+    st = path.stat()
+    return hashlib.sha1(f"{path.resolve()}:{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode like Starlette's JSONResponse, so cached bytes match the previous responses."""
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _extrapolate_to_year_end(
+    dates: pd.Series,
+    values: np.ndarray,
+) -> Tuple[List[str], np.ndarray]:
+    """Project the remaining months of the final year from the recent monthly delta."""
+    last = dates.iloc[-1]
+    if len(values) < 2 or pd.isna(last) or last.month >= 12:
+        return [], np.empty((0, values.shape[1]))
+    steps = np.arange(1, 12 - last.month + 1)
+    labels = [(last + pd.DateOffset(months=int(i))).strftime('%b %Y') for i in steps]
+    projected = values[-1] + recent_monthly_delta(values) * steps[:, None]
+    return labels, projected
+
+
+def build_csv_payload(csv_path: Path) -> Dict[str, Any]:
+    """Follower history from the monthly CSV, extrapolated through December of its final year."""
+    df = pd.read_csv(csv_path)
+    months = df['Month']
+    dates = pd.to_datetime(months, errors='coerce', format='mixed')
+    labels = dates.dt.strftime('%b %Y').where(dates.notna(), months.astype(str)).tolist()
+
+    values = np.column_stack([
+        df[p].to_numpy(dtype=float) if p in df.columns else np.zeros(len(df))
+        for p in CSV_PLATFORMS
+    ]) if len(df) else np.empty((0, len(CSV_PLATFORMS)))
+    totals = df['Total'].to_numpy(dtype=float) if 'Total' in df.columns else np.zeros(len(df))
+
+    data_rows: List[Dict[str, Any]] = [
+        {"label": label, **dict(zip(CSV_PLATFORMS, vals)), "Total": total}
+        for label, vals, total in zip(labels, values.tolist(), totals.tolist())
+    ]
+
+    if len(data_rows) >= 2:
+        proj_labels, projected = _extrapolate_to_year_end(dates, values)
+        proj_totals = np.zeros(len(proj_labels))
+        for j in range(len(CSV_PLATFORMS)):
+            proj_totals = proj_totals + projected[:, j]
+        for label, vals, total in zip(proj_labels, projected.tolist(), proj_totals.tolist()):
+            row: Dict[str, Any] = {"label": label}
+            for p, v in zip(CSV_PLATFORMS, vals):
+                row[p] = v
+                row[f'{p}_interpolated'] = True
+            row['Total'] = total
+            row['Total_interpolated'] = True
+            labels.append(label)
+            data_rows.append(row)
+
+    return {"labels": labels, "data": data_rows}
+
+
+def _cached(path: Path, builder) -> Dict[str, Any]:
+    key = str(path.resolve())
+    version = _file_version(path)
+    entry = _CACHE.get(key)
+    if entry is None or entry["version"] != version:
+        with _LOCK:
+            entry = _CACHE.get(key)
+            if entry is None or entry["version"] != version:
+                payload = builder(path)
+                entry = {"version": version, "payload": payload, "body": encode_json(payload)}
+                _CACHE[key] = entry
+    return entry
+
+
+def get_followers_history(data_dir: Path, sheet_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Cached follower history entry {version, payload, body}; None when no source exists.
+    Prefers the monthly CSV, falling back to the KPI workbook.
+    """
+    csv_path = data_dir / FOLLOWERS_CSV
+    if csv_path.exists():
+        return _cached(csv_path, build_csv_payload)
+    if sheet_path is not None and sheet_path.exists():
+        return _cached(sheet_path, load_follower_history_from_xlsx)
+    return None
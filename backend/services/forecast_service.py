@@ -1,7 +1,13 @@
+import hashlib
+import json
+import threading
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+from services.engagement_store import EngagementStore
+from services import snapshot_cache
 
 # Constants
 PLATFORMS = ["Instagram", "TikTok", "YouTube", "Facebook"]
@@ -129,14 +135,39 @@ def band_quality(posts_per_week: float, min_ok: float, max_ok: float, soft: floa
     return float(0.95 - 0.15 * ratio)
 
 
+# Element-wise versions of the band factors; bands broadcast against posts_per_week
+def oversaturation_penalty_array(posts_per_week, soft, hard) -> np.ndarray:
+    ppw = np.asarray(posts_per_week, dtype=float)
+    ratio = (ppw - soft) / np.maximum(np.subtract(hard, soft), 1e-6)
+    return np.select([ppw <= soft, ppw >= hard], [1.0, 0.6], 1.0 - 0.4 * ratio)
+
+
+def consistency_boost_array(posts_per_week, min_ok, max_ok) -> np.ndarray:
+    ppw = np.asarray(posts_per_week, dtype=float)
+    return np.select([ppw < min_ok, ppw <= max_ok], [0.95, 1.08], 1.0)
+
+
+def band_quality_array(posts_per_week, min_ok, max_ok, soft, hard) -> np.ndarray:
+    ppw = np.asarray(posts_per_week, dtype=float)
+    ratio = (ppw - soft) / np.maximum(np.subtract(hard, soft), 1e-6)
+    return np.select(
+        [ppw < min_ok, ppw <= max_ok, ppw <= soft, ppw >= hard],
+        [0.9, 1.0, 0.95, 0.80],
+        0.95 - 0.15 * ratio,
+    )
+
+
+def mention_counts(mentions_df: pd.DataFrame) -> np.ndarray:
+    """Mention counts per row of a mentions export (the index is normalized by their max)."""
+    mentions_col = 'Mentions' if 'Mentions' in mentions_df.columns else mentions_df.columns[1]
+    return pd.to_numeric(mentions_df[mentions_col], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
 def compute_engagement_index(mentions_df: pd.DataFrame, sentiment_df: pd.DataFrame) -> pd.Series:
     """Compute engagement index from mentions and sentiment data"""
     df = mentions_df[["Time"]].copy()
 
-    # Get mentions column
-    mentions_col = 'Mentions' if 'Mentions' in mentions_df.columns else mentions_df.columns[1]
-    m = pd.to_numeric(mentions_df[mentions_col], errors='coerce').fillna(0)
-    df['mentions'] = m.values
+    df['mentions'] = mention_counts(mentions_df)
 
     # Join sentiment
     if 'Time' in sentiment_df.columns:
@@ -161,6 +192,144 @@ def compute_engagement_index(mentions_df: pd.DataFrame, sentiment_df: pd.DataFra
     return df['engagement_index']
 
 
+# Rows per chunk for the out-of-core engagement index pipeline
+ENGAGEMENT_CHUNK_ROWS = 100_000
+# Mentions exports larger than this are indexed with the chunked pipeline
+ENGAGEMENT_CHUNKED_MIN_BYTES = 64 * 1024 * 1024
+
+
+def _iter_time_chunks(path: Path, chunk_rows: int):
+    """Yield (cleaned columns, chunk with parsed Time and NaT rows dropped, first row number)."""
+    row0 = 0
+    for chunk in pd.read_csv(path, encoding="utf-8-sig", chunksize=chunk_rows):
+        chunk.columns = _clean_columns(chunk.columns)
+        chunk = chunk.loc[:, ~chunk.columns.duplicated()]
+        n = len(chunk)
+        if "Time" not in chunk.columns:
+            raise ValueError(f"{path.name} has no 'Time' column")
+        times = _parse_time(chunk["Time"])
+        keep = times.notna().to_numpy()
+        yield chunk.loc[keep], times[keep], np.arange(row0, row0 + n)[keep]
+        row0 += n
+
+
+def _has_time_column(path: Path) -> bool:
+    """Whether an export's header has a 'Time' column (other read errors propagate)."""
+    header = pd.read_csv(path, encoding="utf-8-sig", nrows=0)
+    return "Time" in _clean_columns(header.columns)
+
+
+def _sorted_order(times: np.ndarray) -> np.ndarray:
+    # Same (non-stable) quicksort as DataFrame.sort_values in _load_csv_df, so ties resolve identically.
+    # Sort as datetime64: numpy uses a different unstable sort for int64 keys.
+    return np.argsort(times.view("datetime64[ns]"), kind="quicksort")
+
+
+def compute_engagement_index_chunked(
+    mentions_path: Path,
+    sentiment_path: Path,
+    chunk_rows: int = ENGAGEMENT_CHUNK_ROWS,
+) -> pd.Series:
+    """Out-of-core equivalent of compute_engagement_index over the raw CSV exports."""
+    return _chunked_engagement_index(mentions_path, sentiment_path, chunk_rows)[0]
+
+
+def _chunked_engagement_index(
+    mentions_path: Path,
+    sentiment_path: Path,
+    chunk_rows: int = ENGAGEMENT_CHUNK_ROWS,
+) -> Tuple[pd.Series, np.ndarray, np.ndarray]:
+    """Engagement index computed out of core, plus the sorted mentions timestamps and counts it is aligned to.
+
+    Exports are parsed in fixed-size chunks into compact int64/float64 arrays (no
+    string Time columns or wide frames are kept), mentions are aligned to sentiment
+    with a sorted merge-join on int64 timestamps, and the index is computed in
+    chunks after a first pass finds the global mentions max. Output matches
+    compute_engagement_index(_load_csv_df(...), _load_csv_df(...)) exactly,
+    including the extra rows a merge produces for duplicate sentiment timestamps.
+
+    Memory is bounded by the row count, not by chunking alone: about 24 bytes per
+    mentions row and 32 per sentiment row stay resident while the index is built,
+    against the full parsed frames of the in-memory path.
+    """
+    # Pass 1: mentions times/values and global max
+    t_parts, m_parts, r_parts = [], [], []
+    m_max = None
+    for chunk, times, rows in _iter_time_chunks(mentions_path, chunk_rows):
+        col = "Mentions" if "Mentions" in chunk.columns else chunk.columns[1]
+        m = pd.to_numeric(chunk[col], errors="coerce").fillna(0).to_numpy(dtype=float)
+        t_parts.append(times.to_numpy(dtype="datetime64[ns]").view("i8"))
+        m_parts.append(m)
+        r_parts.append(rows)
+        if len(m):
+            cmax = m.max()
+            m_max = cmax if m_max is None else max(m_max, cmax)
+    if not t_parts or m_max is None:
+        return pd.Series([], dtype=float, name="engagement_index"), np.array([], dtype="datetime64[ns]"), np.array([])
+    order = _sorted_order(np.concatenate(t_parts))
+    m_times = np.concatenate(t_parts)[order]
+    mentions = np.concatenate(m_parts)[order]
+    row_ids = np.concatenate(r_parts)[order]
+    del t_parts, m_parts, r_parts
+    denom = max(m_max, 1)
+
+    # Sentiment as sorted int64 keys + float columns. Only a missing 'Time' column
+    # means "no sentiment" (as in compute_engagement_index); parse errors propagate.
+    has_sentiment = _has_time_column(sentiment_path)
+    if has_sentiment:
+        s_t, s_pos, s_neu, s_neg = [], [], [], []
+        for chunk, times, _ in _iter_time_chunks(sentiment_path, chunk_rows):
+            s_t.append(times.to_numpy(dtype="datetime64[ns]").view("i8"))
+            for name, parts in (("Positive", s_pos), ("Neutral", s_neu), ("Negative", s_neg)):
+                if name in chunk.columns:
+                    parts.append(pd.to_numeric(chunk[name], errors="coerce").fillna(0).to_numpy(dtype=float))
+                else:
+                    parts.append(np.zeros(len(chunk)))
+        s_times = np.concatenate(s_t) if s_t else np.array([], dtype="i8")
+        s_order = _sorted_order(s_times)
+        s_times = s_times[s_order]
+        pos_all = (np.concatenate(s_pos) if s_pos else np.array([]))[s_order]
+        neu_all = (np.concatenate(s_neu) if s_neu else np.array([]))[s_order]
+        neg_all = (np.concatenate(s_neg) if s_neg else np.array([]))[s_order]
+        del s_t, s_pos, s_neu, s_neg
+
+    # Pass 2: chunked merge-join and index computation
+    parts = []
+    for start in range(0, len(m_times), chunk_rows):
+        stop = min(start + chunk_rows, len(m_times))
+        m = mentions[start:stop]
+        if has_sentiment:
+            keys = m_times[start:stop]
+            lo = np.searchsorted(s_times, keys, side="left")
+            hits = np.searchsorted(s_times, keys, side="right") - lo
+            # A left merge emits one row per matching sentiment row (in sentiment order), or one unmatched row
+            reps = np.maximum(hits, 1)
+            row = np.repeat(np.arange(len(keys)), reps)
+            idx = lo[row] + np.arange(len(row)) - np.repeat(np.cumsum(reps) - reps, reps)
+            matched = hits[row] > 0
+            idx = np.where(matched, idx, 0)
+            m = m[row]
+            # Unmatched rows get NaN sentiment, like a left merge
+            pos = np.where(matched, pos_all[idx] if len(s_times) else 0.0, np.nan)
+            neu = np.where(matched, neu_all[idx] if len(s_times) else 0.0, np.nan)
+            neg = np.where(matched, neg_all[idx] if len(s_times) else 0.0, np.nan)
+        else:
+            pos = np.zeros(len(m))
+            neu = m
+            neg = np.zeros(len(m))
+        total = pos + neu + neg
+        total = np.where(total == 0, np.nan, total)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            factor = (pos + 0.5 * neu - 0.5 * neg) / total
+        factor = np.where(np.isnan(factor), 1.0, factor)
+        norm = np.maximum(m / denom, 0)
+        parts.append(np.maximum(norm * factor, 0))
+    out = np.concatenate(parts)
+
+    index = pd.RangeIndex(len(out)) if has_sentiment else pd.Index(row_ids)
+    return pd.Series(out, index=index, name="engagement_index"), m_times.view("datetime64[ns]"), mentions
+
+
 def forecast_growth(
     current_followers: Dict[str, int],
     posts_per_week_total: float,
@@ -188,14 +357,18 @@ def forecast_growth(
     per_post_gain_base: Dict[str, float] | None = None,
     # seasonality/taper
     month_decay_per_month: float = 0.0,
+    # precomputed engagement baseline (e.g. from EngagementStore); defaults to last-8 mean
+    baseline_engagement: float | None = None,
 ) -> pd.DataFrame:
     """Run growth forecast simulation"""
     weeks = months * 4 + 4
 
-    if len(engagement_index_series) == 0:
-        engagement_index_series = pd.Series([0.5])
-
-    baseline = float(engagement_index_series.tail(8).mean())
+    if baseline_engagement is not None:
+        baseline = float(baseline_engagement)
+    else:
+        if len(engagement_index_series) == 0:
+            engagement_index_series = pd.Series([0.5])
+        baseline = float(engagement_index_series.tail(8).mean())
     weekly_engagement_forecast = np.full(weeks, max(baseline * (1 + campaign_lift), 0.0))
 
     # Convert allocation percentages to fractions
@@ -326,6 +499,153 @@ def forecast_growth(
     return pd.DataFrame(monthly_rows)
 
 
+def forecast_growth_batch(
+    scenarios: List[Dict[str, Any]],
+    engagement_index_series: pd.Series,
+) -> List[pd.DataFrame]:
+    """Vectorized forecast_growth over many scenarios.
+
+    Each scenario is a dict of forecast_growth keyword arguments (without the
+    engagement series). Per-scenario inputs, including calibration overrides
+    from different profiles, are stacked into (scenario x platform) arrays and
+    the weekly compounding loop runs once for the whole batch. Results match
+    forecast_growth scenario by scenario.
+    """
+    n = len(scenarios)
+    if n == 0:
+        return []
+    n_p = len(PLATFORMS)
+
+    default_baseline = None
+    if any(sc.get("baseline_engagement") is None for sc in scenarios):
+        series = engagement_index_series if len(engagement_index_series) else pd.Series([0.5])
+        default_baseline = float(series.tail(8).mean())
+
+    months = np.array([int(sc.get("months", 12)) for sc in scenarios])
+    weeks = int(months.max()) * 4 + 4
+    decay = np.array([float(sc.get("month_decay_per_month", 0.0)) for sc in scenarios])
+    followers = np.zeros((n, n_p))
+    weekly_rate0 = np.zeros((n, n_p))
+    cap_weekly = np.zeros((n, n_p))
+    add_posts = np.zeros((n, n_p))
+    add_paid = np.zeros((n, n_p))
+
+    # Static per-(scenario, platform) terms; only compounding depends on the week
+    for i, sc in enumerate(scenarios):
+        baseline = sc.get("baseline_engagement")
+        baseline = default_baseline if baseline is None else float(baseline)
+        ei = max(baseline * (1 + sc.get("campaign_lift", 0.0)), 0.0)
+        sensitivity = sc.get("sensitivity", 0.5)
+        acq_scalar = sc.get("acq_scalar", 1.0)
+        current = sc["current_followers"]
+        posts_total = sc["posts_per_week_total"]
+        allocation = sc["platform_allocation"]
+        mix_by_platform = sc["content_mix_by_platform"]
+        content_mult = sc.get("content_mult")
+
+        alloc_frac = {p: max(allocation.get(p, 0.0), 0.0) for p in PLATFORMS}
+        total_alloc = sum(alloc_frac.values()) or 1.0
+        alloc_frac = {p: v/total_alloc for p, v in alloc_frac.items()}
+        paid_allocation = sc.get("paid_allocation")
+        if paid_allocation is None:
+            paid_alloc_frac = alloc_frac.copy()
+        else:
+            paid_alloc_frac = {p: max(paid_allocation.get(p, 0.0), 0.0) for p in PLATFORMS}
+            total_paid_alloc = sum(paid_alloc_frac.values()) or 1.0
+            paid_alloc_frac = {p: v/total_paid_alloc for p, v in paid_alloc_frac.items()}
+        paid_funnel = sc.get("paid_funnel") or PAID_FUNNEL_DEFAULT
+        cpf_paid = sc.get("cpf_paid") or CPF_DEFAULT
+        cpf_creator = sc.get("cpf_creator") or CPF_DEFAULT
+        cpf_acquisition = sc.get("cpf_acquisition") or CPF_DEFAULT
+        paid_impressions = sc.get("paid_impressions_per_week_total", 0.0)
+        paid_budget = sc.get("paid_budget_per_week_total", 0.0)
+        creator_budget = sc.get("creator_budget_per_week_total", 0.0)
+        acq_budget = sc.get("acquisition_budget_per_week_total", 0.0)
+        BMR = sc.get("base_monthly_rate") or BASE_MONTHLY_RATE
+        PMC = sc.get("platform_monthly_cap") or PLATFORM_MONTHLY_CAP
+        PPG = sc.get("per_post_gain_base") or PER_POST_GAIN_BASE
+
+        for j, p in enumerate(PLATFORMS):
+            mix = mix_by_platform.get(p, {})
+            ms = sum(max(mix.get(t, 0.0), 0.0) for t in POST_TYPES) or 1.0
+            mix = {t: max(mix.get(t, 0.0), 0.0)/ms for t in POST_TYPES}
+            posts = posts_total * alloc_frac[p]
+            freq_cfg = RECOMMENDED_FREQ[p]
+            c_mult = blended_content_multiplier(p, mix, content_mult_override=content_mult)
+            div_factor = diversity_factor(mix)
+            over_pen = oversaturation_penalty(posts, freq_cfg["soft"], freq_cfg["hard"])
+            consist = consistency_boost(posts, freq_cfg["min"], freq_cfg["max"])
+            freq_eff = min(saturating_effect(posts, FREQ_HALF_SAT[p]), saturating_effect(freq_cfg["max"], FREQ_HALF_SAT[p]))
+
+            followers[i, j] = float(max(current.get(p, 0), 0))
+            plan_intensity = (1.0 + sensitivity * ei * freq_eff * c_mult * div_factor * over_pen * consist)
+            weekly_rate0[i, j] = BMR[p] / 4.0 * plan_intensity
+            cap_weekly[i, j] = (1.0 + PMC[p]) ** (1/4.0) - 1.0
+
+            quality = 0.5 + 0.5 * ei
+            sat_quality = band_quality(posts, freq_cfg["min"], freq_cfg["max"], freq_cfg["soft"], freq_cfg["hard"])
+            per_post = PPG[p] * acq_scalar * quality * sat_quality * c_mult * div_factor * over_pen * consist
+            add_posts[i, j] = posts * per_post
+
+            rates = paid_funnel.get(p, PAID_FUNNEL_DEFAULT[p])
+            paid_follows = paid_impressions * paid_alloc_frac[p] * rates.get("vtr", 0.3) * rates.get("er", 0.02) * rates.get("fcr", 0.01)
+            paid_follows *= (0.8 + 0.2 * c_mult)
+            paid_budget_follows = 0.0
+            creator_budget_follows = 0.0
+            acq_budget_follows = 0.0
+            if paid_budget > 0 and cpf_paid.get("mid", 4.0) > 0:
+                paid_budget_follows = (paid_budget * paid_alloc_frac[p]) / cpf_paid.get("mid", 4.0)
+            if creator_budget > 0 and cpf_creator.get("mid", 4.0) > 0:
+                creator_budget_follows = (creator_budget * alloc_frac[p]) / cpf_creator.get("mid", 4.0)
+            if acq_budget > 0 and cpf_acquisition.get("mid", 4.0) > 0:
+                acq_budget_follows = (acq_budget * alloc_frac[p]) / cpf_acquisition.get("mid", 4.0)
+            add_paid[i, j] = paid_follows + paid_budget_follows + creator_budget_follows + acq_budget_follows
+
+    # Weekly compounding across the whole batch
+    week_followers = np.empty((weeks, n, n_p))
+    week_org = np.empty((weeks, n))
+    week_paid = np.empty((weeks, n))
+    tapered = decay > 0
+    for w in range(weeks):
+        rate = weekly_rate0
+        if tapered.any():
+            m_idx = np.minimum(w // 4, months - 1)
+            taper = np.maximum(0.5, 1.0 - decay * m_idx)
+            rate = np.where(tapered[:, None], weekly_rate0 * taper[:, None], weekly_rate0)
+        rate = np.minimum(rate, cap_weekly)
+        add_org = followers * rate + add_posts
+        followers = followers + (add_org + add_paid)
+        week_followers[w] = followers
+        # Platform-ordered accumulation, like the scalar loop
+        org_total = np.zeros(n)
+        paid_total = np.zeros(n)
+        for j in range(n_p):
+            org_total = org_total + add_org[:, j]
+            paid_total = paid_total + add_paid[:, j]
+        week_org[w] = org_total
+        week_paid[w] = paid_total
+
+    week_totals = np.zeros((weeks, n))
+    for j in range(n_p):
+        week_totals = week_totals + week_followers[:, :, j]
+
+    results: List[pd.DataFrame] = []
+    for i in range(n):
+        m_count = int(months[i])
+        end = np.arange(1, m_count + 1) * 4 - 1
+        org = week_org[:, i].reshape(-1, 4)[:m_count].sum(axis=1)
+        paid = week_paid[:, i].reshape(-1, 4)[:m_count].sum(axis=1)
+        frame = {"Month": np.arange(1, m_count + 1)}
+        for j, p in enumerate(PLATFORMS):
+            frame[p] = week_followers[end, i, j]
+        frame["Total"] = week_totals[end, i]
+        frame["Added"] = org + paid
+        frame["Added_Organic"] = org
+        frame["Added_Paid"] = paid
+        results.append(pd.DataFrame(frame))
+    return results
+
+
 def load_historical_data(data_dir: Path):
     """Load historical CSV data"""
     def load_csv(path: Path, date_col: str = "Time") -> pd.DataFrame:
@@ -362,14 +682,18 @@ def load_historical_data(data_dir: Path):
         "engagement_index": eng_index.to_list()
     }
 
-# Lightweight in-memory cache for historical dataframes and engagement index
+# Lightweight in-memory cache for historical dataframes and engagement index.
+# Entries are immutable snapshots replaced wholesale under _HIST_LOCK.
+_HIST_LOCK = threading.Lock()
 _HIST_CACHE: Dict[str, Any] = {
     "dir": None,
     "mtimes": {},
+    "version": None,
     "mentions_df": None,
     "sentiment_df": None,
     "tags_df": None,
     "engagement_index": None,
+    "engagement_store": None,
 }
 
 
@@ -388,42 +712,134 @@ def _file_mtimes(data_dir: Path) -> Dict[str, float]:
     return out
 
 
+def _clean_columns(columns) -> List[str]:
+    """Strip whitespace, BOMs and stray quotes from YouScan export headers."""
+    return [str(c).strip().strip('\ufeff').strip('"') for c in columns]
+
+
+def _parse_time(values: pd.Series) -> pd.Series:
+    """Parse YouScan 'dd.mm.yyyy HH:MM' timestamps (quotes stripped, dayfirst)."""
+    return pd.to_datetime(values.astype(str).str.replace('"',''), errors='coerce', dayfirst=True)
+
+
 def _load_csv_df(path: Path, date_col: str = "Time") -> pd.DataFrame:
+    # Memory-mapped binary snapshot skips CSV and dayfirst date parsing entirely
+    snap = snapshot_cache.load_frame(path)
+    if snap is not None:
+        return snap
+    df = _parse_csv_df(path, date_col)
+    snapshot_cache.save_frame(path, df)
+    return df
+
+
+def _parse_csv_df(path: Path, date_col: str = "Time") -> pd.DataFrame:
     try:
         df = pd.read_csv(path, encoding="utf-8-sig")
     except Exception:
         df = pd.read_csv(path)
-    df.columns = [c.strip().strip('\ufeff').strip('"') for c in df.columns]
+    df.columns = _clean_columns(df.columns)
     if date_col in df.columns:
         try:
-            df[date_col] = pd.to_datetime(df[date_col].astype(str).str.replace('"',''), errors='coerce', dayfirst=True)
+            df[date_col] = _parse_time(df[date_col])
             df = df.dropna(subset=[date_col]).sort_values(by=date_col)
         except Exception:
             pass
     return df.loc[:, ~df.columns.duplicated()]
 
 
-def get_historical_data_cached(data_dir: Path) -> Dict[str, Any]:
+def _is_large_export(path: Path) -> bool:
+    try:
+        return path.stat().st_size >= ENGAGEMENT_CHUNKED_MIN_BYTES
+    except OSError:
+        return False
+
+
+_FRAMES_LOCK = threading.Lock()
+
+
+def _hist_frames(snap: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Mentions and sentiment frames of a snapshot.
+
+    Large exports are indexed out of core when the snapshot is built, so their
+    frames are only loaded here, the first time a caller needs the rows.
+    """
+    if snap["mentions_df"] is None:
+        with _FRAMES_LOCK:
+            if snap["mentions_df"] is None:
+                data_dir = Path(snap["dir"])
+                snap["sentiment_df"] = _load_csv_df(data_dir / "sentiment-dynamics.csv")
+                snap["mentions_df"] = _load_csv_df(data_dir / "generaldynamics.csv")
+    return snap["mentions_df"], snap["sentiment_df"]
+
+
+def _data_version(mtimes: Dict[str, float]) -> str:
+    """Stable token for a set of source files; shared by every worker reading the same files."""
+    return hashlib.sha1(json.dumps(mtimes, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def _hist_cache_current(snap: Dict[str, Any], data_dir: Path, mtimes: Dict[str, float]) -> bool:
+    return snap["dir"] == str(data_dir) and snap["mtimes"] == mtimes and snap["engagement_index"] is not None
+
+
+def _ensure_hist_cache(data_dir: Path, force: bool = False) -> Dict[str, Any]:
+    """Return an up-to-date immutable cache snapshot, reloading if the CSVs changed.
+
+    Reloads are single-flight: one thread parses while concurrent callers either
+    keep serving the previous snapshot for this directory (stale-while-revalidate)
+    or, on a cold cache, wait for the loader instead of parsing in parallel.
+    """
     global _HIST_CACHE
-    mt = _file_mtimes(data_dir)
-    if _HIST_CACHE["dir"] != str(data_dir) or mt != _HIST_CACHE.get("mtimes"):
-        mentions_df = _load_csv_df(data_dir / "generaldynamics.csv")
-        sentiment_df = _load_csv_df(data_dir / "sentiment-dynamics.csv")
+    snap = _HIST_CACHE
+    if not force and _hist_cache_current(snap, data_dir, _file_mtimes(data_dir)):
+        return snap
+    have_stale = snap["dir"] == str(data_dir) and snap["engagement_index"] is not None
+    if not _HIST_LOCK.acquire(blocking=force or not have_stale):
+        return snap
+    try:
+        # Re-check under the lock: another thread may have finished the reload
+        mt = _file_mtimes(data_dir)
+        snap = _HIST_CACHE
+        if not force and _hist_cache_current(snap, data_dir, mt):
+            return snap
+        mentions_path = data_dir / "generaldynamics.csv"
+        if _is_large_export(mentions_path):
+            # Never hold the full frames of a large export just to build the index
+            mentions_df = sentiment_df = None
+            eng_index, times, counts = _chunked_engagement_index(mentions_path, data_dir / "sentiment-dynamics.csv")
+        else:
+            mentions_df = _load_csv_df(mentions_path)
+            sentiment_df = _load_csv_df(data_dir / "sentiment-dynamics.csv")
+            eng_index = compute_engagement_index(mentions_df, sentiment_df)
+            times = mentions_df["Time"] if "Time" in mentions_df.columns else None
+            counts = mention_counts(mentions_df) if len(mentions_df.columns) > 1 else None
         tags_df = _load_csv_df(data_dir / "tags-dynamics.csv")
-        eng_index = compute_engagement_index(mentions_df, sentiment_df)
 
-        _HIST_CACHE = {
+        snap = {
             "dir": str(data_dir),
             "mtimes": mt,
+            "version": _data_version(mt),
             "mentions_df": mentions_df,
             "sentiment_df": sentiment_df,
             "tags_df": tags_df,
             "engagement_index": eng_index,
+            "engagement_store": EngagementStore(eng_index.to_numpy(dtype=float), times, counts),
         }
+        # Publish by swapping the reference; readers holding the old snapshot are unaffected
+        _HIST_CACHE = snap
+        return snap
+    finally:
+        _HIST_LOCK.release()
 
-    mentions_df = _HIST_CACHE["mentions_df"].copy()
-    sentiment_df = _HIST_CACHE["sentiment_df"].copy()
-    tags_df = _HIST_CACHE["tags_df"].copy()
+
+def reload_historical_data(data_dir: Path) -> None:
+    """Publish newly written source files to the cache without a restart."""
+    _ensure_hist_cache(data_dir, force=True)
+
+
+def get_historical_data_cached(data_dir: Path) -> Dict[str, Any]:
+    snap = _ensure_hist_cache(data_dir)
+    mentions_df, sentiment_df = (df.copy() for df in _hist_frames(snap))
+    tags_df = snap["tags_df"].copy()
     for df in (mentions_df, sentiment_df, tags_df):
         if 'Time' in df.columns:
             df['Time'] = df['Time'].astype(str)
@@ -432,10 +848,19 @@ def get_historical_data_cached(data_dir: Path) -> Dict[str, Any]:
         "mentions": mentions_df.to_dict('records'),
         "sentiment": sentiment_df.to_dict('records'),
         "tags": tags_df.to_dict('records'),
-        "engagement_index": list(_HIST_CACHE["engagement_index"].values),
+        "engagement_index": list(snap["engagement_index"].values),
     }
 
 
 def get_engagement_index_cached(data_dir: Path) -> pd.Series:
-    _ = get_historical_data_cached(data_dir)
-    return _HIST_CACHE["engagement_index"]
+    return _ensure_hist_cache(data_dir)["engagement_index"]
+
+
+def get_engagement_store_cached(data_dir: Path) -> EngagementStore:
+    """Prefix-sum/EWMA store over the cached engagement index."""
+    return _ensure_hist_cache(data_dir)["engagement_store"]
+
+
+def get_historical_snapshot(data_dir: Path) -> Dict[str, Any]:
+    """Current cache entry (frames, engagement data and data `version`); treat as read-only."""
+    return _ensure_hist_cache(data_dir)
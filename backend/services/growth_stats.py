@@ -0,0 +1,133 @@
+"""
+Follower growth statistics shared by the history endpoints, the calibration
+fallback and the AI prompt builders.
+
+Everything operates on numpy arrays (one platform series at a time, or
+element-wise across platforms), so callers compute MoM growth, compound
+rates, rolling volatility and trend once instead of re-deriving them ad hoc.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_WINDOW = 3
+
+
+def recent_monthly_delta(values: np.ndarray) -> np.ndarray:
+    """Average monthly change over the last two steps (last step only with two points).
+
+    `values` is (months, platforms); returns one delta per platform.
+    """
+    if len(values) >= 3:
+        g1 = values[-1] - values[-2]
+        g2 = values[-2] - values[-3]
+        return (g1 + g2) / 2
+    return values[-1] - values[-2]
+
+
+def compound_monthly_rate(start: Any, end: Any, months: Any) -> Any:
+    """(end/start)**(1/months) - 1, element-wise; 0.0 where start or months is not positive."""
+    if np.ndim(start) == np.ndim(end) == np.ndim(months) == 0:
+        # Scalar path uses Python's pow so results match the previous inline formulas exactly
+        start, end, months = float(start), float(end), float(months)
+        if start <= 0 or months <= 0:
+            return 0.0
+        rate = (end / start) ** (1.0 / months) - 1.0
+        return rate if isinstance(rate, float) and np.isfinite(rate) else 0.0
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    months = np.asarray(months, dtype=float)
+    ok = (start > 0) & (months > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.power(np.where(ok, end / np.where(ok, start, 1.0), 1.0), 1.0 / np.where(ok, months, 1.0)) - 1.0
+    return np.where(ok & np.isfinite(rate), rate, 0.0)
+
+
+def mom_growth(values: np.ndarray) -> np.ndarray:
+    """Month-over-month growth rates (length n-1; NaN where the prior month is not positive)."""
+    values = np.asarray(values, dtype=float)
+    prev, cur = values[:-1], values[1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(prev > 0, cur / prev - 1.0, np.nan)
+
+
+def rolling_volatility(rates: np.ndarray, window: int = DEFAULT_WINDOW) -> np.ndarray:
+    """Sample standard deviation of `rates` over trailing windows (length n-window+1)."""
+    rates = np.asarray(rates, dtype=float)
+    window = max(int(window), 2)
+    if len(rates) < window:
+        return np.empty(0)
+    windows = np.lib.stride_tricks.sliding_window_view(rates, window)
+    return windows.std(axis=1, ddof=1)
+
+
+def rolling_trend(values: np.ndarray, window: int = DEFAULT_WINDOW) -> np.ndarray:
+    """Least-squares slope (units per month) over trailing windows (length n-window+1)."""
+    values = np.asarray(values, dtype=float)
+    window = max(int(window), 2)
+    if len(values) < window:
+        return np.empty(0)
+    x = np.arange(window, dtype=float)
+    x -= x.mean()
+    weights = x / (x * x).sum()
+    return np.lib.stride_tricks.sliding_window_view(values, window) @ weights
+
+
+def _floats(arr: np.ndarray) -> List[Optional[float]]:
+    return [float(v) if np.isfinite(v) else None for v in np.asarray(arr, dtype=float).tolist()]
+
+
+def _last(arr: np.ndarray) -> Optional[float]:
+    return _floats(arr[-1:])[0] if len(arr) else None
+
+
+def series_stats(times: np.ndarray, values: np.ndarray, window: int = DEFAULT_WINDOW) -> Dict[str, Any]:
+    """Growth statistics for one monthly series (`times` sorted datetime64, one point per month)."""
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    stamps = np.datetime_as_string(np.asarray(times).astype('datetime64[D]'), unit='D').tolist()
+    out: Dict[str, Any] = {"months": n, "start": None, "end": None}
+    if n == 0:
+        return out
+    out["start"] = {"date": stamps[0], "value": float(values[0])}
+    out["end"] = {"date": stamps[-1], "value": float(values[-1])}
+    if n < 2:
+        return out
+
+    elapsed = int(np.asarray(times[-1]).astype('datetime64[M]').astype(np.int64)
+                  - np.asarray(times[0]).astype('datetime64[M]').astype(np.int64))
+    rates = mom_growth(values)
+    vol = rolling_volatility(rates, window)
+    trend = rolling_trend(values, window)
+    recent = rates[-max(int(window), 1):]
+    out.update({
+        "monthly_compound_rate": compound_monthly_rate(values[0], values[-1], elapsed),
+        "cagr": compound_monthly_rate(values[0], values[-1], elapsed / 12.0),
+        "mom_growth": {"dates": stamps[1:], "values": _floats(rates)},
+        "latest_mom": _last(rates),
+        "avg_mom": float(np.nanmean(recent)) if np.isfinite(recent).any() else None,
+        "recent_delta": float(recent_monthly_delta(values)),
+        "volatility": {"window": max(int(window), 2), "dates": stamps[len(stamps) - len(vol):], "values": _floats(vol)},
+        "latest_volatility": _last(vol),
+        "trend": {"window": max(int(window), 2), "dates": stamps[len(stamps) - len(trend):], "values": _floats(trend)},
+        "latest_trend": _last(trend),
+    })
+    return out
+
+
+def growth_context(stats: Dict[str, Dict[str, Any]]) -> str:
+    """Prompt lines summarising observed follower growth per platform."""
+    lines = []
+    for platform, s in stats.items():
+        if s.get("latest_mom") is None or s.get("start") is None:
+            continue
+        vol = s.get("latest_volatility")
+        lines.append(
+            f"- {platform}: {s['start']['value']:,.0f} ({s['start']['date'][:7]}) -> {s['end']['value']:,.0f} "
+            f"({s['end']['date'][:7]}); avg MoM {s['avg_mom'] * 100:+.2f}%, latest MoM {s['latest_mom'] * 100:+.2f}%, "
+            f"CAGR {s['cagr'] * 100:+.1f}%, trend {s['latest_trend'] or 0:+,.0f}/month"
+            + (f", MoM volatility {vol * 100:.2f}pp" if vol is not None else "")
+        )
+    return "\n".join(lines)
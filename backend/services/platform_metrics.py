@@ -0,0 +1,188 @@
+"""
+Derived metrics over data/platform_metrics.json.
+
+The monthly posts / engagement-rate / views series are loaded once per file
+version into (platform x month) masked arrays, so nulls stay masked through
+every derived metric instead of being treated as zeros: views and engagements
+per post, trailing rolling means and month-over-month deltas. Calibration
+reuses the views-per-post figures for its per-post gain.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+METRICS_FILE = "platform_metrics.json"
+DEFAULT_METRICS_PATH = Path(__file__).resolve().parent.parent / "data" / METRICS_FILE
+RAW_METRICS = ("posts", "engagement", "views")
+DEFAULT_ROLLING_WINDOW = 3
+
+
+def _masked(series: Dict[str, List[Any]], platforms: List[str], n_months: int) -> np.ma.MaskedArray:
+    arr = np.full((len(platforms), n_months), np.nan)
+    for i, p in enumerate(platforms):
+        vals = [np.nan if v is None else float(v) for v in (series.get(p) or [])[:n_months]]
+        arr[i, :len(vals)] = vals
+    return np.ma.masked_invalid(arr)
+
+
+def rolling_mean(x: np.ma.MaskedArray, window: int) -> np.ma.MaskedArray:
+    """Trailing mean over the last `window` months using only unmasked values (masked if none)."""
+    window = max(int(window), 1)
+    pad = np.zeros((x.shape[0], window - 1))
+    data = np.concatenate([pad, np.ma.filled(x.astype(float), 0.0)], axis=1)
+    valid = np.concatenate([pad, (~np.ma.getmaskarray(x)).astype(float)], axis=1)
+    sums = np.lib.stride_tricks.sliding_window_view(data, window, axis=1).sum(axis=2)
+    counts = np.lib.stride_tricks.sliding_window_view(valid, window, axis=1).sum(axis=2)
+    return np.ma.masked_where(counts == 0, sums / np.maximum(counts, 1))
+
+
+def mom_delta(x: np.ma.MaskedArray) -> np.ma.MaskedArray:
+    """Month-over-month change aligned to the later month (first month and gaps masked)."""
+    out = np.ma.masked_all(x.shape)
+    out[:, 1:] = x[:, 1:] - x[:, :-1]
+    return out
+
+
+def mom_pct(x: np.ma.MaskedArray) -> np.ma.MaskedArray:
+    """Month-over-month change relative to the prior month (masked where it is missing or not positive)."""
+    prev = np.ma.masked_all(x.shape)
+    prev[:, 1:] = x[:, :-1]
+    return mom_delta(x) / np.ma.masked_less_equal(prev, 0)
+
+
+def to_json_lists(x: np.ma.MaskedArray, platforms: List[str]) -> Dict[str, List[Optional[float]]]:
+    """{platform: row} with masked (or non-finite) entries as None."""
+    x = np.ma.masked_invalid(x)
+    filled = np.ma.filled(x.astype(float), np.nan).tolist()
+    mask = np.ma.getmaskarray(x).tolist()
+    return {p: [None if m else v for v, m in zip(row, mrow)] for p, row, mrow in zip(platforms, filled, mask)}
+
+
+def _scalar(v: Any) -> Optional[float]:
+    return None if v is np.ma.masked or not np.isfinite(v) else float(v)
+
+
+class PlatformMetrics:
+    """Masked (platform x month) arrays for one version of platform_metrics.json."""
+
+    def __init__(self, raw: Dict[str, Any], version: str = ""):
+        self.raw = raw
+        self.version = version
+        self.months: List[str] = list(raw.get("months") or [])
+        names: List[str] = []
+        for metric in RAW_METRICS:
+            for p in (raw.get(metric) or {}):
+                if p not in names:
+                    names.append(p)
+        self.platforms = names
+        n = len(self.months)
+        self.posts = _masked(raw.get("posts") or {}, names, n)
+        # Engagement is reported as a rate in percent of views
+        self.engagement = _masked(raw.get("engagement") or {}, names, n)
+        self.views = _masked(raw.get("views") or {}, names, n)
+        posts = np.ma.masked_less_equal(self.posts, 0)
+        self.views_per_post = self.views / posts
+        self.engagements = self.views * self.engagement / 100.0
+        self.engagements_per_post = self.engagements / posts
+        self._derived: Dict[int, Dict[str, Any]] = {}
+
+    def average_views_per_post(self) -> Dict[str, float]:
+        """Total views / total posts per platform over months where both are reported."""
+        both = ~(np.ma.getmaskarray(self.views_per_post))
+        views = np.where(both, np.ma.filled(self.views, 0.0), 0.0).sum(axis=1)
+        posts = np.where(both, np.ma.filled(self.posts, 0.0), 0.0).sum(axis=1)
+        return {p: float(v / c) for p, v, c in zip(self.platforms, views, posts) if c > 0}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        avg_vpp = self.average_views_per_post()
+        months_reported = (~np.ma.getmaskarray(self.views_per_post)).sum(axis=1)
+        posts_total = self.posts.sum(axis=1)
+        views_total = self.views.sum(axis=1)
+        eng_mean = self.engagement.mean(axis=1)
+        epp_mean = self.engagements_per_post.mean(axis=1)
+        return {
+            p: {
+                "total_posts": _scalar(posts_total[i]),
+                "total_views": _scalar(views_total[i]),
+                "avg_views_per_post": avg_vpp.get(p),
+                "avg_engagement_rate": _scalar(eng_mean[i]),
+                "avg_engagements_per_post": _scalar(epp_mean[i]),
+                "months_reported": int(months_reported[i]),
+            }
+            for i, p in enumerate(self.platforms)
+        }
+
+    def derived(self, window: int = DEFAULT_ROLLING_WINDOW) -> Dict[str, Any]:
+        """JSON-ready derived metrics (masked values as null), memoized per window."""
+        window = max(int(window), 1)
+        cached = self._derived.get(window)
+        if cached is not None:
+            return cached
+        series = {
+            "posts": self.posts,
+            "views": self.views,
+            "engagement": self.engagement,
+            "views_per_post": self.views_per_post,
+            "engagements": self.engagements,
+            "engagements_per_post": self.engagements_per_post,
+        }
+        ps = self.platforms
+        result = {
+            "months": self.months,
+            "platforms": ps,
+            "window": window,
+            "metrics": {k: to_json_lists(series[k], ps) for k in ("views_per_post", "engagements", "engagements_per_post")},
+            "rolling_mean": {k: to_json_lists(rolling_mean(v, window), ps) for k, v in series.items()},
+            "mom_delta": {k: to_json_lists(mom_delta(v), ps) for k, v in series.items()},
+            "mom_pct": {k: to_json_lists(mom_pct(v), ps) for k, v in series.items()},
+            "summary": self.summary(),
+        }
+        self._derived[window] = result
+        return result
+
+
+_LOCK = threading.Lock()
+# resolved path -> (version, PlatformMetrics)
+_CACHE: Dict[str, tuple] = {}
+
+
+def _version(path: Path) -> str:
+    st = path.stat()
+    return hashlib.sha1(f"{path.resolve()}:{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def get_platform_metrics(path: Path = DEFAULT_METRICS_PATH) -> PlatformMetrics:
+    """Parsed metrics for the current version of the file (FileNotFoundError if missing)."""
+    path = Path(path)
+    version = _version(path)
+    key = str(path.resolve())
+    cached = _CACHE.get(key)
+    if cached is None or cached[0] != version:
+        with _LOCK:
+            cached = _CACHE.get(key)
+            if cached is None or cached[0] != version:
+                cached = (version, PlatformMetrics(json.loads(path.read_text()), version))
+                _CACHE[key] = cached
+    return cached[1]
+
+
+def metrics_version(path: Optional[Path] = None) -> Optional[str]:
+    """Version of the metrics file (default: DEFAULT_METRICS_PATH), or None when it is missing."""
+    try:
+        return _version(Path(path or DEFAULT_METRICS_PATH))
+    except OSError:
+        return None
+
+
+def views_per_post_from_metrics(path: Optional[Path] = None) -> Dict[str, float]:
+    """Average views per post per platform, or {} when the metrics file is missing or invalid."""
+    try:
+        return get_platform_metrics(Path(path or DEFAULT_METRICS_PATH)).average_views_per_post()
+    except (OSError, ValueError):
+        return {}
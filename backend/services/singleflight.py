@@ -0,0 +1,85 @@
+"""
+Single-flight coalescing of identical concurrent computations.
+
+While a computation for a key is running, later callers with the same key
+await that computation instead of starting their own and all of them get its
+result (or its exception). Nothing is cached: the key is forgotten as soon as
+the computation finishes. Keys are canonical hashes of the request, so tabs or
+re-renders firing the same forecast or critique share one engine/LLM run.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+def request_key(*parts: Any) -> str:
+    """Stable hash of JSON-compatible parts (dict key order does not matter)."""
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+class SingleFlight:
+    """In-flight computations per key for one endpoint, with coalescing counters.
+
+    Only touched from the event loop. A computation runs as its own task, so
+    callers that go away do not cancel it for the callers still waiting.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self._executions = 0
+        self._coalesced = 0
+        self._failed = 0
+        self._peak_waiters = 0
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self._failed += 1
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self._waiters[key] = 1
+            self._executions += 1
+            task.add_done_callback(lambda t: self._finished(key, t))
+        else:
+            self._waiters[key] += 1
+            self._coalesced += 1
+            self._peak_waiters = max(self._peak_waiters, self._waiters[key])
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._inflight),
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "failed": self._failed,
+            "peak_waiters": self._peak_waiters,
+        }
+
+
+GROUPS: Dict[str, SingleFlight] = {}
+
+
+def single_flight(name: str) -> SingleFlight:
+    """The coalescing group for `name` (created on first use)."""
+    group = GROUPS.get(name)
+    if group is None:
+        group = GROUPS[name] = SingleFlight(name)
+    return group
+
+
+def coalescing_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: group.stats() for name, group in GROUPS.items()}
@@ -0,0 +1,192 @@
+"""
+Binary snapshot cache for parsed source files.
+
+Parsed CSV frames and individual workbook sheets are persisted as .npy columns in a
+`.snapshots/` directory next to the source (or under SNAPSHOT_DIR when set),
+keyed by a content digest (with a size/mtime index so unchanged files are never
+re-hashed). Snapshots are loaded
+with `mmap_mode='r'`, so reads are zero-copy and worker processes share the
+mapped pages through the OS page cache.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_DIRNAME = ".snapshots"
+# Bump when parsing logic changes so stale snapshots are ignored
+FORMAT_VERSION = 1
+SNAPSHOTS_ENABLED = os.getenv("SNAPSHOT_CACHE", "1").strip().lower() not in ("0", "false", "no")
+# Central snapshot directory; unset keeps snapshots next to each source file
+SNAPSHOT_ROOT: Optional[Path] = Path(os.environ["SNAPSHOT_DIR"]) if os.getenv("SNAPSHOT_DIR") else None
+
+_DIGESTS: Dict[str, tuple] = {}
+_LOCK = threading.Lock()
+
+
+def _root(path: Path) -> Path:
+    if SNAPSHOT_ROOT is not None:
+        # One subdirectory per source directory, so same-named files never collide
+        return SNAPSHOT_ROOT / hashlib.sha1(str(path.resolve().parent).encode()).hexdigest()[:12]
+    return path.parent / SNAPSHOT_DIRNAME
+
+
+def source_digest(path: Path) -> str:
+    """Content digest of a source file; re-hashed only when size/mtime change."""
+    st = path.stat()
+    stamp = (st.st_size, st.st_mtime_ns)
+    key = str(path.resolve())
+    cached = _DIGESTS.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    # Persisted index lets fresh processes skip hashing unchanged files
+    index_path = _root(path) / f"{path.name}.index.json"
+    try:
+        idx = json.loads(index_path.read_text())
+        if idx.get("size") == st.st_size and idx.get("mtime_ns") == st.st_mtime_ns:
+            _DIGESTS[key] = (stamp, idx["digest"])
+            return idx["digest"]
+    except Exception:
+        pass
+
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    _DIGESTS[key] = (stamp, digest)
+    try:
+        _atomic_write_text(index_path, json.dumps({"size": st.st_size, "mtime_ns": st.st_mtime_ns, "digest": digest}))
+    except Exception:
+        pass
+    return digest
+
+
+def _snapshot_dir(path: Path, kind: str) -> Path:
+    return _root(path) / f"{path.name}.{kind}.v{FORMAT_VERSION}.{source_digest(path)}"
+
+
+def _atomic_write_text(target: Path, text: str) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, target)
+
+
+def _publish(tmp_dir: Path, final_dir: Path, source: Path, kind: str) -> None:
+    """Atomically move a fully written snapshot into place and prune stale ones."""
+    try:
+        os.rename(tmp_dir, final_dir)
+    except OSError:
+        # Another worker published the same snapshot first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return
+    prefix = f"{source.name}.{kind}."
+    for old in final_dir.parent.iterdir():
+        if old.is_dir() and old.name.startswith(prefix) and old != final_dir and not old.name.startswith('.'):
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def _new_tmp_dir(path: Path) -> Path:
+    tmp = _root(path) / f".tmp-{uuid.uuid4().hex}"
+    tmp.mkdir(parents=True)
+    return tmp
+
+
+def load_frame(path: Path) -> Optional[pd.DataFrame]:
+    """Return the memory-mapped snapshot of a parsed CSV, or None on a miss."""
+    if not SNAPSHOTS_ENABLED:
+        return None
+    try:
+        d = _snapshot_dir(path, "frame")
+        meta = json.loads((d / "meta.json").read_text())
+        cols: Dict[str, Any] = {}
+        for i, col in enumerate(meta["columns"]):
+            if col["kind"] == "npy":
+                cols[col["name"]] = np.load(d / f"c{i}.npy", mmap_mode="r")
+            else:
+                vals = json.loads((d / f"c{i}.json").read_text())
+                cols[col["name"]] = np.array([np.nan if v is None else v for v in vals], dtype=object)
+        index = np.load(d / "index.npy", mmap_mode="r")
+        return pd.DataFrame(cols, index=pd.Index(index), columns=[c["name"] for c in meta["columns"]], copy=False)
+    except Exception:
+        return None
+
+
+def save_frame(path: Path, df: pd.DataFrame) -> None:
+    """Persist a parsed frame column by column; failures are non-fatal."""
+    if not SNAPSHOTS_ENABLED:
+        return
+    tmp = None
+    try:
+        final_dir = _snapshot_dir(path, "frame")
+        if final_dir.exists():
+            return
+        with _LOCK:
+            tmp = _new_tmp_dir(path)
+            columns: List[Dict[str, str]] = []
+            for i, name in enumerate(df.columns):
+                s = df[name]
+                if s.dtype.kind in "biufcmM":
+                    np.save(tmp / f"c{i}.npy", s.to_numpy())
+                    columns.append({"name": str(name), "kind": "npy"})
+                else:
+                    vals = [None if (isinstance(v, float) and np.isnan(v)) else v for v in s.tolist()]
+                    (tmp / f"c{i}.json").write_text(json.dumps(vals, default=str))
+                    columns.append({"name": str(name), "kind": "json"})
+            np.save(tmp / "index.npy", np.asarray(df.index, dtype=np.int64))
+            (tmp / "meta.json").write_text(json.dumps({"source": path.name, "rows": len(df), "columns": columns}))
+            _publish(tmp, final_dir, path, "frame")
+    except Exception:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _sheet_kind(sheet: str) -> str:
+    return "sheet-" + hashlib.sha1(sheet.encode("utf-8")).hexdigest()[:12]
+
+
+def load_sheet(path: Path, sheet: str) -> Optional[List[List[str]]]:
+    """Return one workbook sheet's rows from its snapshot, or None on a miss."""
+    if not SNAPSHOTS_ENABLED:
+        return None
+    try:
+        d = _snapshot_dir(path, _sheet_kind(sheet))
+        cells = np.load(d / "cells.npy", mmap_mode="r")
+        lens = np.load(d / "lens.npy", mmap_mode="r")
+        return [cells[r, :n].tolist() for r, n in enumerate(lens.tolist())]
+    except Exception:
+        return None
+
+
+def save_sheet(path: Path, sheet: str, rows: List[List[str]]) -> None:
+    """Persist sheet rows as a padded fixed-width string array plus row lengths."""
+    if not SNAPSHOTS_ENABLED:
+        return
+    tmp = None
+    try:
+        kind = _sheet_kind(sheet)
+        final_dir = _snapshot_dir(path, kind)
+        if final_dir.exists():
+            return
+        with _LOCK:
+            tmp = _new_tmp_dir(path)
+            width = max((len(r) for r in rows), default=0)
+            cells = np.array([r + [""] * (width - len(r)) for r in rows], dtype=str).reshape(len(rows), width)
+            np.save(tmp / "cells.npy", cells)
+            np.save(tmp / "lens.npy", np.array([len(r) for r in rows], dtype=np.int32))
+            (tmp / "meta.json").write_text(json.dumps({"source": path.name, "sheet": sheet}))
+            _publish(tmp, final_dir, path, kind)
+    except Exception:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
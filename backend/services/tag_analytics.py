@@ -0,0 +1,116 @@
+"""
+Tag pillar analytics over tags-dynamics exports.
+
+Per-tag cumulative sums are built once per data version, so the totals for any
+time window are a single row difference (O(tags)) instead of a DataFrame
+filter-and-sum.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from services.engagement_store import as_of_cutoff
+from services.forecast_service import get_historical_snapshot
+
+# Legacy dashboard used the last 4 weeks for "recent tag pillars"
+DEFAULT_WINDOW_POINTS = 4
+
+
+class TagIndex:
+    """Immutable prefix-sum index over a tags-by-time frame."""
+
+    def __init__(self, tags_df: pd.DataFrame):
+        tag_cols = [c for c in tags_df.columns if c != 'Time']
+        self.tags: List[str] = [str(c) for c in tag_cols]
+        if 'Time' in tags_df.columns:
+            order = np.argsort(tags_df['Time'].to_numpy(dtype='datetime64[ns]'), kind='stable')
+            self._times = tags_df['Time'].to_numpy(dtype='datetime64[ns]')[order]
+        else:
+            order = np.arange(len(tags_df))
+            self._times = None
+        vals = tags_df[tag_cols].apply(pd.to_numeric, errors='coerce').fillna(0.0).to_numpy(dtype=float)[order]
+        self._cum = np.vstack([np.zeros((1, len(tag_cols))), np.cumsum(vals, axis=0)])
+
+    def __len__(self) -> int:
+        return self._cum.shape[0] - 1
+
+    def _bounds(self, start: Any, end: Any, points: Optional[int]) -> tuple:
+        n = len(self)
+        if start is None and end is None:
+            p = max(int(points or DEFAULT_WINDOW_POINTS), 1)
+            return max(n - p, 0), n
+        if self._times is None:
+            raise ValueError("Tag data has no 'Time' column; date windows are unavailable")
+        i = 0 if start is None else int(np.searchsorted(self._times, np.datetime64(pd.Timestamp(start), 'ns'), side='left'))
+        j = n if end is None else int(np.searchsorted(self._times, as_of_cutoff(end), side='left'))
+        return i, max(i, j)
+
+    def _label(self, i: int, j: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"points": j - i, "start": None, "end": None}
+        if self._times is not None and j > i:
+            out["start"] = str(pd.Timestamp(self._times[i]))
+            out["end"] = str(pd.Timestamp(self._times[j - 1]))
+        return out
+
+    def top(self, k: int = 5, start: Any = None, end: Any = None, points: Optional[int] = None) -> Dict[str, Any]:
+        """Top-k tags for a window with share of window volume and momentum
+        (relative change in per-point volume vs the preceding window of equal length).
+        """
+        i, j = self._bounds(start, end, points)
+        pi = max(i - (j - i), 0)
+        cur = self._cum[j] - self._cum[i]
+        prev = self._cum[i] - self._cum[pi]
+        window_total = float(cur.sum())
+        # Compare per-point rates so a truncated previous window (start of history) stays comparable
+        scale = (j - i) / (i - pi) if i > pi else 0.0
+
+        k = max(min(int(k), len(self.tags)), 0)
+        if k == 0:
+            idx = np.array([], dtype=int)
+        elif k < len(self.tags):
+            idx = np.argpartition(-cur, k - 1)[:k]
+            idx = idx[np.argsort(-cur[idx], kind='stable')]
+        else:
+            idx = np.argsort(-cur, kind='stable')
+
+        tags = []
+        for t in idx.tolist():
+            total = float(cur[t])
+            prev_total = float(prev[t])
+            prev_scaled = prev_total * scale
+            tags.append({
+                "tag": self.tags[t],
+                "total": total,
+                "share": (total / window_total) if window_total > 0 else 0.0,
+                "previous_total": prev_total,
+                "momentum": ((total - prev_scaled) / prev_scaled) if prev_scaled > 0 else None,
+            })
+        return {
+            "window": self._label(i, j),
+            "previous_window": self._label(pi, i),
+            "window_total": window_total,
+            "tags": tags,
+        }
+
+
+_TAG_INDEX: Dict[str, Any] = {"version": None, "index": None}
+_TAG_LOCK = threading.Lock()
+
+
+def get_tag_index(data_dir: Path) -> TagIndex:
+    """Tag index for the current data version (rebuilt only when the sources change)."""
+    global _TAG_INDEX
+    snap = get_historical_snapshot(data_dir)
+    entry = _TAG_INDEX
+    if entry["version"] != snap["version"]:
+        with _TAG_LOCK:
+            entry = _TAG_INDEX
+            if entry["version"] != snap["version"]:
+                entry = {"version": snap["version"], "index": TagIndex(snap["tags_df"])}
+                _TAG_INDEX = entry
+    return entry["index"]
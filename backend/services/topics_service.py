@@ -0,0 +1,153 @@
+"""
+Topic indexes over YouScan wordcloud.csv and chart.csv exports.
+
+Exports are streamed row by row with the csv module, cleaned of the HTML noise
+YouScan puts in labels, deduplicated and ranked once per file version. Routes
+serve top-N slices from the in-memory index with a version ETag.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import html
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+
+def clean_label(raw: str) -> str:
+    """Strip markup like '<span>&nbsp;care bears</span>' down to 'care bears'."""
+    s = html.unescape(_TAG_RE.sub('', raw or ''))
+    return _WS_RE.sub(' ', s.replace('\u00a0', ' ')).strip().strip('"')
+
+
+def label_kind(label: str) -> str:
+    if label.startswith('#'):
+        return 'hashtag'
+    if not any(ch.isalnum() for ch in label):
+        return 'emoji'
+    return 'word'
+
+
+def _to_number(x: str) -> Optional[float]:
+    try:
+        s = (x or '').replace(',', '').strip()
+        return float(s) if s else None
+    except ValueError:
+        return None
+
+
+def _iter_rows(path: Path) -> Iterator[List[str]]:
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        yield from csv.reader(f)
+
+
+def _file_version(path: Path) -> str:
+    st = path.stat()
+    return hashlib.sha1(f"{path.name}:{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+class WordcloudIndex:
+    """Ranked, deduplicated wordcloud terms."""
+
+    def __init__(self, path: Path):
+        totals: Dict[str, Dict[str, Any]] = {}
+        rows = _iter_rows(path)
+        next(rows, None)  # header: Category, Series 1
+        for r in rows:
+            if len(r) < 2:
+                continue
+            label = clean_label(r[0])
+            count = _to_number(r[1])
+            if not label or count is None:
+                continue
+            key = label.lower()
+            item = totals.get(key)
+            if item is None:
+                totals[key] = {"term": label, "count": count, "kind": label_kind(label)}
+            else:
+                item["count"] += count
+        self.items: List[Dict[str, Any]] = sorted(totals.values(), key=lambda it: (-it["count"], it["term"]))
+        total = sum(it["count"] for it in self.items) or 1.0
+        for rank, it in enumerate(self.items, 1):
+            it["rank"] = rank
+            it["share"] = it["count"] / total
+        self.by_kind: Dict[str, List[Dict[str, Any]]] = {}
+        for it in self.items:
+            self.by_kind.setdefault(it["kind"], []).append(it)
+
+    def top(self, limit: int, kind: Optional[str] = None) -> Dict[str, Any]:
+        items = self.items if kind is None else self.by_kind.get(kind, [])
+        return {"total_terms": len(items), "terms": items[:limit]}
+
+
+class ChartIndex:
+    """Topic chart points grouped by category (objects, phrases, hashtags, emojis, ...)."""
+
+    def __init__(self, path: Path):
+        rows = _iter_rows(path)
+        header = next(rows, [])
+        # Columns come in '<group> (x)', '<group> (y)' pairs after 'Category'
+        pairs: List[tuple] = []
+        for i, h in enumerate(header):
+            h = clean_label(h)
+            if h.endswith('(x)') and i + 1 < len(header):
+                pairs.append((h[:-3].strip(), i, i + 1))
+        groups: Dict[str, Dict[str, Dict[str, Any]]] = {g: {} for g, _, _ in pairs}
+        for r in rows:
+            if not r:
+                continue
+            label = clean_label(r[0])
+            if not label:
+                continue
+            for g, xi, yi in pairs:
+                x = _to_number(r[xi]) if xi < len(r) else None
+                y = _to_number(r[yi]) if yi < len(r) else None
+                if x is None and y is None:
+                    continue
+                key = label.lower()
+                prev = groups[g].get(key)
+                # Duplicates keep the strongest point
+                if prev is None or (y or 0) > (prev["y"] or 0):
+                    groups[g][key] = {"label": label, "x": x, "y": y}
+        self.groups: Dict[str, List[Dict[str, Any]]] = {
+            g: sorted(items.values(), key=lambda it: (-(it["y"] or 0), it["label"])) for g, items in groups.items()
+        }
+
+    def top(self, limit: int, category: Optional[str] = None) -> Dict[str, Any]:
+        if category is not None:
+            if category not in self.groups:
+                raise ValueError(f"Unknown category '{category}'. Expected one of {sorted(self.groups)}")
+            return {"categories": {category: self.groups[category][:limit]}}
+        return {"categories": {g: items[:limit] for g, items in self.groups.items()}}
+
+
+_INDEXES: Dict[str, Dict[str, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def _get_index(path: Path, factory) -> tuple:
+    version = _file_version(path)
+    key = str(path)
+    entry = _INDEXES.get(key)
+    if entry is None or entry["version"] != version:
+        with _LOCK:
+            entry = _INDEXES.get(key)
+            if entry is None or entry["version"] != version:
+                entry = {"version": version, "index": factory(path)}
+                _INDEXES[key] = entry
+    return entry["index"], entry["version"]
+
+
+def get_wordcloud_index(data_dir: Path) -> tuple:
+    """(WordcloudIndex, version) for data/wordcloud.csv."""
+    return _get_index(data_dir / "wordcloud.csv", WordcloudIndex)
+
+
+def get_chart_index(data_dir: Path) -> tuple:
+    """(ChartIndex, version) for data/chart.csv."""
+    return _get_index(data_dir / "chart.csv", ChartIndex)
@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Tests import the backend packages (services, routes, models) the same way app.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import snapshot_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope="session")
+def snapshot_dir(tmp_path_factory):
+    """Keep binary parse snapshots out of the working tree (and away from a running server)."""
+    root, snapshot_cache.SNAPSHOT_ROOT = snapshot_cache.SNAPSHOT_ROOT, tmp_path_factory.mktemp("snapshots")
+    yield snapshot_cache.SNAPSHOT_ROOT
+    snapshot_cache.SNAPSHOT_ROOT = root
@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from starlette.requests import Request
+
+from services import admission
+from services.admission import AdmissionLimiter, admit, client_key
+
+
+def _request(peer: str, forwarded: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "headers": headers, "client": (peer, 1234)})
+
+
+def _app(limiter: AdmissionLimiter, monkeypatch, gate: asyncio.Event | None = None) -> FastAPI:
+    monkeypatch.setitem(admission.LIMITERS, "test", limiter)
+    app = FastAPI()
+
+    @app.get("/work", dependencies=[Depends(admit("test"))])
+    async def work():
+        if gate is not None:
+            await gate.wait()
+        return {"ok": True}
+
+    return app
+
+
+def test_forwarded_for_is_ignored_unless_the_peer_is_a_trusted_proxy(monkeypatch):
+    monkeypatch.setattr(admission, "TRUSTED_PROXIES", [])
+    assert client_key(_request("203.0.113.9", "1.2.3.4")) == "203.0.113.9"
+
+    monkeypatch.setattr(admission, "TRUSTED_PROXIES", admission._networks("10.0.0.0/8, 127.0.0.1"))
+    # A spoofed first hop does not win: the nearest hop not added by a trusted proxy does
+    assert client_key(_request("10.0.0.5", "6.6.6.6, 198.51.100.7, 10.1.1.1")) == "198.51.100.7"
+    assert client_key(_request("203.0.113.9", "1.2.3.4")) == "203.0.113.9"
+    assert client_key(_request("127.0.0.1", "10.0.0.2")) == "127.0.0.1"
+
+
+def test_queue_full_and_queue_timeout_shed_with_retry_after(monkeypatch):
+    limiter = AdmissionLimiter("test", concurrency=1, queue=1, queue_timeout=0.2, rate=0, burst=1)
+
+    async def scenario():
+        gate = asyncio.Event()
+        transport = httpx.ASGITransport(app=_app(limiter, monkeypatch, gate))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            holder = asyncio.ensure_future(c.get("/work"))
+            await asyncio.sleep(0.05)
+            waiter = asyncio.ensure_future(c.get("/work"))
+            await asyncio.sleep(0.05)
+            shed = await c.get("/work")
+            timed_out = await waiter
+            gate.set()
+            assert (await holder).status_code == 200
+        return shed, timed_out
+
+    shed, timed_out = asyncio.run(scenario())
+    for r, reason in ((shed, "queue full"), (timed_out, "queue timeout")):
+        assert r.status_code == 503 and reason in r.json()["detail"]
+        assert int(r.headers["retry-after"]) >= 1
+    stats = limiter.stats()
+    assert (stats["admitted"], stats["shed"], stats["timed_out"], stats["active"], stats["queued"]) == (1, 1, 1, 0, 0)
+
+
+def test_queued_request_gets_the_released_slot(monkeypatch):
+    limiter = AdmissionLimiter("test", concurrency=1, queue=4, queue_timeout=5, rate=0, burst=1)
+
+    async def scenario():
+        gate = asyncio.Event()
+        transport = httpx.ASGITransport(app=_app(limiter, monkeypatch, gate))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            calls = [asyncio.ensure_future(c.get("/work")) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            assert (limiter.stats()["active"], limiter.stats()["queued"]) == (1, 2)
+            gate.set()
+            return await asyncio.gather(*calls)
+
+    assert [r.status_code for r in asyncio.run(scenario())] == [200, 200, 200]
+    assert limiter.stats()["active"] == 0
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_rate_limit_per_client(monkeypatch, trusted):
+    monkeypatch.setattr(admission, "TRUSTED_PROXIES", admission._networks("127.0.0.1") if trusted else [])
+    limiter = AdmissionLimiter("test", concurrency=4, queue=4, queue_timeout=1, rate=0.01, burst=2)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=_app(limiter, monkeypatch), client=("127.0.0.1", 123))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            # Rotating X-Forwarded-For only yields new buckets behind a trusted proxy
+            return [await c.get("/work", headers={"x-forwarded-for": f"198.51.100.{i % 3}"}) for i in range(6)]
+
+    responses = asyncio.run(scenario())
+    codes = [r.status_code for r in responses]
+    if trusted:
+        assert codes == [200] * 6
+    else:
+        assert codes == [200, 200, 429, 429, 429, 429]
+        assert int(responses[2].headers["retry-after"]) >= 1
+        assert limiter.stats()["rate_limited"] == 4
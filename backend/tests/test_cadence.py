@@ -0,0 +1,33 @@
+import pytest
+
+from services.cadence import analyze_cadence
+from services.forecast_service import RECOMMENDED_FREQ, band_quality, consistency_boost, oversaturation_penalty
+from services.platform_metrics import PlatformMetrics
+
+
+def _factor(ppw, cfg):
+    return (band_quality(ppw, cfg["min"], cfg["max"], cfg["soft"], cfg["hard"])
+            * oversaturation_penalty(ppw, cfg["soft"], cfg["hard"])
+            * consistency_boost(ppw, cfg["min"], cfg["max"]))
+
+
+def test_effectiveness_is_relative_to_the_engine_in_band_factors():
+    metrics = PlatformMetrics({
+        "months": ["Jan 25", "Feb 25", "Mar 25", "Apr 25"],
+        "posts": {"Instagram": [20, 100, 4, None], "YouTube": [8, 40, 2, 12]},
+        "views": {"Instagram": [1000, 1000, 1000, 1000], "YouTube": [500, 500, 500, 500]},
+    })
+    result = analyze_cadence(metrics)
+    assert result["band"]["Instagram"] == ["in_band", "over_hard", "below_min", None]
+    for p in ("Instagram", "YouTube"):
+        cfg = RECOMMENDED_FREQ[p]
+        in_band = _factor(cfg["max"], cfg)
+        for ppw, eff in zip(result["weekly_posts"][p], result["effectiveness"][p]):
+            if ppw is None:
+                assert eff is None
+                continue
+            assert eff == pytest.approx(_factor(ppw, cfg) / in_band)
+    # Posting in band loses nothing
+    assert result["effectiveness"]["Instagram"][0] == pytest.approx(1.0)
+    assert result["lost_views"]["Instagram"][0] == pytest.approx(0.0)
+    assert result["lost_views"]["Instagram"][1] > 0
@@ -0,0 +1,53 @@
+import pytest
+
+from services import calibration_artifacts as artifacts
+
+
+def _artifact(artifact_id: str, bmr: float) -> dict:
+    return {
+        "format_version": artifacts.FORMAT_VERSION,
+        "id": artifact_id,
+        "source": {"name": f"{artifact_id}.xlsx"},
+        "overrides": {"base_monthly_rate": {"Instagram": bmr}},
+        "fingerprint": artifact_id,
+        "diagnostics": {},
+    }
+
+
+@pytest.fixture
+def artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_DIR", tmp_path)
+    monkeypatch.setattr(artifacts, "_LOADED", artifacts.OrderedDict())
+    return tmp_path
+
+
+def test_loaded_artifacts_are_bounded(artifact_dir, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_CACHE_SIZE", 3)
+    for i in range(6):
+        artifacts.write_artifact(_artifact(f"a{i}", i / 100))
+    for i in range(6):
+        assert artifacts.load_artifact(f"a{i}")["overrides"]["base_monthly_rate"]["Instagram"] == i / 100
+    assert list(artifacts._LOADED) == ["a3", "a4", "a5"]
+    # A hit refreshes recency
+    artifacts.load_artifact("a3")
+    artifacts.load_artifact("a0")
+    assert list(artifacts._LOADED) == ["a5", "a3", "a0"]
+
+
+def test_reload_after_change_and_eviction(artifact_dir):
+    artifacts.write_artifact(_artifact("x", 0.01))
+    first = artifacts.load_artifact("x")
+    assert artifacts.load_artifact("x") is first
+    artifacts.evict_artifact("x")
+    assert "x" not in artifacts._LOADED
+    assert artifacts.load_artifact("x") == first
+    with pytest.raises(ValueError):
+        artifacts.load_artifact("missing")
+
+
+def test_write_without_overwrite_keeps_existing_artifact(artifact_dir):
+    artifacts.write_artifact(_artifact("kpis", 0.01))
+    with pytest.raises(ValueError, match="already exists"):
+        artifacts.write_artifact(_artifact("kpis", 0.09), overwrite=False)
+    assert artifacts.load_artifact("kpis")["overrides"]["base_monthly_rate"]["Instagram"] == 0.01
+    assert [p.name for p in artifact_dir.iterdir()] == ["kpis.json"]
@@ -0,0 +1,93 @@
+import json
+import os
+
+import openpyxl
+import pytest
+
+from services import calibration as cal
+from services import platform_metrics
+
+
+def _workbook(path, mom="0.05"):
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    hist = wb.create_sheet("Historical Growth")
+    for row in (["Platform", "Start", "End", "MoM"], ["Instagram", 1000, 1500, mom], ["TikTok", 100, 300, "0.12"]):
+        hist.append(row)
+    proj = wb.create_sheet("Projected Follower Growth")
+    for row in (["Platform", "Projected Growth"], ["Instagram", "0.06"]):
+        proj.append(row)
+    wb.create_sheet("Views and Engagements past 8 mo").append(["0.002"])
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    monkeypatch.setattr(cal, "_CALIB_CACHE", {})
+    return _workbook(tmp_path / "kpis.xlsx")
+
+
+def _counting(monkeypatch):
+    calls = []
+    real = cal.load_calibration_from_xlsx
+    monkeypatch.setattr(cal, "load_calibration_from_xlsx", lambda path, *a: calls.append(path) or real(path, *a))
+    return calls
+
+
+def test_cached_calibration_matches_a_fresh_parse(workbook, monkeypatch):
+    calls = _counting(monkeypatch)
+    entry = cal.get_calibration_cached(workbook)
+    assert entry["overrides"] == cal.load_calibration_from_xlsx(workbook)
+    assert entry["overrides"]["base_monthly_rate"] == {"Instagram": 0.05, "TikTok": 0.12}
+    assert entry["fingerprint"] == cal.calibration_fingerprint(entry["overrides"], entry["stamp"][2])
+    # Same file, other spelling of the path: served from the cache
+    assert cal.get_calibration_cached(workbook.parent / ".." / workbook.parent.name / workbook.name) is entry
+    assert len(calls) == 2
+
+
+def test_changed_workbook_is_reparsed(workbook, monkeypatch):
+    first = cal.get_calibration_cached(workbook)
+    calls = _counting(monkeypatch)
+    _workbook(workbook, mom="0.09")
+    st = workbook.stat()
+    os.utime(workbook, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cal.peek_calibration_cached(workbook) is None
+    second = cal.get_calibration_cached(workbook)
+    assert len(calls) == 1 and second is not first
+    assert second["overrides"]["base_monthly_rate"]["Instagram"] == 0.09
+    assert second["fingerprint"] != first["fingerprint"]
+
+
+def test_cache_is_bounded_and_evictable(tmp_path, monkeypatch):
+    monkeypatch.setattr(cal, "_CALIB_CACHE", {})
+    monkeypatch.setattr(cal, "_CALIB_CACHE_MAX", 2)
+    paths = [_workbook(tmp_path / f"wb{i}.xlsx") for i in range(3)]
+    for p in paths:
+        cal.get_calibration_cached(p)
+    assert list(cal._CALIB_CACHE) == [str(p.resolve()) for p in paths[1:]]
+    cal.evict_calibration(paths[2])
+    assert cal.peek_calibration_cached(paths[2]) is None
+
+
+def test_changed_platform_metrics_recalibrate(workbook, tmp_path, monkeypatch):
+    from services.calibration_artifacts import compile_workbook
+
+    metrics = tmp_path / "platform_metrics.json"
+    monkeypatch.setattr(platform_metrics, "DEFAULT_METRICS_PATH", metrics)
+    metrics.write_text(json.dumps({"months": ["Jan 25"], "posts": {"Facebook": [10]}, "views": {"Facebook": [50000]}}))
+    first = cal.get_calibration_cached(workbook)
+    artifact = compile_workbook(workbook)
+    # followers/view 0.002 * 5000 views/post
+    assert first["overrides"]["per_post_gain_base"] == {"Facebook": 10.0}
+    assert artifact["fingerprint"] == first["fingerprint"]
+
+    metrics.write_text(json.dumps({"months": ["Jan 25"], "posts": {"Facebook": [10]}, "views": {"Facebook": [90000]}}))
+    st = metrics.stat()
+    os.utime(metrics, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cal.peek_calibration_cached(workbook) is None
+    second = cal.get_calibration_cached(workbook)
+    assert second["overrides"]["per_post_gain_base"] == {"Facebook": 18.0}
+    assert second["fingerprint"] != first["fingerprint"]
+    assert compile_workbook(workbook)["fingerprint"] not in (artifact["fingerprint"], first["fingerprint"])
+    assert compile_workbook(workbook)["fingerprint"] == second["fingerprint"]
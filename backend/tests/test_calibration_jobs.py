@@ -0,0 +1,93 @@
+import time
+
+import openpyxl
+import pytest
+
+from services import calibration_jobs as jobs
+from services.executors import POOLS
+
+
+@pytest.fixture
+def job_table(monkeypatch):
+    monkeypatch.setattr(jobs, "_JOBS", jobs.OrderedDict())
+    monkeypatch.setattr(jobs, "_FUTURES", {})
+    monkeypatch.setattr(jobs, "_ACTIVE", {})
+    return jobs._JOBS
+
+
+def test_trim_keeps_active_jobs_and_evicts_oldest_finished(job_table, monkeypatch):
+    monkeypatch.setattr(jobs, "MAX_JOBS", 3)
+    statuses = ["running", "queued", "succeeded", "failed", "succeeded", "running"]
+    for i, status in enumerate(statuses):
+        job_table[f"j{i}"] = {"status": status}
+    with jobs._LOCK:
+        jobs._trim_jobs()
+    assert list(job_table) == ["j0", "j1", "j5"]
+
+
+def test_jobs_run_on_the_calibration_pool(job_table, tmp_path):
+    wb = openpyxl.Workbook()
+    wb.active.append(["Platform", "MoM"])
+    path = tmp_path / "kpis.xlsx"
+    wb.save(path)
+
+    before = POOLS["calibration"].stats()["submitted"]
+    job = jobs.submit_workbook(path, publish_artifact=False)
+    deadline = time.monotonic() + 30
+    while jobs.get_job(job["id"])["status"] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert jobs.get_job(job["id"])["status"] == "succeeded"
+    assert POOLS["calibration"].stats()["submitted"] == before + 1
+
+
+@pytest.fixture
+def client(job_table, tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import app as app_module
+    from services import calibration, calibration_artifacts
+
+    monkeypatch.setenv("DATA_UPLOAD_TOKEN", "s3cret")
+    monkeypatch.setattr(calibration_artifacts, "ARTIFACT_DIR", tmp_path / "calibrations")
+    monkeypatch.setattr(calibration, "WORKBOOK_DIRS", (tmp_path / "public",))
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+AUTH = {"Authorization": "Bearer s3cret"}
+
+
+def test_job_endpoint_requires_upload_token(client, monkeypatch):
+    assert client.post("/api/calibration/jobs", data={}).status_code == 401
+    monkeypatch.delenv("DATA_UPLOAD_TOKEN")
+    assert client.post("/api/calibration/jobs", data={}, headers=AUTH).status_code == 403
+
+
+def test_job_endpoint_rejects_workbooks_outside_bundled_dir(client, tmp_path):
+    outside = tmp_path / "kpis.xlsx"
+    openpyxl.Workbook().save(outside)
+    for sheet_path in (str(outside), str(tmp_path / "public" / ".." / "kpis.xlsx")):
+        r = client.post("/api/calibration/jobs", data={"sheet_path": sheet_path}, headers=AUTH)
+        assert r.status_code == 400
+    assert jobs._JOBS == {}
+
+
+def test_job_endpoint_rejects_existing_calibration_id(client, tmp_path):
+    from services import calibration_artifacts
+
+    (tmp_path / "public").mkdir()
+    path = tmp_path / "public" / "kpis.xlsx"
+    openpyxl.Workbook().save(path)
+    calibration_artifacts.write_artifact({"id": "kpis-2025", "format_version": calibration_artifacts.FORMAT_VERSION})
+
+    r = client.post("/api/calibration/jobs", data={"sheet_path": str(path), "calibration_id": "kpis-2025"}, headers=AUTH)
+    assert r.status_code == 409
+    assert jobs._JOBS == {}
+
+    r = client.post("/api/calibration/jobs", data={"sheet_path": str(path), "calibration_id": "kpis-2026"}, headers=AUTH)
+    assert r.status_code == 202
+    job_id = r.json()["id"]
+    deadline = time.monotonic() + 30
+    while jobs.get_job(job_id)["status"] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.get(f"/api/calibration/jobs/{job_id}").json()["result"]["calibration_id"] == "kpis-2026"
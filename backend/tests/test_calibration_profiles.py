@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from services import calibration_artifacts as artifacts
+from services.calibration_profiles import CalibrationProfileRegistry
+
+
+def _artifact(artifact_id: str, bmr: float) -> dict:
+    return {
+        "format_version": artifacts.FORMAT_VERSION,
+        "id": artifact_id,
+        "source": {"name": f"{artifact_id}.xlsx"},
+        "overrides": {"base_monthly_rate": {"Instagram": bmr}},
+        "fingerprint": artifact_id,
+        "diagnostics": {},
+    }
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_DIR", tmp_path)
+    monkeypatch.setattr(artifacts, "_LOADED", artifacts.OrderedDict())
+    for i in range(3):
+        artifacts.write_artifact(_artifact(f"a{i}", i / 100))
+    reg = CalibrationProfileRegistry(tmp_path / "profiles.json", capacity=2)
+    for i in range(3):
+        reg.define(f"p{i}", calibration_id=f"a{i}")
+    reg.define("p0-alias", calibration_id="a0")
+    return reg
+
+
+def test_lru_eviction_releases_the_artifact(registry):
+    async def scenario():
+        assert (await registry.resolve("p0"))["fingerprint"] == "a0"
+        await registry.resolve("p1")
+        # p0 is evicted, and nothing else holds a0
+        await registry.resolve("p2")
+        assert list(registry._resident) == ["p1", "p2"]
+        assert "a0" not in artifacts._LOADED
+        assert set(artifacts._LOADED) == {"a1", "a2"}
+        # Re-resolving reloads it from disk
+        assert (await registry.resolve("p0"))["overrides"]["base_monthly_rate"]["Instagram"] == 0.0
+
+    asyncio.run(scenario())
+
+
+def test_shared_sources_stay_loaded(registry):
+    async def scenario():
+        await registry.resolve("p0")
+        await registry.resolve("p0-alias")
+        await registry.resolve("p1")
+        # p0 went, but p0-alias still uses a0
+        assert list(registry._resident) == ["p0-alias", "p1"]
+        assert "a0" in artifacts._LOADED
+
+    asyncio.run(scenario())
+
+
+def test_redefining_a_profile_drops_it(registry):
+    async def scenario():
+        await registry.resolve("p1")
+        registry.define("p1", calibration_id="a2")
+        assert "p1" not in registry._resident and "a1" not in artifacts._LOADED
+        assert (await registry.resolve("p1"))["fingerprint"] == "a2"
+        with pytest.raises(ValueError):
+            await registry.resolve("missing")
+
+    asyncio.run(scenario())
+
+
+def test_define_rejects_unknown_artifacts_and_outside_workbooks(registry, tmp_path, monkeypatch):
+    import openpyxl
+
+    from services import calibration
+
+    public = tmp_path / "public"
+    public.mkdir()
+    monkeypatch.setattr(calibration, "WORKBOOK_DIRS", (public,))
+    outside = tmp_path / "kpis.xlsx"
+    openpyxl.Workbook().save(outside)
+    openpyxl.Workbook().save(public / "kpis.xlsx")
+
+    with pytest.raises(ValueError, match="Unknown calibration id"):
+        registry.define("p9", calibration_id="not-compiled")
+    for sheet_path in (outside, public / ".." / "kpis.xlsx", "/etc/passwd"):
+        with pytest.raises(ValueError, match="outside the allowed workbook directories"):
+            registry.define("p9", sheet_path=str(sheet_path))
+    assert "p9" not in registry.definitions()
+    assert registry.define("p9", sheet_path=str(public / "kpis.xlsx"))["sheet_path"] == str((public / "kpis.xlsx").resolve())
+
+
+def test_profile_writes_require_upload_token(registry, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import app as app_module
+    from routes import calibration as calibration_routes
+
+    monkeypatch.setattr(calibration_routes, "registry", registry)
+    monkeypatch.setenv("DATA_UPLOAD_TOKEN", "s3cret")
+    auth = {"Authorization": "Bearer s3cret"}
+    with TestClient(app_module.app) as client:
+        assert client.put("/api/calibration/profiles/p9", json={"calibration_id": "a1"}).status_code == 401
+        assert client.delete("/api/calibration/profiles/p0").status_code == 401
+        assert "p9" not in registry.definitions() and "p0" in registry.definitions()
+
+        assert client.put("/api/calibration/profiles/p9", json={"calibration_id": "a1"}, headers=auth).status_code == 200
+        assert client.delete("/api/calibration/profiles/p0", headers=auth).json() == {"deleted": "p0"}
+        monkeypatch.delenv("DATA_UPLOAD_TOKEN")
+        assert client.delete("/api/calibration/profiles/p9", headers=auth).status_code == 403
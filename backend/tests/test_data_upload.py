@@ -0,0 +1,79 @@
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from routes import data as data_routes
+from services import data_ingest
+from services.data_ingest import ingest_upload
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name in ("generaldynamics.csv", "sentiment-dynamics.csv", "tags-dynamics.csv"):
+        shutil.copy(SOURCE_DIR / name, tmp_path / name)
+    return tmp_path
+
+
+@pytest.fixture
+def client(data_dir, monkeypatch):
+    monkeypatch.setattr(data_routes, "DATA_DIR", data_dir)
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+def _csv(text: str):
+    return {"file": ("export.csv", text.encode(), "text/csv")}
+
+
+MENTIONS = "Time,Mentions\n01.01.2025 00:00,10\n08.01.2025 00:00,12\n"
+
+
+def test_upload_disabled_without_configured_token(client, monkeypatch):
+    monkeypatch.delenv("DATA_UPLOAD_TOKEN", raising=False)
+    r = client.post("/api/data/upload?dataset=mentions", files=_csv(MENTIONS), headers={"Authorization": "Bearer anything"})
+    assert r.status_code == 403
+
+
+def test_upload_rejects_wrong_token(client, monkeypatch):
+    monkeypatch.setenv("DATA_UPLOAD_TOKEN", "secret")
+    assert client.post("/api/data/upload?dataset=mentions", files=_csv(MENTIONS)).status_code == 401
+    r = client.post("/api/data/upload?dataset=mentions", files=_csv(MENTIONS), headers={"Authorization": "Bearer wrong"})
+    assert r.status_code == 401
+
+
+def test_upload_with_token_publishes(client, data_dir, monkeypatch):
+    monkeypatch.setenv("DATA_UPLOAD_TOKEN", "secret")
+    r = client.post("/api/data/upload?dataset=mentions", files=_csv(MENTIONS), headers={"Authorization": "Bearer secret"})
+    assert r.status_code == 200, r.text
+    assert r.json()["rows"] == 2
+    assert (data_dir / "generaldynamics.csv").read_text().startswith("Time,Mentions")
+
+
+def test_duplicate_headers_are_rejected(client, monkeypatch):
+    monkeypatch.setenv("DATA_UPLOAD_TOKEN", "secret")
+    body = "Time,Mentions,Mentions\n01.01.2025 00:00,10,11\n"
+    r = client.post("/api/data/upload?dataset=mentions", files=_csv(body), headers={"Authorization": "Bearer secret"})
+    assert r.status_code == 400
+    assert "duplicate" in r.json()["detail"]
+
+
+def test_headers_duplicated_after_cleaning_are_rejected(data_dir):
+    with pytest.raises(ValueError, match="duplicate"):
+        ingest_upload(io.BytesIO(b'Time,Mentions," Mentions"\n01.01.2025 00:00,1,2\n'), "x.csv", "mentions", data_dir)
+
+
+def test_old_snapshots_are_pruned(data_dir, monkeypatch):
+    monkeypatch.setattr(data_ingest, "SNAPSHOT_KEEP", 2)
+    versions = [ingest_upload(io.BytesIO(MENTIONS.encode()), "x.csv", "mentions", data_dir)["snapshot"] for _ in range(4)]
+    kept = sorted(str(p.relative_to(data_dir)) for p in (data_dir / "snapshots" / "mentions").iterdir())
+    assert kept == sorted(versions[-2:])
+    # A failed upload leaves the existing snapshots alone
+    with pytest.raises(ValueError):
+        ingest_upload(io.BytesIO(b"Time,Mentions\n"), "x.csv", "mentions", data_dir)
+    assert len(list((data_dir / "snapshots" / "mentions").iterdir())) == 2
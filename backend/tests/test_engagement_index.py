@@ -0,0 +1,107 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import forecast_service as fs
+from services import snapshot_cache
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def _write_exports(d: Path, n: int = 500, seed: int = 31) -> None:
+    rng = np.random.default_rng(seed)
+    times = pd.date_range("2020-01-06", periods=n, freq="W")
+    shuffled = rng.permutation(n)
+    mentions = pd.DataFrame({
+        "Time": times[shuffled].strftime("%d.%m.%Y %H:%M"),
+        "Mentions": rng.integers(0, 5000, n),
+        "Trends (y)": "",
+    })
+    mentions.loc[[3, 50], "Time"] = "not a date"
+    mentions.loc[[7, 80], "Mentions"] = np.nan
+    mentions.to_csv(d / "generaldynamics.csv", index=False)
+    keep = rng.random(n) > 0.1
+    sentiment = pd.DataFrame({
+        "Time": times[keep].strftime("%d.%m.%Y %H:%M"),
+        "Positive": rng.integers(0, 100, keep.sum()),
+        "Neutral": rng.integers(0, 100, keep.sum()),
+        "Negative": rng.integers(0, 100, keep.sum()),
+    })
+    sentiment.to_csv(d / "sentiment-dynamics.csv", index=False)
+    shutil.copy(SOURCE_DIR / "tags-dynamics.csv", d / "tags-dynamics.csv")
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    # Parse the CSVs every time instead of reusing binary snapshots
+    monkeypatch.setattr(snapshot_cache, "load_frame", lambda path: None)
+    monkeypatch.setattr(snapshot_cache, "save_frame", lambda path, df: None)
+    _write_exports(tmp_path)
+    return tmp_path
+
+
+def _in_memory(d: Path) -> pd.Series:
+    return fs.compute_engagement_index(fs._parse_csv_df(d / "generaldynamics.csv"), fs._parse_csv_df(d / "sentiment-dynamics.csv"))
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 37, 100_000])
+def test_chunked_index_matches_in_memory(export_dir, chunk_rows):
+    expected = _in_memory(export_dir)
+    got = fs.compute_engagement_index_chunked(export_dir / "generaldynamics.csv", export_dir / "sentiment-dynamics.csv", chunk_rows)
+    np.testing.assert_array_equal(got.to_numpy(), expected.to_numpy())
+
+
+def test_chunked_index_without_sentiment(export_dir):
+    (export_dir / "sentiment-dynamics.csv").write_text("Date,Positive\n")
+    expected = _in_memory(export_dir)
+    got = fs.compute_engagement_index_chunked(export_dir / "generaldynamics.csv", export_dir / "sentiment-dynamics.csv", 64)
+    np.testing.assert_array_equal(got.to_numpy(), expected.to_numpy())
+
+
+def test_large_exports_skip_full_frame_load(export_dir, monkeypatch):
+    small = fs._ensure_hist_cache(export_dir, force=True)
+    assert small["mentions_df"] is not None
+
+    monkeypatch.setattr(fs, "ENGAGEMENT_CHUNKED_MIN_BYTES", 0)
+    loaded = []
+    real_load = fs._load_csv_df
+    monkeypatch.setattr(fs, "_load_csv_df", lambda path, *a: loaded.append(path.name) or real_load(path, *a))
+    large = fs._ensure_hist_cache(export_dir, force=True)
+
+    assert loaded == ["tags-dynamics.csv"]
+    assert large["mentions_df"] is None
+    np.testing.assert_array_equal(large["engagement_index"].to_numpy(), small["engagement_index"].to_numpy())
+    for as_of in ("2021-03-01", None):
+        assert large["engagement_store"].window_mean(8, as_of) == small["engagement_store"].window_mean(8, as_of)
+
+    # Rows are still served, loaded on first use
+    data = fs.get_historical_data_cached(export_dir)
+    assert len(data["mentions"]) == len(small["mentions_df"])
+    assert "generaldynamics.csv" in loaded
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 64, 100_000])
+def test_duplicate_timestamps_fan_out_like_merge(export_dir, chunk_rows):
+    path = export_dir / "sentiment-dynamics.csv"
+    sentiment = pd.read_csv(path)
+    dupes = sentiment.sample(40, random_state=1).assign(Positive=lambda d: d["Positive"] + 7)
+    pd.concat([sentiment, dupes, dupes.head(5)]).to_csv(path, index=False)
+    mentions = pd.read_csv(export_dir / "generaldynamics.csv")
+    pd.concat([mentions, mentions.sample(30, random_state=2).assign(Mentions=1)]).to_csv(
+        export_dir / "generaldynamics.csv", index=False)
+    expected = _in_memory(export_dir)
+    got = fs.compute_engagement_index_chunked(export_dir / "generaldynamics.csv", path, chunk_rows)
+    assert len(got) > 500
+    np.testing.assert_array_equal(got.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize("body", [b"Time,Positive\n01.01.2020 00:00,1\n02.01.2020 00:00,1,2,3\n", b"Time,Positive\n\xff\xfe\x00bad\n", b""])
+def test_unreadable_sentiment_export_is_an_error(export_dir, body):
+    (export_dir / "sentiment-dynamics.csv").write_bytes(body)
+    with pytest.raises(ValueError):
+        _in_memory(export_dir)
+    with pytest.raises(ValueError):
+        fs.compute_engagement_index_chunked(export_dir / "generaldynamics.csv", export_dir / "sentiment-dynamics.csv", 64)
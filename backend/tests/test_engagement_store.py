@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.engagement_store import EngagementStore
+from services.forecast_service import compute_engagement_index, mention_counts
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(26)
+    values = rng.uniform(0.1, 1.5, 60)
+    values[[5, 17, 40]] = np.nan
+    times = pd.date_range("2024-01-07", periods=60, freq="W")
+    return pd.Series(values, index=times)
+
+
+def _ewma_reference(values, span):
+    """Recursive EWMA (adjust=False) skipping NaNs, as a plain loop."""
+    alpha = 2.0 / (span + 1.0)
+    out, state = [], np.nan
+    for v in values:
+        if not np.isnan(v):
+            state = v if np.isnan(state) else (1 - alpha) * state + alpha * v
+        out.append(state)
+    return np.array(out)
+
+
+@pytest.mark.parametrize("window", [1, 4, 8, 13, 100])
+def test_window_mean_matches_tail_mean(series, window):
+    store = EngagementStore(series.values, series.index)
+    assert store.window_mean(window) == pytest.approx(float(series.tail(window).mean()), rel=1e-12)
+
+
+@pytest.mark.parametrize("as_of", ["2024-03-10", "2024-06-02", "2024-12-31"])
+def test_window_mean_as_of_matches_filtered_tail(series, as_of):
+    store = EngagementStore(series.values, series.index)
+    expected = series[series.index <= pd.Timestamp(as_of)].tail(8).mean()
+    assert store.window_mean(8, as_of) == pytest.approx(float(expected), rel=1e-12)
+    assert store.window_means(8, [as_of])[0] == pytest.approx(float(expected), rel=1e-12)
+
+
+@pytest.mark.parametrize("span", [1, 3, 8, 20])
+def test_ewma_matches_reference(series, span):
+    store = EngagementStore(series.values, series.index)
+    expected = _ewma_reference(series.values, span)
+    assert store.ewma(span) == pytest.approx(expected[-1], rel=1e-12)
+    assert store.ewma(span, "2024-05-05") == pytest.approx(expected[series.index <= "2024-05-05"][-1], rel=1e-12)
+
+
+def test_trend_delta(series):
+    store = EngagementStore(series.values, series.index)
+    expected = series.tail(8).mean() - series.iloc[-16:-8].mean()
+    assert store.trend_delta(8) == pytest.approx(float(expected), rel=1e-12)
+
+
+def test_default_baseline_matches_engine_default(series):
+    # The engine's historical baseline was engagement_index.tail(8).mean()
+    store = EngagementStore(series.values, series.index)
+    assert store.baseline() == pytest.approx(float(series.tail(8).mean()), rel=1e-12)
+
+
+def test_baseline_rejects_unknown_method_and_empty_window(series):
+    store = EngagementStore(series.values, series.index)
+    with pytest.raises(ValueError):
+        store.baseline(method="median")
+    with pytest.raises(ValueError):
+        store.baseline(as_of="2000-01-01")
+
+
+def _exports(n=40, seed=3):
+    rng = np.random.default_rng(seed)
+    times = pd.date_range("2024-01-07", periods=n, freq="W")
+    # Mentions peak late, so a whole-history normalization would leak into early cutoffs
+    mentions = pd.DataFrame({"Time": times, "Mentions": np.r_[rng.integers(50, 100, n - 5), [900, 40, 60, 80, 70]]})
+    sentiment = pd.DataFrame({
+        "Time": times,
+        "Positive": rng.integers(0, 50, n),
+        "Neutral": rng.integers(0, 50, n),
+        "Negative": rng.integers(0, 20, n),
+    })
+    return mentions, sentiment
+
+
+@pytest.mark.parametrize("as_of", ["2024-03-10", "2024-08-04", "2024-10-06"])
+def test_as_of_baselines_only_use_data_up_to_the_cutoff(as_of):
+    mentions, sentiment = _exports()
+    index = compute_engagement_index(mentions, sentiment)
+    store = EngagementStore(index.to_numpy(), mentions["Time"], mention_counts(mentions))
+
+    cut = mentions["Time"] <= pd.Timestamp(as_of)
+    past = compute_engagement_index(mentions[cut], sentiment[sentiment["Time"] <= pd.Timestamp(as_of)])
+    assert store.window_mean(8, as_of) == pytest.approx(float(past.tail(8).mean()), rel=1e-12)
+    assert store.window_means(8, [as_of])[0] == pytest.approx(float(past.tail(8).mean()), rel=1e-12)
+    assert store.ewma(4, as_of) == pytest.approx(_ewma_reference(past.to_numpy(), 4)[-1], rel=1e-12)
+    assert store.trend_delta(4, as_of) == pytest.approx(float(past.tail(4).mean() - past.iloc[-8:-4].mean()), rel=1e-12)
+    # Without a cutoff nothing changes
+    assert store.window_mean(8) == pytest.approx(float(index.tail(8).mean()), rel=1e-12)
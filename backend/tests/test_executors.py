@@ -0,0 +1,150 @@
+import asyncio
+import threading
+
+import pytest
+
+from services.executors import POOLS, BulkheadPool
+
+
+@pytest.fixture
+def pools():
+    created = []
+
+    def make(name, workers):
+        pool = BulkheadPool(name, workers)
+        created.append(pool)
+        return pool
+
+    yield make
+    for pool in created:
+        pool.shutdown(wait=True)
+
+
+def test_saturated_pool_does_not_block_another(pools):
+    llm, data = pools("llm", 2), pools("data", 2)
+    gate = threading.Event()
+
+    async def scenario():
+        stuck = [asyncio.ensure_future(llm.run(gate.wait, 5)) for _ in range(6)]
+        await asyncio.sleep(0.05)
+        stats = llm.stats()
+        assert (stats["active"], stats["queued"], stats["utilization"]) == (2, 4, 1.0)
+        # The data pool still answers while every llm worker is blocked
+        assert await asyncio.wait_for(data.run(sum, [1, 2, 3]), timeout=1) == 6
+        gate.set()
+        await asyncio.gather(*stuck)
+
+    asyncio.run(scenario())
+    stats = llm.stats()
+    assert stats["peak_queued"] == 4
+    assert (stats["submitted"], stats["completed"], stats["active"], stats["queued"]) == (6, 6, 0, 0)
+
+
+def test_failures_and_cancelled_queued_calls_are_counted(pools):
+    pool = pools("engine", 1)
+    gate = threading.Event()
+
+    def boom():
+        raise RuntimeError("boom")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await pool.run(boom)
+        running = asyncio.ensure_future(pool.run(gate.wait, 5))
+        queued = asyncio.ensure_future(pool.run(gate.wait, 5))
+        await asyncio.sleep(0.05)
+        # Cancelling the awaiting task drops the call before a worker picks it up
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        assert pool.stats()["queued"] == 0
+        gate.set()
+        await running
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+    asyncio.run(scenario())
+    stats = pool.stats()
+    assert (stats["submitted"], stats["completed"], stats["failed"], stats["cancelled"]) == (3, 2, 1, 1)
+    assert (stats["active"], stats["queued"]) == (0, 0)
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+
+    import app as app_module
+
+    with TestClient(app_module.app) as c:
+        yield c
+    app_module.app.dependency_overrides.clear()
+
+
+def test_preset_queries_run_on_the_db_pool(client):
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    import app as app_module
+    from database import Base, get_db
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    threads = []
+    event.listen(engine, "before_cursor_execute", lambda *a: threads.append(threading.current_thread().name))
+    session_factory = sessionmaker(bind=engine)
+
+    def sqlite_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app_module.app.dependency_overrides[get_db] = sqlite_db
+    config = {
+        "currentFollowers": {"Instagram": 1000}, "postsPerWeek": 10, "platformAllocation": {"Instagram": 100},
+        "contentMix": {}, "preset": "Balanced", "months": 12, "enablePaid": False, "paidFunnelBudgetWeek": 0,
+        "paidCPM": 5, "paidAllocation": {}, "enableBudget": False, "paidBudgetWeek": 0, "creatorBudgetWeek": 0,
+        "acquisitionBudgetWeek": 0, "cpfMin": 0.1, "cpfMid": 0.15, "cpfMax": 0.2, "valuePerFollower": 0.2,
+        "audienceMix": {}, "selectedPresetId": "balanced",
+    }
+    before = POOLS["db"].stats()["submitted"]
+    created = client.post("/api/user-presets/", json={"name": "Q1", "config": config}).json()
+    assert client.put(f"/api/user-presets/{created['id']}", json={"name": "Q2"}).json()["name"] == "Q2"
+    assert [p["name"] for p in client.get("/api/user-presets/").json()] == ["Q2"]
+    assert client.delete(f"/api/user-presets/{created['id']}").status_code == 200
+    assert client.get(f"/api/user-presets/{created['id']}").status_code == 404
+
+    assert POOLS["db"].stats()["submitted"] == before + 5
+    assert threads and all(name.startswith("db") for name in threads)
+
+
+def test_listening_and_llm_work_leave_the_event_loop(client, monkeypatch):
+    from routes import ai as ai_routes
+    from routes import listening as listening_routes
+
+    threads = {}
+
+    class Index:
+        def top(self, **kwargs):
+            threads["top"] = threading.current_thread().name
+            return {"tags": []}
+
+    def tag_index(data_dir):
+        threads["index"] = threading.current_thread().name
+        return Index()
+
+    def insight(req):
+        threads["llm"] = threading.current_thread().name
+        return "Post more on TikTok."
+
+    monkeypatch.setattr(listening_routes, "get_tag_index", tag_index)
+    monkeypatch.setattr(ai_routes, "generate_gap_insight", insight)
+    assert client.get("/api/tags/top").json() == {"tags": []}
+    r = client.post("/api/ai/insight", json={
+        "goal": 2e6, "projected_total": 1.5e6, "posts_per_week_total": 20,
+        "platform_allocation": {"TikTok": 100}, "months": 12, "progress_to_goal": 0.75,
+    })
+    assert r.json() == {"insight": "Post more on TikTok."}
+    assert threads["index"].startswith("data") and threads["top"].startswith("data")
+    assert threads["llm"].startswith("llm")
@@ -0,0 +1,76 @@
+import json
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+from starlette.responses import JSONResponse
+
+from services import fast_json
+from services.followers_service import encode_json
+
+
+def _payload():
+    return {
+        "labels": ["Jan 2025", "Feb 2025", "Überraschung"],
+        "series": np.array([1.5, 2.25, 1e16, 1e-5]),
+        "totals": {"Instagram": np.float64(0.1), "TikTok": np.int64(7)},
+        "matrix": np.arange(6, dtype=np.int64).reshape(2, 3),
+        "by_month": {1: 2.0, 12: None},
+        "generated": datetime(2025, 1, 2, 3, 4, 5, 6),
+        "as_of": date(2025, 1, 31),
+        "utc": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "flags": [True, False, None],
+    }
+
+
+def _plain():
+    """The payload as the stdlib encoder sees it once numpy values and dates are converted."""
+    return {
+        "labels": ["Jan 2025", "Feb 2025", "Überraschung"],
+        "series": [1.5, 2.25, 1e16, 1e-5],
+        "totals": {"Instagram": 0.1, "TikTok": 7},
+        "matrix": [[0, 1, 2], [3, 4, 5]],
+        "by_month": {1: 2.0, 12: None},
+        "generated": "2025-01-02T03:04:05.000006",
+        "as_of": "2025-01-31",
+        "utc": "2025-01-01T00:00:00+00:00",
+        "flags": [True, False, None],
+    }
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        if fast_json.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+def test_dumps_matches_json_dumps(encoder):
+    body = fast_json.dumps(_payload())
+    assert json.loads(body) == json.loads(json.dumps(_plain()))
+    assert "Überraschung".encode() in body
+
+
+def test_response_matches_json_response(encoder):
+    assert json.loads(fast_json.FastJSONResponse(_payload()).body) == json.loads(JSONResponse(_plain()).body)
+
+
+def test_non_finite_floats(encoder):
+    payload = {"a": float("nan"), "b": np.array([np.inf, 1.0])}
+    if encoder == "orjson":
+        assert json.loads(fast_json.dumps(payload)) == {"a": None, "b": [None, 1.0]}
+    else:
+        with pytest.raises(ValueError):
+            fast_json.dumps(payload)
+
+
+def test_encode_json_matches_json_response():
+    plain = _plain()
+    assert encode_json(plain) == JSONResponse(plain).body
+    with pytest.raises(ValueError):
+        encode_json({"a": float("nan")})
+    with pytest.raises(TypeError):
+        encode_json({"when": datetime(2025, 1, 1)})
@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from services.calibration import _fill_series_gaps
+
+
+def _reference_fill(series):
+    """The per-row loop _fill_series_gaps replaced (known points are taken before filling)."""
+    out = list(series)
+    known = [(i, v) for i, v in enumerate(series) if not math.isnan(v)]
+    filled = [False] * len(series)
+    if len(known) < 2:
+        if known:
+            for i in range(len(series)):
+                if i != known[0][0]:
+                    out[i], filled[i] = known[0][1], True
+        return out, filled
+    for i, v in enumerate(series):
+        if not math.isnan(v):
+            continue
+        before = [(k, kv) for k, kv in known if k < i]
+        after = [(k, kv) for k, kv in known if k > i]
+        if before and after:
+            (bi, bv), (ai, av) = before[-1], after[0]
+            out[i] = bv + (av - bv) * ((i - bi) / (ai - bi))
+        elif before:
+            (i1, v1), (i2, v2) = before[-2], before[-1]
+            out[i] = max(v2 + (v2 - v1) / (i2 - i1) * (i - i2), 0)
+        else:
+            (i1, v1), (i2, v2) = after[0], after[1]
+            out[i] = max(v1 - (v2 - v1) / (i2 - i1) * (i1 - i), 0)
+        filled[i] = True
+    return out, filled
+
+
+NAN = float("nan")
+
+
+@pytest.mark.parametrize("series", [
+    [100.0, NAN, NAN, 160.0, 170.0, NAN],
+    [NAN, NAN, 50.0, 40.0, NAN, 10.0, NAN, NAN, NAN],
+    [NAN, 5.0, NAN, NAN],
+    [1.0, 2.0, 3.0],
+    [NAN, NAN],
+    [],
+])
+def test_matches_reference_loop(series):
+    values, filled = _fill_series_gaps(np.array(series, dtype=float))
+    expected, expected_filled = _reference_fill(series)
+    np.testing.assert_allclose(values, np.array(expected, dtype=float), rtol=1e-12, equal_nan=True)
+    assert filled.tolist() == expected_filled
+
+
+def test_matches_reference_loop_on_random_gaps():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        series = np.cumsum(rng.normal(50, 80, rng.integers(1, 30))) + 1000
+        series[rng.random(len(series)) < 0.4] = np.nan
+        values, filled = _fill_series_gaps(series)
+        expected, expected_filled = _reference_fill(series.tolist())
+        np.testing.assert_allclose(values, np.array(expected, dtype=float), rtol=1e-12, equal_nan=True)
+        assert filled.tolist() == expected_filled
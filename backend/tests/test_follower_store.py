@@ -0,0 +1,72 @@
+import numpy as np
+
+from services import follower_store
+from services.calibration import DEFAULT_WORKBOOK
+from services.follower_store import READINGS_LOG, get_follower_store, readings_log_path
+
+
+def _workbook_series(path):
+    times = np.array(["2025-01-01", "2025-02-01"], dtype="datetime64[ns]")
+    return {"Instagram": (times, np.array([100.0, 110.0]))}
+
+
+def test_readings_are_kept_per_workbook(tmp_path, monkeypatch):
+    monkeypatch.setattr(follower_store, "_series_from_workbook", _workbook_series)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    wb_a, wb_b = tmp_path / "brand_a.xlsx", tmp_path / "brand_b.xlsx"
+    wb_a.write_bytes(b"a")
+    wb_b.write_bytes(b"b")
+
+    store_a = get_follower_store(data_dir, wb_a)
+    store_b = get_follower_store(data_dir, wb_b)
+    assert store_a is not store_b
+    platform = store_a.platforms[0]
+    before = len(store_b.series(platform)[0])
+    store_a.append([{"platform": platform, "timestamp": "2099-01-31", "value": 123.0}])
+
+    log_a, log_b = readings_log_path(data_dir, wb_a), readings_log_path(data_dir, wb_b)
+    assert log_a.exists() and not log_b.exists()
+    assert log_a.name.startswith("followers_readings.brand_a-") and log_a != data_dir / READINGS_LOG
+
+    # Fresh loads replay only their own workbook's log
+    follower_store._STORES.clear()
+    times_a, values_a = get_follower_store(data_dir, wb_a).series(platform)
+    assert times_a[-1] == np.datetime64("2099-01-31") and values_a[-1] == 123.0
+    assert len(get_follower_store(data_dir, wb_b).series(platform)[0]) == before
+
+
+def test_csv_base_uses_the_shared_log(tmp_path):
+    (tmp_path / follower_store.FOLLOWERS_CSV).write_text("Month,Instagram,Total\n2025-01-01,100,100\n")
+    store = get_follower_store(tmp_path, DEFAULT_WORKBOOK)
+    store.append([{"platform": "Instagram", "timestamp": "2025-02-01", "value": 110}])
+    assert (tmp_path / READINGS_LOG).exists()
+    follower_store._STORES.clear()
+    assert get_follower_store(tmp_path, None).series("Instagram")[1].tolist() == [100.0, 110.0]
+
+
+def test_readings_route_requires_token_and_a_known_source(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import app as app_module
+    from routes import forecast as forecast_routes
+
+    (tmp_path / follower_store.FOLLOWERS_CSV).write_text("Month,Instagram,Total\n2025-01-01,100,100\n")
+    monkeypatch.setattr(forecast_routes, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(follower_store, "_STORES", {})
+    monkeypatch.setenv("DATA_UPLOAD_TOKEN", "s3cret")
+    body = {"readings": [{"platform": "Instagram", "timestamp": "2025-02-01", "value": 110}]}
+    auth = {"Authorization": "Bearer s3cret"}
+    with TestClient(app_module.app) as client:
+        assert client.post("/api/followers-history/readings", json=body).status_code == 401
+        assert not (tmp_path / READINGS_LOG).exists()
+
+        for sheet_path in ("/etc/passwd", str(tmp_path / ".." / "elsewhere.xlsx")):
+            r = client.post("/api/followers-history/readings", params={"sheet_path": sheet_path}, json=body, headers=auth)
+            assert r.status_code == 400
+            assert client.get("/api/followers-history/series", params={"sheet_path": sheet_path}).status_code == 400
+        assert follower_store._STORES == {}
+
+        r = client.post("/api/followers-history/readings", json=body, headers=auth)
+        assert r.status_code == 201 and r.json()["appended"] == 1
+        assert (tmp_path / READINGS_LOG).exists()
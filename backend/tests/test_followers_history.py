@@ -0,0 +1,112 @@
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import JSONResponse
+
+import app as app_module
+from routes import forecast as forecast_routes
+from services import followers_service
+from services.followers_service import FOLLOWERS_CSV, build_csv_payload, encode_json, get_followers_history
+
+SOURCE_CSV = Path(__file__).resolve().parent.parent / "data" / FOLLOWERS_CSV
+
+
+def _reference_payload(csv_path):
+    """The previous row-by-row parser, which only extrapolated a 'Sep 2025' tail."""
+    df = pd.read_csv(csv_path)
+    data_rows, labels = [], []
+    platforms = ['Instagram', 'TikTok', 'Facebook', 'YouTube']
+    for _, row in df.iterrows():
+        month_str = row['Month']
+        try:
+            label = pd.to_datetime(month_str).strftime('%b %Y')
+        except Exception:
+            label = str(month_str)
+        labels.append(label)
+        data_rows.append({
+            "label": label,
+            **{p: float(row.get(p, 0)) for p in platforms},
+            "Total": float(row.get('Total', 0)),
+        })
+    if len(data_rows) >= 2 and labels[-1] == 'Sep 2025':
+        recent_growth = {}
+        for p in platforms:
+            if len(data_rows) >= 3:
+                g1 = data_rows[-1][p] - data_rows[-2][p]
+                g2 = data_rows[-2][p] - data_rows[-3][p]
+                recent_growth[p] = (g1 + g2) / 2
+            else:
+                recent_growth[p] = data_rows[-1][p] - data_rows[-2][p]
+        last_row = data_rows[-1]
+        for i, month_label in enumerate(['Oct 2025', 'Nov 2025', 'Dec 2025'], 1):
+            projected = {"label": month_label}
+            total = 0.0
+            for p in platforms:
+                val = last_row[p] + (recent_growth[p] * i)
+                projected[p] = float(val)
+                projected[f'{p}_interpolated'] = True
+                total += val
+            projected['Total'] = float(total)
+            projected['Total_interpolated'] = True
+            labels.append(month_label)
+            data_rows.append(projected)
+    return {"labels": labels, "data": data_rows}
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(followers_service, "_CACHE", {})
+    return tmp_path
+
+
+def test_bundled_csv_matches_row_parser():
+    assert encode_json(build_csv_payload(SOURCE_CSV)) == encode_json(_reference_payload(SOURCE_CSV))
+
+
+@pytest.mark.parametrize("csv", [
+    # Two rows: extrapolates from the last step only
+    "Month,Instagram,TikTok,Facebook,YouTube,Total\n2025-08-31,10,20,30,40,100\n2025-09-30,12.5,21,33,40,106.5\n",
+    # Missing platform columns and an unparseable month label
+    "Month,Instagram,TikTok,Total\nQ2 total,1,2,3\n2025-08-31,10,20,30\n2025-09-30,15,18,33\n",
+    # Tail outside September: nothing to compare against the old branch, but rows must match
+    "Month,Instagram,TikTok,Facebook,YouTube,Total\n2024-12-31,1,2,3,4,10\n",
+])
+def test_shaped_csvs_match_row_parser(data_dir, csv):
+    path = data_dir / FOLLOWERS_CSV
+    path.write_text(csv)
+    assert encode_json(build_csv_payload(path)) == encode_json(_reference_payload(path))
+
+
+def test_encoding_matches_json_response():
+    payload = _reference_payload(SOURCE_CSV)
+    assert encode_json(payload) == JSONResponse(payload).body
+
+
+def test_cache_is_reused_until_the_file_changes(data_dir):
+    shutil.copy(SOURCE_CSV, data_dir / FOLLOWERS_CSV)
+    first = get_followers_history(data_dir)
+    assert get_followers_history(data_dir) is first
+
+    path = data_dir / FOLLOWERS_CSV
+    path.write_text(path.read_text() + "2025-10-31,370000,553000,569000,372000,1864000\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = get_followers_history(data_dir)
+    assert second["version"] != first["version"]
+    assert second["payload"]["labels"][-3:] == ["Oct 2025", "Nov 2025", "Dec 2025"]
+    assert "Instagram_interpolated" not in second["payload"]["data"][-3]
+
+
+def test_route_serves_cached_bytes_with_etag(data_dir, monkeypatch):
+    shutil.copy(SOURCE_CSV, data_dir / FOLLOWERS_CSV)
+    monkeypatch.setattr(forecast_routes, "DATA_DIR", data_dir)
+    with TestClient(app_module.app) as client:
+        r = client.get("/api/followers-history")
+        assert r.status_code == 200
+        assert r.content == encode_json(_reference_payload(SOURCE_CSV))
+        etag = r.headers["ETag"]
+        assert client.get("/api/followers-history", headers={"If-None-Match": etag}).status_code == 304
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from services.forecast_service import (
+    BASE_MONTHLY_RATE,
+    CONTENT_MULT,
+    PER_POST_GAIN_BASE,
+    PLATFORM_MONTHLY_CAP,
+    forecast_growth,
+    forecast_growth_batch,
+)
+
+FOLLOWERS = {"Instagram": 12000, "TikTok": 3000, "YouTube": 800, "Facebook": 5000}
+MIX = {p: {"Short Video": 60, "Image": 40} for p in FOLLOWERS}
+CALIBRATED_MULT = {p: {k: v * 1.1 for k, v in mults.items()} for p, mults in CONTENT_MULT.items()}
+
+SCENARIOS = [
+    dict(current_followers=FOLLOWERS, posts_per_week_total=5,
+         platform_allocation={"Instagram": 40, "TikTok": 40, "YouTube": 10, "Facebook": 10},
+         content_mix_by_platform=MIX, months=12),
+    # Over the hard cadence cap, with paid and budget-based acquisition
+    dict(current_followers=FOLLOWERS, posts_per_week_total=60,
+         platform_allocation={"Instagram": 70, "TikTok": 30},
+         content_mix_by_platform=MIX, months=6, campaign_lift=0.2, sensitivity=0.8,
+         paid_impressions_per_week_total=50000, paid_allocation={"Instagram": 100},
+         paid_budget_per_week_total=500, creator_budget_per_week_total=200,
+         acquisition_budget_per_week_total=100, month_decay_per_month=0.02),
+    # Calibration overrides from another profile, a fixed baseline and no posts
+    dict(current_followers={"Instagram": 0, "TikTok": 100}, posts_per_week_total=0,
+         platform_allocation={"TikTok": 100}, content_mix_by_platform={}, months=3,
+         base_monthly_rate={p: v * 1.5 for p, v in BASE_MONTHLY_RATE.items()},
+         platform_monthly_cap={p: v * 0.8 for p, v in PLATFORM_MONTHLY_CAP.items()},
+         per_post_gain_base={p: v * 2 for p, v in PER_POST_GAIN_BASE.items()},
+         content_mult=CALIBRATED_MULT, baseline_engagement=0.7),
+]
+
+
+def test_batch_matches_per_scenario_forecasts():
+    series = pd.Series(np.linspace(0.2, 0.9, 20))
+    frames = forecast_growth_batch(SCENARIOS, series)
+    assert len(frames) == len(SCENARIOS)
+    for kwargs, frame in zip(SCENARIOS, frames):
+        expected = forecast_growth(engagement_index_series=series, **kwargs)
+        pdt.assert_frame_equal(frame, expected, check_dtype=False, rtol=1e-9, atol=1e-9)
+
+
+def test_empty_engagement_series_falls_back_like_the_scalar_engine():
+    empty = pd.Series([], dtype=float)
+    frame = forecast_growth_batch(SCENARIOS[:1], empty)[0]
+    pdt.assert_frame_equal(frame, forecast_growth(engagement_index_series=empty, **SCENARIOS[0]),
+                           check_dtype=False, rtol=1e-9, atol=1e-9)
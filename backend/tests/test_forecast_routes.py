@@ -0,0 +1,48 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+FORECAST = {
+    "current_followers": {"Instagram": 1000, "TikTok": 500},
+    "posts_per_week_total": 5,
+    "platform_allocation": {"Instagram": 50, "TikTok": 50},
+    "content_mix_by_platform": {"Instagram": {"Short Video": 100}, "TikTok": {"Short Video": 100}},
+    "preset": "Balanced",
+    "months": 6,
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+def test_forecast_ok(client):
+    r = client.post("/api/forecast", json=FORECAST)
+    assert r.status_code == 200
+    assert len(r.json()["monthly_data"]) == 6
+
+
+def test_unknown_baseline_method_is_rejected(client):
+    assert client.post("/api/forecast", json={**FORECAST, "baseline_method": "median"}).status_code == 422
+
+
+def test_empty_baseline_window_is_a_client_error(client):
+    r = client.post("/api/forecast", json={**FORECAST, "baseline_as_of": "1990-01-01"})
+    assert r.status_code == 400
+
+
+def test_invalid_preset_is_a_client_error(client):
+    assert client.post("/api/forecast", json={**FORECAST, "preset": "Nope"}).status_code == 400
+
+
+def test_engagement_stats(client):
+    r = client.get("/api/historical/engagement", params={"window": 8})
+    assert r.status_code == 200
+    assert set(r.json()) == {"as_of", "window", "mean", "trend_delta", "ewma"}
+    cutoffs = ["2025-03-01", "2025-06-01"]
+    many = client.get("/api/historical/engagement", params={"window": 8, "as_of": cutoffs}).json()
+    one = client.get("/api/historical/engagement", params={"window": 8, "as_of": cutoffs[0]}).json()
+    assert many["as_of"] == cutoffs and many["mean"][0] == pytest.approx(one["mean"])
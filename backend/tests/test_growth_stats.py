@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import follower_store
+from services.follower_store import get_follower_store
+from services.growth_stats import (
+    compound_monthly_rate,
+    mom_growth,
+    rolling_trend,
+    rolling_volatility,
+    series_stats,
+)
+
+
+def _series(seed: int, n: int = 14):
+    rng = np.random.default_rng(seed)
+    values = 1000 + np.cumsum(rng.normal(20, 15, n))
+    times = pd.date_range("2024-01-31", periods=n, freq="ME").to_numpy()
+    return times, values
+
+
+def _rolling_slope(values: pd.Series, window: int) -> np.ndarray:
+    return values.rolling(window).apply(lambda w: np.polyfit(np.arange(window), w, 1)[0], raw=True).dropna().to_numpy()
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("window", [2, 3, 6])
+def test_series_stats_match_pandas(seed, window):
+    times, values = _series(seed)
+    s = pd.Series(values, index=times)
+    mom = s.pct_change().iloc[1:]
+
+    stats = series_stats(times, values, window)
+    np.testing.assert_allclose(stats["mom_growth"]["values"], mom.to_numpy())
+    np.testing.assert_allclose(stats["volatility"]["values"], mom.rolling(window).std().dropna().to_numpy())
+    np.testing.assert_allclose(stats["trend"]["values"], _rolling_slope(s, window), rtol=1e-9)
+    assert stats["avg_mom"] == pytest.approx(mom.iloc[-window:].mean())
+    assert stats["latest_mom"] == pytest.approx(mom.iloc[-1])
+    assert stats["volatility"]["dates"][0] == str(mom.rolling(window).std().dropna().index[0].date())
+
+    elapsed = len(values) - 1
+    assert stats["monthly_compound_rate"] == pytest.approx((values[-1] / values[0]) ** (1 / elapsed) - 1)
+    assert stats["cagr"] == pytest.approx((values[-1] / values[0]) ** (12 / elapsed) - 1)
+
+
+def test_helpers_handle_short_and_non_positive_series():
+    assert np.isnan(mom_growth([0.0, 5.0])[0])
+    assert rolling_volatility([0.1], 3).size == 0 and rolling_trend([1.0, 2.0], 3).size == 0
+    assert compound_monthly_rate(0, 10, 3) == 0.0 and compound_monthly_rate(10, 20, 0) == 0.0
+    np.testing.assert_allclose(
+        compound_monthly_rate(np.array([100.0, 0.0, 50.0]), np.array([121.0, 5.0, 50.0]), np.array([2.0, 2.0, 0.0])),
+        [0.1, 0.0, 0.0],
+    )
+    stats = series_stats(np.array(["2025-01-31"], dtype="datetime64[ns]"), np.array([10.0]))
+    assert stats == {"months": 1, "start": {"date": "2025-01-31", "value": 10.0}, "end": {"date": "2025-01-31", "value": 10.0}}
+
+
+def test_store_stats_are_memoized_per_revision(tmp_path, monkeypatch):
+    monkeypatch.setattr(follower_store, "_STORES", {})
+    (tmp_path / follower_store.FOLLOWERS_CSV).write_text(
+        "Month,Instagram,Total\n2025-01-31,100,100\n2025-02-28,110,110\n2025-03-31,121,121\n"
+    )
+    store = get_follower_store(tmp_path)
+    first = store.growth_stats(window=2)
+    assert store.growth_stats(window=2) is first
+    assert first["platforms"]["Instagram"]["monthly_compound_rate"] == pytest.approx(0.1)
+
+    store.append([{"platform": "Instagram", "timestamp": "2025-04-30", "value": 133.1}])
+    second = store.growth_stats(window=2)
+    assert second is not first and second["platforms"]["Instagram"]["months"] == 4
+    assert second["platforms"]["Instagram"]["monthly_compound_rate"] == pytest.approx(0.1)
+
+
+def test_stats_route(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import app as app_module
+    from routes import forecast as forecast_routes
+
+    monkeypatch.setattr(follower_store, "_STORES", {})
+    monkeypatch.setattr(forecast_routes, "DATA_DIR", tmp_path)
+    times, values = _series(0)
+    csv = "Month,Instagram,TikTok\n" + "".join(
+        f"{str(t)[:10]},{v},{v * 2}\n" for t, v in zip(times, values)
+    )
+    (tmp_path / follower_store.FOLLOWERS_CSV).write_text(csv)
+    with TestClient(app_module.app) as client:
+        r = client.get("/api/followers-history/stats", params={"platforms": "Instagram", "window": 4, "from": "2024-03-01"})
+        assert r.status_code == 200
+        body = r.json()
+        assert list(body["platforms"]) == ["Instagram"] and body["window"] == 4
+        # Monthly resampling labels each reading with its month
+        expected = series_stats(times[2:].astype("datetime64[M]"), values[2:], 4)
+        assert body["platforms"]["Instagram"]["cagr"] == pytest.approx(expected["cagr"])
+        assert body["platforms"]["Instagram"]["volatility"]["dates"] == expected["volatility"]["dates"]
+        assert client.get("/api/followers-history/stats", params={"window": 1}).status_code == 422
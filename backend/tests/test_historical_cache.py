@@ -0,0 +1,86 @@
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from services import forecast_service as fs
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    for name in ("generaldynamics.csv", "sentiment-dynamics.csv", "tags-dynamics.csv"):
+        shutil.copy(SOURCE_DIR / name, tmp_path / name)
+    monkeypatch.setattr(fs, "_HIST_CACHE", {**fs._HIST_CACHE, "dir": None, "engagement_index": None})
+    return tmp_path
+
+
+def _counting_loads(monkeypatch, delay=0.0, gate=None):
+    """Count (and optionally slow down or block) engagement index builds."""
+    calls = []
+    real = fs.compute_engagement_index
+
+    def compute(*args):
+        calls.append(threading.get_ident())
+        if gate is not None:
+            gate.wait(5)
+        time.sleep(delay)
+        return real(*args)
+
+    monkeypatch.setattr(fs, "compute_engagement_index", compute)
+    return calls
+
+
+def _touch(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_cached_data_matches_the_uncached_loader(data_dir):
+    cached, direct = fs.get_historical_data_cached(data_dir), fs.load_historical_data(data_dir)
+    for key in ("mentions", "sentiment", "tags"):
+        pdt.assert_frame_equal(pd.DataFrame(cached[key]), pd.DataFrame(direct[key]))
+    assert cached["engagement_index"] == direct["engagement_index"]
+
+
+def test_cold_cache_loads_once_for_concurrent_callers(data_dir, monkeypatch):
+    calls = _counting_loads(monkeypatch, delay=0.2)
+    with ThreadPoolExecutor(8) as pool:
+        snaps = list(pool.map(lambda _: fs._ensure_hist_cache(data_dir), range(8)))
+    assert len(calls) == 1
+    assert all(s is snaps[0] for s in snaps)
+
+
+def test_stale_snapshot_is_served_while_one_caller_reloads(data_dir, monkeypatch):
+    old = fs._ensure_hist_cache(data_dir)
+    gate = threading.Event()
+    calls = _counting_loads(monkeypatch, gate=gate)
+    _touch(data_dir / "generaldynamics.csv")
+
+    with ThreadPoolExecutor(4) as pool:
+        reloading = pool.submit(fs._ensure_hist_cache, data_dir)
+        while not calls:
+            time.sleep(0.01)
+        # Everyone else gets the previous snapshot without waiting for the reload
+        others = [pool.submit(fs._ensure_hist_cache, data_dir) for _ in range(3)]
+        assert all(f.result(timeout=2) is old for f in others)
+        gate.set()
+        new = reloading.result(timeout=10)
+
+    assert len(calls) == 1 and new is not old
+    assert new["version"] != old["version"]
+    assert fs._ensure_hist_cache(data_dir) is new
+
+
+def test_forced_reload_waits_and_publishes(data_dir, monkeypatch):
+    old = fs._ensure_hist_cache(data_dir)
+    calls = _counting_loads(monkeypatch)
+    fs.reload_historical_data(data_dir)
+    assert len(calls) == 1 and fs._ensure_hist_cache(data_dir) is not old
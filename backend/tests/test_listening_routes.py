@@ -0,0 +1,27 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app_module.app) as c:
+        yield c
+
+
+@pytest.mark.parametrize("path, variants", [
+    ("/api/topics/wordcloud", [{"limit": 5}, {"limit": 6}, {"limit": 5, "kind": "hashtag"}]),
+    ("/api/topics/chart", [{"limit": 5}, {"limit": 6}, {"limit": 5, "category": "objects"}]),
+])
+def test_etag_depends_on_query_parameters(client, path, variants):
+    etags = []
+    for params in variants:
+        r = client.get(path, params=params)
+        assert r.status_code == 200
+        etags.append(r.headers["etag"])
+        # Same parameters revalidate; a different parameter set never does
+        assert client.get(path, params=params, headers={"If-None-Match": r.headers["etag"]}).status_code == 304
+    assert len(set(etags)) == len(etags)
+    other = client.get(path, params=variants[1], headers={"If-None-Match": etags[0]})
+    assert other.status_code == 200
@@ -0,0 +1,88 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import platform_metrics
+from services.platform_metrics import PlatformMetrics, get_platform_metrics, views_per_post_from_metrics
+
+PLATFORMS = ["Instagram", "TikTok", "YouTube"]
+MONTHS = [f"M{i}" for i in range(9)]
+
+
+def _raw(seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+
+    def series(low, high):
+        out = {}
+        for p in PLATFORMS:
+            vals = rng.uniform(low, high, len(MONTHS)).round(2).tolist()
+            for i in rng.choice(len(MONTHS), 3, replace=False):
+                vals[i] = None
+            out[p] = vals
+        return out
+
+    raw = {"months": MONTHS, "posts": series(0, 40), "engagement": series(0.5, 8), "views": series(1e3, 5e5)}
+    raw["posts"]["Instagram"][1] = 0
+    # Short series: the missing months are nulls
+    raw["views"]["YouTube"] = raw["views"]["YouTube"][:6]
+    return raw
+
+
+def _frames(raw: dict) -> dict:
+    return {
+        k: pd.DataFrame({p: pd.Series(raw[k][p], dtype=float).reindex(range(len(MONTHS))) for p in PLATFORMS})
+        for k in ("posts", "engagement", "views")
+    }
+
+
+def _lists(df: pd.DataFrame) -> dict:
+    return {p: [None if pd.isna(v) else float(v) for v in df[p]] for p in PLATFORMS}
+
+
+def _assert_lists_close(actual: dict, expected: dict):
+    assert list(actual) == list(expected)
+    for p in expected:
+        assert [v is None for v in actual[p]] == [v is None for v in expected[p]], p
+        np.testing.assert_allclose([v for v in actual[p] if v is not None], [v for v in expected[p] if v is not None])
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("window", [1, 3])
+def test_derived_metrics_match_pandas(seed, window):
+    raw = _raw(seed)
+    f = _frames(raw)
+    vpp = f["views"] / f["posts"].where(f["posts"] > 0)
+    engagements = f["views"] * f["engagement"] / 100.0
+    derived = PlatformMetrics(raw, "v1").derived(window)
+
+    _assert_lists_close(derived["metrics"]["views_per_post"], _lists(vpp))
+    _assert_lists_close(derived["metrics"]["engagements_per_post"], _lists(engagements / f["posts"].where(f["posts"] > 0)))
+    _assert_lists_close(derived["rolling_mean"]["views"], _lists(f["views"].rolling(window, min_periods=1).mean()))
+    _assert_lists_close(derived["mom_delta"]["posts"], _lists(f["posts"].diff()))
+    prev = vpp.shift(1)
+    _assert_lists_close(derived["mom_pct"]["views_per_post"], _lists(vpp.diff() / prev.where(prev > 0)))
+
+    both = vpp.notna()
+    expected_avg = (f["views"].where(both).sum() / f["posts"].where(both).sum()).to_dict()
+    assert PlatformMetrics(raw).average_views_per_post() == pytest.approx(expected_avg)
+    assert derived["summary"]["TikTok"]["months_reported"] == int(both["TikTok"].sum())
+
+
+def test_metrics_are_cached_per_file_version(tmp_path):
+    path = tmp_path / platform_metrics.METRICS_FILE
+    path.write_text(json.dumps(_raw(0)))
+    first = get_platform_metrics(path)
+    assert get_platform_metrics(path) is first
+    assert first.derived(3) is first.derived(3)
+
+    raw = _raw(1)
+    path.write_text(json.dumps(raw))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = get_platform_metrics(path)
+    assert second is not first and second.version != first.version
+    assert views_per_post_from_metrics(path) == second.average_views_per_post()
+    assert views_per_post_from_metrics(tmp_path / "missing.json") == {}
@@ -0,0 +1,186 @@
+"""SheetIndex-based calibration extractors against the row scans they replaced."""
+import random
+from typing import Dict, List, Optional
+
+import pytest
+
+from services import calibration as cal
+from services.calibration import PLATFORM_MAP, SheetIndex, _to_float
+
+BRANDS = ('Barbie', 'Strawberry Shortcake', 'Peanuts', 'Hello Kitty', 'Squishmallows', 'CreativeInc')
+
+
+def scan_historical_mom(rows: List[List[str]]) -> Dict[str, float]:
+    result: Dict[str, float] = {}
+    for r in rows:
+        if not r:
+            continue
+        label = str(r[0]).strip()
+        if label in PLATFORM_MAP:
+            candidates = [v for v in (_to_float(c) for c in r[1:]) if v is not None and 0 < v < 0.2]
+            if candidates:
+                result[PLATFORM_MAP[label]] = max(candidates)
+    return result
+
+
+def scan_projected_mom(rows: List[List[str]]) -> Dict[str, float]:
+    proj_idx = None
+    for r in rows[:5]:
+        if any('Projected Growth' in str(c) for c in r):
+            proj_idx = next((i for i, c in enumerate(r) if 'Projected Growth' in str(c)), None)
+            break
+    result: Dict[str, float] = {}
+    for r in rows:
+        if not r:
+            continue
+        label = str(r[0]).strip()
+        if label in ('TikTok', 'Instagram', 'Facebook', 'YouTube'):
+            if proj_idx is not None and proj_idx < len(r):
+                v = _to_float(r[proj_idx])
+                if v is not None and 0 < v < 0.3:
+                    result[label] = v
+            else:
+                nums = [v for v in (_to_float(c) for c in r[1:]) if v is not None and 0 < v < 0.3]
+                if nums:
+                    result[label] = max(nums)
+    return result
+
+
+def scan_followers_per_view(rows: List[List[str]]) -> Optional[float]:
+    for r in rows:
+        if len(r) == 1:
+            v = _to_float(r[0])
+            if v is not None and 0 < v < 0.05:
+                return v
+    for r in rows:
+        if r and str(r[0]).strip().upper() == 'TOTAL':
+            nums = [v for v in (_to_float(c) for c in r[1:]) if v is not None and v > 0]
+            if len(nums) >= 2:
+                views, followers = max(nums), min(nums)
+                if views > 0:
+                    return followers / views
+    return None
+
+
+def scan_carebears_views_per_post(rows: List[List[str]]) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    active = False
+    for r in rows:
+        if not r:
+            continue
+        if not active and any('Care Bears' in str(c) for c in r):
+            active = True
+            continue
+        if active:
+            label = str(r[0]).strip()
+            if label in BRANDS:
+                break
+            posts = _to_float(r[1]) if len(r) > 1 else None
+            views = _to_float(r[2]) if len(r) > 2 else None
+            if posts and views and posts > 0:
+                if label.startswith('IG Reels'):
+                    out['Instagram'] = views / posts
+                elif label.startswith('FB Reels'):
+                    out['Facebook'] = views / posts
+                elif label.startswith('TT') or label.startswith('TikTok'):
+                    out['TikTok'] = views / posts
+                elif label.startswith('YT') or label.startswith('YouTube'):
+                    out['YouTube'] = views / posts
+    return out
+
+
+def scan_cpf_overrides(rows: List[List[str]]) -> Dict[str, Dict[str, float]]:
+    paid: List[float] = []
+    creator: List[float] = []
+    table = 0
+    for r in rows:
+        if not r:
+            continue
+        if r[0] == 'Channel' and 'Est CPV' in r:
+            table = 2
+            continue
+        if r[0] == 'Channel' and 'Est CPT' in r:
+            table = 1
+            continue
+        if str(r[0]).strip() == 'TOTAL':
+            nums = [v for v in (_to_float(c) for c in r) if v is not None]
+            if nums and table in (1, 2):
+                paid.append(nums[-1])
+        if str(r[0]).strip() == 'Creators':
+            nums = [v for v in (_to_float(c) for c in r) if v is not None]
+            if nums:
+                creator.append(nums[-1])
+
+    def mid(vals, default):
+        return sum(vals) / len(vals) if vals else default
+
+    return {
+        'cpf_paid': {'min': 3.0, 'mid': mid(paid, 5.0), 'max': 6.0},
+        'cpf_creator': {'min': 10.0, 'mid': mid(creator, 12.5), 'max': 20.0},
+    }
+
+
+EXTRACTORS = [
+    (cal._extract_historical_mom, scan_historical_mom),
+    (cal._extract_projected_mom, scan_projected_mom),
+    (cal._extract_followers_per_view, scan_followers_per_view),
+    (cal._extract_carebears_views_per_post, scan_carebears_views_per_post),
+    (cal._extract_cpf_overrides, scan_cpf_overrides),
+]
+
+LABELS = (
+    list(PLATFORM_MAP) + [' Instagram', 'TikTok ', 'TOTAL', 'total', ' TOTAL', 'Creators', 'Channel', ' Channel',
+                          'IG Reels', 'FB Reels 2024', 'TT', 'YT Shorts', 'Care Bears', 'Care Bears 2025'] + list(BRANDS)
+    + ['Followers', 'Notes', '', 'x']
+)
+CELLS = ['', '0.05', '0.15', '0.25', '0.0004', '1,200', '35000', '-0.1', 'n/a', 'Est CPT', 'Est CPV',
+         'Projected Growth', 'Projected Growth %', 'Care Bears', '4.5', '12']
+
+
+def _random_sheet(rng: random.Random) -> List[List[str]]:
+    rows = []
+    for _ in range(rng.randint(0, 40)):
+        width = rng.choice([0, 1, 1, 2, 3, 4, 6])
+        if width == 0:
+            rows.append([])
+            continue
+        first = rng.choice(LABELS + CELLS)
+        rows.append([first] + [rng.choice(CELLS) for _ in range(width - 1)])
+    return rows
+
+
+@pytest.mark.parametrize("extract,scan", EXTRACTORS, ids=[s.__name__ for _, s in EXTRACTORS])
+def test_extractors_match_row_scans_on_random_sheets(extract, scan):
+    rng = random.Random(39)
+    for _ in range(2000):
+        rows = _random_sheet(rng)
+        assert extract(SheetIndex(rows)) == scan(rows), rows
+
+
+def test_extractors_on_a_shaped_sheet():
+    rows = [
+        ['Platform', 'Start', 'End', 'Projected Growth'],
+        ['Instagram', '1000', '1200', '0.04'],
+        ['TikTok', '500', '900', '0.5'],
+        [],
+        ['Care Bears'],
+        ['IG Reels', '10', '50000'],
+        ['TT', '4', '8000'],
+        ['Barbie'],
+        ['YT', '2', '900'],
+        ['Channel', 'Est CPT', 'Cost Per Follow'],
+        ['TOTAL', '100', '4.2'],
+        ['Creators', '9', '11.5'],
+        ['0.003'],
+    ]
+    for extract, scan in EXTRACTORS:
+        assert extract(SheetIndex(rows)) == scan(rows)
+    assert cal._extract_carebears_views_per_post(SheetIndex(rows)) == {'Instagram': 5000.0, 'TikTok': 2000.0}
+
+
+def test_sheet_index_lookups():
+    rows = [['A', 'x'], [], [' A ', 'y', 'x'], ['b']]
+    idx = SheetIndex(rows)
+    assert idx.label_rows('A') == [0, 2] and idx.label_rows('B', upper=True) == [3]
+    assert idx.find('x') == [(0, 1), (2, 2)] and idx.find_containing(' A') == [(2, 0)]
+    assert idx.rows_with_width(0) == [1] and idx.cell(2, 1) == 'y' and idx.cell(9, 9) == ''
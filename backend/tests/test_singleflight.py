@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from services.singleflight import SingleFlight, request_key
+
+
+def test_request_key_ignores_dict_order():
+    assert request_key({"a": 1, "b": [1, 2]}, "x") == request_key({"b": [1, 2], "a": 1}, "x")
+    assert request_key({"a": 1}) != request_key({"a": 2})
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    group = SingleFlight("test")
+    calls = []
+
+    async def compute(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        return {"value": value}
+
+    async def scenario():
+        results = await asyncio.gather(
+            *[group.do("k", lambda: compute(1)) for _ in range(5)],
+            group.do("other", lambda: compute(2)),
+        )
+        # Nothing is cached once the computation finished
+        again = await group.do("k", lambda: compute(3))
+        return results, again
+
+    results, again = asyncio.run(scenario())
+    assert calls == [1, 2, 3]
+    assert all(r is results[0] for r in results[:5]) and results[5] == {"value": 2}
+    assert again == {"value": 3}
+    assert group.stats() == {"in_flight": 0, "executions": 3, "coalesced": 4, "failed": 0, "peak_waiters": 5}
+
+
+def test_waiters_share_the_exception():
+    group = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.02)
+        raise ValueError("bad input")
+
+    async def scenario():
+        return await asyncio.gather(*[group.do("k", fail) for _ in range(3)], return_exceptions=True)
+
+    errors = asyncio.run(scenario())
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert group.stats()["failed"] == 1 and group.stats()["in_flight"] == 0
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_computation():
+    group = SingleFlight("test")
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def scenario():
+        leader = asyncio.ensure_future(group.do("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("k", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == 42
+    assert group.stats()["executions"] == 1 and group.stats()["in_flight"] == 0
@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+import pandas.testing as pdt
+import pytest
+
+from services import snapshot_cache
+from services.forecast_service import _load_csv_df, _parse_csv_df
+
+CSV = 'Time,Mentions,Label\n"02.01.2025 00:00",10,a\n01.01.2025 00:00,12,\n03.01.2025 00:00,,c\n'
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "generaldynamics.csv"
+    path.write_text(CSV)
+    return path
+
+
+def _snapshot_dirs(path, kind="frame"):
+    root = snapshot_cache._root(path)
+    return sorted(d.name for d in root.glob(f"{path.name}.{kind}.*") if d.is_dir()) if root.exists() else []
+
+
+def test_snapshots_stay_out_of_the_source_directory(source, snapshot_dir):
+    _load_csv_df(source)
+    assert not (source.parent / snapshot_cache.SNAPSHOT_DIRNAME).exists()
+    assert snapshot_cache._root(source).parent == snapshot_dir
+
+
+def test_frame_snapshot_round_trips(source):
+    parsed = _load_csv_df(source)
+    assert len(_snapshot_dirs(source)) == 1
+    loaded = snapshot_cache.load_frame(source)
+    assert loaded is not None and isinstance(loaded["Mentions"].to_numpy().base, np.memmap)
+    pdt.assert_frame_equal(_load_csv_df(source), parsed, check_index_type=False)
+
+
+def test_changed_source_is_reparsed_and_stale_snapshot_pruned(source):
+    first = _load_csv_df(source)
+    old = _snapshot_dirs(source)
+    source.write_text(CSV + "04.01.2025 00:00,20,d\n")
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert snapshot_cache.load_frame(source) is None
+    second = _load_csv_df(source)
+    assert len(second) == len(first) + 1
+    pdt.assert_frame_equal(second, _parse_csv_df(source))
+    new = _snapshot_dirs(source)
+    assert len(new) == 1 and new != old
+    pdt.assert_frame_equal(snapshot_cache.load_frame(source), second, check_index_type=False)
+
+
+def test_corrupt_snapshot_falls_back_to_parsing(source):
+    parsed = _load_csv_df(source)
+    (snapshot_cache._root(source) / _snapshot_dirs(source)[0] / "meta.json").write_text("{")
+    assert snapshot_cache.load_frame(source) is None
+    pdt.assert_frame_equal(_load_csv_df(source), parsed)
+
+
+def test_sheet_snapshots_are_per_sheet_and_invalidated(source):
+    rows = [["a", "b", "c"], ["1"], []]
+    snapshot_cache.save_sheet(source, "Sheet 1", rows)
+    assert snapshot_cache.load_sheet(source, "Sheet 1") == rows
+    assert snapshot_cache.load_sheet(source, "Sheet 2") is None
+    source.write_text(CSV * 2)
+    assert snapshot_cache.load_sheet(source, "Sheet 1") is None
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.forecast_service import _parse_csv_df
+from services.tag_analytics import TagIndex
+
+TAGS_CSV = Path(__file__).resolve().parent.parent / "data" / "tags-dynamics.csv"
+
+
+def _reference_top(df, k, start=None, end=None, points=4):
+    """Filter-and-sum over the frame, the computation the prefix sums replace."""
+    df = df.sort_values("Time", kind="stable").reset_index(drop=True)
+    tags = [c for c in df.columns if c != "Time"]
+    if start is None and end is None:
+        j = len(df)
+        i = max(j - points, 0)
+    else:
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df["Time"] >= pd.Timestamp(start)
+        if end is not None:
+            mask &= df["Time"] < pd.Timestamp(end) + pd.Timedelta(days=1)
+        rows = df.index[mask]
+        i, j = (int(rows[0]), int(rows[-1]) + 1) if len(rows) else (0, 0)
+    cur = df.iloc[i:j][tags].sum()
+    prev_rows = df.iloc[max(i - (j - i), 0):i]
+    prev = prev_rows[tags].sum()
+    total = float(cur.sum())
+    scale = (j - i) / len(prev_rows) if len(prev_rows) else 0.0
+    ranked = sorted(tags, key=lambda t: -cur[t])[:k]
+    return [
+        {
+            "tag": t,
+            "total": float(cur[t]),
+            "share": float(cur[t]) / total if total > 0 else 0.0,
+            "previous_total": float(prev[t]),
+            "momentum": (float(cur[t]) - prev[t] * scale) / (prev[t] * scale) if prev[t] * scale > 0 else None,
+        }
+        for t in ranked
+    ]
+
+
+@pytest.fixture(scope="module")
+def tags_df():
+    return _parse_csv_df(TAGS_CSV)
+
+
+@pytest.fixture
+def synthetic():
+    rng = np.random.default_rng(29)
+    times = pd.date_range("2024-01-01", periods=30, freq="W").to_numpy()
+    rng.shuffle(times)
+    data = {"Time": times}
+    for i in range(12):
+        data[f"tag{i}"] = rng.integers(0, 100, 30).astype(float)
+    return pd.DataFrame(data)
+
+
+def _assert_same(actual, expected):
+    assert [t["tag"] for t in actual["tags"]] == [t["tag"] for t in expected]
+    for a, e in zip(actual["tags"], expected):
+        assert a["total"] == pytest.approx(e["total"])
+        assert a["share"] == pytest.approx(e["share"])
+        assert a["previous_total"] == pytest.approx(e["previous_total"])
+        assert (a["momentum"] is None) == (e["momentum"] is None)
+        if e["momentum"] is not None:
+            assert a["momentum"] == pytest.approx(e["momentum"])
+
+
+@pytest.mark.parametrize("window", [
+    {},
+    {"points": 1},
+    {"points": 500},
+    {"start": "2024-03-01", "end": "2024-05-05"},
+    {"start": "2024-02-01"},
+    {"end": "2024-02-11"},
+])
+def test_synthetic_windows_match_filter_and_sum(synthetic, window):
+    index = TagIndex(synthetic)
+    k = 5
+    _assert_same(index.top(k, **window), _reference_top(synthetic, k, **{"points": 4, **window}))
+
+
+def test_real_export_matches_filter_and_sum(tags_df):
+    index = TagIndex(tags_df)
+    first, last = tags_df["Time"].min(), tags_df["Time"].max()
+    mid = first + (last - first) / 2
+    for window in ({}, {"start": mid.date()}, {"start": first.date(), "end": mid.date()}):
+        expected = _reference_top(tags_df, 10, **{"points": 4, **window})
+        _assert_same(index.top(10, **window), expected)
+
+
+def test_empty_window_and_missing_times():
+    df = pd.DataFrame({"Time": pd.to_datetime(["2024-01-01", "2024-01-08"]), "a": [1.0, 2.0]})
+    result = TagIndex(df).top(3, start="2030-01-01")
+    assert result["window_total"] == 0.0 and result["window"]["points"] == 0
+    with pytest.raises(ValueError):
+        TagIndex(df.drop(columns=["Time"])).top(3, start="2024-01-01")
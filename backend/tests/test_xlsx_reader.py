@@ -0,0 +1,131 @@
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List
+
+import openpyxl
+import pytest
+
+from services.calibration import XlsxWorkbook, _xlsx_parse_rows
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+NS_R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+
+def _baseline_read_rows(xlsx_path: Path) -> Dict[str, List[List[str]]]:
+    """The DOM-based reader the streaming parser replaced, kept as the parity reference."""
+    def col_index(col: str) -> int:
+        result = 0
+        for char in col.upper():
+            result = result * 26 + (ord(char) - ord('A') + 1)
+        return result - 1
+
+    with zipfile.ZipFile(xlsx_path) as z:
+        wb = ET.fromstring(z.read('xl/workbook.xml'))
+        rels = ET.fromstring(z.read('xl/_rels/workbook.xml.rels'))
+        rid_to_target = {rel.attrib.get('Id'): rel.attrib.get('Target') for rel in rels}
+        shared: List[str] = []
+        if 'xl/sharedStrings.xml' in z.namelist():
+            for si in ET.fromstring(z.read('xl/sharedStrings.xml')):
+                shared.append(''.join(t.text or '' for t in si.iter(f'{{{NS_MAIN}}}t')))
+
+        def text(c) -> str:
+            v = c.find(f'{{{NS_MAIN}}}v')
+            if v is None:
+                is_ = c.find(f'{{{NS_MAIN}}}is')
+                return ''.join(t.text or '' for t in is_.iter(f'{{{NS_MAIN}}}t')) if is_ is not None else ''
+            val = v.text or ''
+            if c.attrib.get('t') == 's':
+                idx = int(val)
+                return shared[idx] if 0 <= idx < len(shared) else val
+            return val
+
+        out: Dict[str, List[List[str]]] = {}
+        for sh in wb.find(f'{{{NS_MAIN}}}sheets'):
+            target = rid_to_target.get(sh.attrib.get(f'{{{NS_R}}}id'))
+            path = 'xl/' + target if target and not target.startswith('xl/') else (target or '')
+            rows: List[List[str]] = []
+            data = ET.fromstring(z.read(path)).find(f'{{{NS_MAIN}}}sheetData')
+            for row in (data if data is not None else []):
+                cells = list(row)
+                if not cells:
+                    rows.append([])
+                    continue
+                cols = [col_index(''.join(ch for ch in c.attrib.get('r', '') if ch.isalpha())) for c in cells]
+                row_data = [''] * (max(cols) + 1)
+                for c, i in zip(cells, cols):
+                    row_data[i] = text(c)
+                rows.append(row_data)
+            out[sh.attrib.get('name')] = rows
+        return out
+
+
+def _relative_targets(src: Path, dst: Path) -> None:
+    """openpyxl writes absolute part targets (/xl/...), which the baseline reader could not resolve."""
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(dst, 'w', zipfile.ZIP_DEFLATED) as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == 'xl/_rels/workbook.xml.rels':
+                data = data.replace(b'Target="/xl/', b'Target="')
+            zout.writestr(item, data)
+
+
+SHEETS = {
+    "Historical": [
+        ["Platform", "Jan", "Feb", "Mar"],
+        ["IG", 0.031, 0.029, None],
+        [],
+        ["TT", "4.5%", 0.07, 1200],
+        [None, None, None, None, "far right"],
+    ],
+    "Projected Growth": [[f"r{i}", i, i * 1.5, "x" * (i % 4)] for i in range(300)],
+    "Notes": [["Ünïcödé ✓", "a & b < c"], ["IG", "IG"]],
+}
+
+
+@pytest.fixture(scope="module")
+def workbooks(tmp_path_factory):
+    d = tmp_path_factory.mktemp("xlsx")
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for name, rows in SHEETS.items():
+        ws = wb.create_sheet(name)
+        for r in rows:
+            ws.append(r)
+    absolute = d / "absolute.xlsx"
+    wb.save(absolute)
+    relative = d / "relative.xlsx"
+    _relative_targets(absolute, relative)
+    return absolute, relative
+
+
+def test_streaming_reader_matches_baseline(workbooks):
+    absolute, relative = workbooks
+    expected = _baseline_read_rows(relative)
+    assert _xlsx_parse_rows(relative) == expected
+    # Absolute part targets resolve to the same rows
+    assert _xlsx_parse_rows(absolute) == expected
+
+
+def test_streaming_reader_matches_baseline_on_youscan_export(tmp_path):
+    path = REPO_ROOT / "YouScan_Authors_Care_Bears_02122024-02122025_ac903.xlsx"
+    if not path.exists():
+        pytest.skip("YouScan sample export not present")
+    relative = tmp_path / "youscan.xlsx"
+    _relative_targets(path, relative)
+    assert _xlsx_parse_rows(path) == _baseline_read_rows(relative)
+
+
+def test_lazy_workbook_parses_only_requested_sheets(workbooks):
+    _, relative = workbooks
+    expected = _baseline_read_rows(relative)
+    wb = XlsxWorkbook(relative, use_snapshots=False)
+    assert wb.sheet_names == list(SHEETS)
+    assert wb.rows("Notes") == expected["Notes"]
+    assert set(wb._rows) == {"Notes"}
+    # Only the shared strings referenced by the parsed sheet are decoded
+    assert set(wb._strings.values()) <= {"Ünïcödé ✓", "a & b < c", "IG"}
+    assert wb["Historical"] == expected["Historical"]
+    assert wb.get("Missing") is None and wb.rows("Missing") == []
+    assert wb["Projected Growth"] == expected["Projected Growth"]